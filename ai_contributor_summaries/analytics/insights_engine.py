@@ -2,57 +2,209 @@
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Tuple
+from scipy import sparse
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
-from collections import Counter, defaultdict
+from functools import cached_property, wraps
+import heapq
 import logging
+from operator import itemgetter
+
+try:
+    import polars as pl
+except ImportError:  # polars is optional; the pandas pipeline is used without it
+    pl = None
+
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow is optional; list columns stay as Python objects without it
+    pa = None
 
 logger = logging.getLogger(__name__)
 
 
+def _is_arrow_list(values: pd.Series) -> bool:
+    """Whether a Series is backed by an Arrow list array."""
+    return isinstance(values.dtype, pd.ArrowDtype) and pa.types.is_list(values.dtype.pyarrow_dtype)
+
+
+def _to_arrow_lists(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """Store list-of-string columns as Arrow lists; non-list cells become missing."""
+    if pa is None:
+        return df
+    for column in columns:
+        if column not in df:
+            continue
+        cells = [value if isinstance(value, list) else None for value in df[column]]
+        try:
+            arrow_values = pa.array(cells, type=pa.list_(pa.string()))
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            logger.debug(f"Keeping {column} as Python lists: cells are not all lists of strings")
+            continue
+        df[column] = pd.arrays.ArrowExtensionArray(arrow_values)
+    return df
+
+
+def _list_column(df: pd.DataFrame, column: str) -> pd.Series:
+    """Return the list-valued cells of a column, skipping missing or malformed entries."""
+    if column not in df:
+        return pd.Series([], dtype=object)
+    values = df[column]
+    if _is_arrow_list(values):
+        return values[values.notna()]
+    return values[values.map(lambda value: isinstance(value, list))]
+
+
+def _list_lengths(values: pd.Series) -> pd.Series:
+    """Number of elements in each list cell."""
+    if _is_arrow_list(values):
+        return values.list.len()
+    return values.map(len)
+
+
+def _numeric_column(df: pd.DataFrame, column: str) -> np.ndarray:
+    """Return a numeric column as an array, treating a missing column or cell as zero."""
+    if column not in df:
+        return np.zeros(len(df), dtype=np.int64)
+    return df[column].fillna(0).to_numpy()
+
+
+def _downcast(df: pd.DataFrame, dtypes: Dict[str, str]) -> pd.DataFrame:
+    """Cast integer count columns to narrower types, leaving absent or non-integer columns untouched."""
+    casts = {
+        column: dtype for column, dtype in dtypes.items()
+        if column in df and pd.api.types.is_integer_dtype(df[column])
+    }
+    return df.astype(casts) if casts else df
+
+
+def _categorize(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """Store repeated string key columns as categoricals so groupbys work on integer codes."""
+    casts = {
+        column: 'category' for column in columns
+        if column in df and (pd.api.types.is_object_dtype(df[column]) or pd.api.types.is_string_dtype(df[column]))
+    }
+    return df.astype(casts) if casts else df
+
+
+def _top_items(counts: pd.Series, n: int) -> List[Tuple[Any, int]]:
+    """Convert the first ``n`` entries of a value_counts Series to (value, count) pairs."""
+    head = counts.head(n)
+    return list(zip(head.index.tolist(), head.tolist()))
+
+
+def _cached_analysis(method):
+    """Memoize an analysis method's result on the engine instance."""
+    @wraps(method)
+    def wrapper(self):
+        if method.__name__ not in self._analysis_cache:
+            self._analysis_cache[method.__name__] = method(self)
+        return self._analysis_cache[method.__name__]
+    return wrapper
+
+
 class InsightsEngine:
     """Generate advanced insights from contributor data."""
     
-    def __init__(self, contributors: List[Dict], repo_works: List[Dict]):
-        """Initialize with contributor and repository work data."""
+    def __init__(self, contributors: List[Dict], repo_works: List[Dict], use_polars: bool = True):
+        """Initialize with contributor and repository work data.
+        
+        Repository aggregations run on Polars when ``use_polars`` is set and polars is installed.
+        """
         self.contributors = contributors
         self.repo_works = repo_works
-        self.contributor_df = pd.DataFrame(contributors) if contributors else pd.DataFrame()
-        self.repo_work_df = pd.DataFrame(repo_works) if repo_works else pd.DataFrame()
+        self.use_polars = use_polars and pl is not None
+        self._analysis_cache: Dict[str, Dict[str, Any]] = {}
+    
+    @cached_property
+    def contributor_df(self) -> pd.DataFrame:
+        """Contributor records as a DataFrame, built on first access."""
+        if not self.contributors:
+            return pd.DataFrame()
+        df = _downcast(
+            pd.DataFrame.from_records(self.contributors),
+            {'total_commits': 'int32', 'total_issues': 'int32', 'repositories_count': 'int16'}
+        )
+        df = _to_arrow_lists(df, ['skills', 'primary_languages', 'expertise_areas'])
+        return _categorize(df, ['username', 'activity_level', 'contribution_style'])
+    
+    @cached_property
+    def repo_work_df(self) -> pd.DataFrame:
+        """Repository work records as a DataFrame, built on first access."""
+        if not self.repo_works:
+            return pd.DataFrame()
+        df = _downcast(
+            pd.DataFrame.from_records(self.repo_works),
+            {'commit_count': 'int32', 'issue_count': 'int32'}
+        )
+        df = _to_arrow_lists(df, ['technologies'])
+        return _categorize(df, ['repository_name', 'contributor_id', 'contribution_type'])
+    
+    @cached_property
+    def technology_long_df(self) -> pd.DataFrame:
+        """One row per (contributor, repository, technology), built once and shared by analyses.
+        
+        Rows whose technology list is empty keep a missing technology so the repository still counts.
+        """
+        tech_rows = self.repo_work_df.loc[_list_column(self.repo_work_df, 'technologies').index]
+        return tech_rows[['contributor_id', 'repository_name', 'technologies']].explode('technologies')
+    
+    @cached_property
+    def _contributors_by_username(self) -> pd.DataFrame:
+        """Contributor rows indexed by username for per-contributor lookups."""
+        if 'username' not in self.contributor_df:
+            return pd.DataFrame(index=pd.Index([], name='username'))
+        return self.contributor_df.set_index('username', drop=False)
+    
+    @cached_property
+    def _work_by_contributor(self) -> pd.DataFrame:
+        """Repository work rows indexed and sorted by contributor id, preserving row order per contributor."""
+        if 'contributor_id' not in self.repo_work_df:
+            return pd.DataFrame(index=pd.Index([], name='contributor_id'))
+        return self.repo_work_df.set_index('contributor_id', drop=False).sort_index(kind='stable')
     
     def generate_comprehensive_insights(self) -> Dict[str, Any]:
         """Generate comprehensive insights across all dimensions."""
+        skill_analysis = self.analyze_skill_distribution()
+        collaboration_patterns = self.analyze_collaboration_patterns()
+        technology_trends = self.analyze_technology_trends()
         insights = {
             'overview': self.get_overview_metrics(),
-            'skill_analysis': self.analyze_skill_distribution(),
+            'skill_analysis': skill_analysis,
             'repository_insights': self.analyze_repository_patterns(),
             'contributor_segments': self.segment_contributors(),
-            'collaboration_patterns': self.analyze_collaboration_patterns(),
-            'technology_trends': self.analyze_technology_trends(),
+            'collaboration_patterns': collaboration_patterns,
+            'technology_trends': technology_trends,
             'productivity_metrics': self.calculate_productivity_metrics(),
-            'recommendations': self.generate_recommendations()
+            'recommendations': self.generate_recommendations(
+                skill_analysis=skill_analysis,
+                tech_trends=technology_trends,
+                collab_patterns=collaboration_patterns
+            )
         }
         return insights
     
+    @_cached_analysis
     def get_overview_metrics(self) -> Dict[str, Any]:
         """Get high-level overview metrics."""
         if self.contributor_df.empty:
             return {}
         
-        total_commits = self.contributor_df['total_commits'].sum()
-        total_issues = self.contributor_df['total_issues'].sum()
-        avg_repos_per_contributor = self.contributor_df['repositories_count'].mean()
+        totals = self.contributor_df.agg({
+            'total_commits': 'sum',
+            'total_issues': 'sum',
+            'repositories_count': 'mean'
+        })
+        total_commits = totals['total_commits']
+        total_issues = totals['total_issues']
+        avg_repos_per_contributor = totals['repositories_count']
         
         # Activity level distribution
         activity_dist = self.contributor_df['activity_level'].value_counts().to_dict()
         
         # Top programming languages
-        all_languages = []
-        for langs in self.contributor_df['primary_languages'].dropna():
-            if isinstance(langs, list):
-                all_languages.extend(langs)
-        
-        top_languages = Counter(all_languages).most_common(10)
+        lang_counts = _list_column(self.contributor_df, 'primary_languages').explode().dropna().value_counts()
+        top_languages = _top_items(lang_counts, 10)
         
         return {
             'total_contributors': len(self.contributor_df),
@@ -65,33 +217,28 @@ class InsightsEngine:
             'issues_per_contributor': round(total_issues / len(self.contributor_df), 2)
         }
     
+    @_cached_analysis
     def analyze_skill_distribution(self) -> Dict[str, Any]:
         """Analyze skill distribution across contributors."""
         if self.contributor_df.empty:
             return {}
         
         # Extract all skills
-        all_skills = []
-        skill_by_contributor = {}
-        
-        for _, contributor in self.contributor_df.iterrows():
-            username = contributor['username']
-            skills = contributor.get('skills', [])
-            if isinstance(skills, list):
-                all_skills.extend(skills)
-                skill_by_contributor[username] = len(skills)
+        skills_col = _list_column(self.contributor_df, 'skills')
+        skill_by_contributor = _list_lengths(skills_col)
         
         # Skill frequency analysis
-        skill_counts = Counter(all_skills)
-        top_skills = skill_counts.most_common(15)
+        skill_counts = skills_col.explode().dropna().value_counts()
+        top_skills = _top_items(skill_counts, 15)
+        total_skills = int(skill_counts.sum())
         
         # Skill diversity metrics
-        avg_skills_per_contributor = np.mean(list(skill_by_contributor.values()))
-        skill_diversity_index = len(skill_counts) / len(all_skills) if all_skills else 0
+        avg_skills_per_contributor = skill_by_contributor.mean()
+        skill_diversity_index = len(skill_counts) / total_skills if total_skills else 0
         
         # Rare skills (appeared in less than 20% of contributors)
         rare_threshold = len(self.contributor_df) * 0.2
-        rare_skills = [skill for skill, count in skill_counts.items() if count < rare_threshold]
+        rare_skills = skill_counts.index[skill_counts < rare_threshold].tolist()
         
         return {
             'total_unique_skills': len(skill_counts),
@@ -99,81 +246,105 @@ class InsightsEngine:
             'avg_skills_per_contributor': round(avg_skills_per_contributor, 2),
             'skill_diversity_index': round(skill_diversity_index, 3),
             'rare_skills': rare_skills[:10],  # Top 10 rare skills
-            'skill_distribution': dict(skill_counts)
+            'skill_distribution': skill_counts.to_dict()
         }
     
+    @_cached_analysis
     def analyze_repository_patterns(self) -> Dict[str, Any]:
         """Analyze repository contribution patterns."""
-        if self.repo_work_df.empty:
+        if not self.repo_works:
             return {}
         
-        # Repository activity analysis
-        repo_activity = self.repo_work_df.groupby('repository_name').agg({
-            'commit_count': 'sum',
-            'issue_count': 'sum',
-            'contributor_id': 'count'
-        }).rename(columns={'contributor_id': 'contributor_count'})
+        # Repository activity and technology diversity
+        if self.use_polars:
+            repo_activity, repo_diversity = self._repository_aggregates_polars()
+        else:
+            repo_activity, repo_diversity = self._repository_aggregates_pandas()
         
         # Most active repositories
-        most_active_repos = repo_activity.sort_values('commit_count', ascending=False).head(10)
+        most_active_repos = repo_activity.nlargest(10, 'commit_count')
         
         # Repository diversity
-        avg_contributors_per_repo = repo_activity['contributor_count'].mean()
-        
-        # Technology analysis by repository
-        repo_tech_analysis = defaultdict(set)
-        for _, work in self.repo_work_df.iterrows():
-            repo_name = work['repository_name']
-            technologies = work.get('technologies', [])
-            if isinstance(technologies, list):
-                repo_tech_analysis[repo_name].update(technologies)
+        activity_distribution = repo_activity.agg(['mean', 'min', 'max']).to_dict()
+        avg_contributors_per_repo = activity_distribution['contributor_count']['mean']
         
         # Most diverse repositories (by technology count)
-        repo_diversity = {repo: len(techs) for repo, techs in repo_tech_analysis.items()}
-        most_diverse_repos = sorted(repo_diversity.items(), key=lambda x: x[1], reverse=True)[:10]
+        most_diverse_repos = list(repo_diversity.nlargest(10).items())
         
         return {
             'total_repositories': len(repo_activity),
             'most_active_repositories': most_active_repos.to_dict('index'),
             'avg_contributors_per_repo': round(avg_contributors_per_repo, 2),
             'most_diverse_repositories': most_diverse_repos,
-            'repository_activity_distribution': repo_activity.describe().to_dict()
+            'repository_activity_distribution': activity_distribution
         }
     
+    def _repository_aggregates_pandas(self) -> Tuple[pd.DataFrame, pd.Series]:
+        """Per-repository activity totals and distinct technology counts, computed with pandas."""
+        repo_activity = self.repo_work_df.groupby('repository_name', observed=True).agg({
+            'commit_count': 'sum',
+            'issue_count': 'sum',
+            'contributor_id': 'count'
+        }).rename(columns={'contributor_id': 'contributor_count'})
+        
+        repo_diversity = self.technology_long_df.groupby('repository_name', observed=True)['technologies'].nunique()
+        return repo_activity, repo_diversity
+    
+    def _repository_aggregates_polars(self) -> Tuple[pd.DataFrame, pd.Series]:
+        """Polars equivalent of ``_repository_aggregates_pandas``."""
+        lf = pl.LazyFrame(self.repo_works, infer_schema_length=None).filter(
+            pl.col('repository_name').is_not_null()
+        )
+        repo_activity = lf.group_by('repository_name').agg(
+            pl.col('commit_count').sum(),
+            pl.col('issue_count').sum(),
+            pl.col('contributor_id').count().alias('contributor_count')
+        ).sort('repository_name').collect()
+        repo_activity = pd.DataFrame(repo_activity.to_dict(as_series=False)).set_index('repository_name')
+        
+        if 'technologies' not in lf.collect_schema().names():
+            return repo_activity, pd.Series(dtype='int64')
+        repo_diversity = lf.filter(pl.col('technologies').is_not_null()).group_by('repository_name').agg(
+            pl.col('technologies').explode().drop_nulls().n_unique().alias('technology_count')
+        ).sort('repository_name').collect()
+        return repo_activity, pd.Series(
+            repo_diversity['technology_count'].to_list(),
+            index=repo_diversity['repository_name'].to_list(),
+            dtype='int64'
+        )
+    
+    @_cached_analysis
     def segment_contributors(self) -> Dict[str, Any]:
         """Segment contributors based on activity and expertise."""
         if self.contributor_df.empty:
             return {}
         
         # Create segments based on commits and repository count
-        segments = {}
-        
-        for _, contributor in self.contributor_df.iterrows():
-            commits = contributor.get('total_commits', 0)
-            repos = contributor.get('repositories_count', 0)
-            username = contributor['username']
-            
-            # Define segments
-            if commits >= 100 and repos >= 3:
-                segment = 'power_user'
-            elif commits >= 50 and repos >= 2:
-                segment = 'active_contributor'
-            elif commits >= 20 or repos >= 1:
-                segment = 'regular_contributor'
-            else:
-                segment = 'occasional_contributor'
-            
-            if segment not in segments:
-                segments[segment] = []
-            segments[segment].append(username)
+        commits = _numeric_column(self.contributor_df, 'total_commits')
+        repos = _numeric_column(self.contributor_df, 'repositories_count')
+        
+        # Define segments
+        segment_labels = np.select(
+            [
+                (commits >= 100) & (repos >= 3),
+                (commits >= 50) & (repos >= 2),
+                (commits >= 20) | (repos >= 1)
+            ],
+            ['power_user', 'active_contributor', 'regular_contributor'],
+            default='occasional_contributor'
+        )
+        usernames = pd.Series(self.contributor_df['username'].to_numpy(dtype=object))
+        segments = usernames.groupby(segment_labels, sort=False).agg(list).to_dict()
         
         # Segment statistics
+        segment_counts = pd.Series(segment_labels).value_counts(sort=False)
+        segment_shares = (segment_counts / len(self.contributor_df) * 100).round(2)
         segment_stats = {
             segment: {
-                'count': len(contributors),
-                'percentage': round(len(contributors) / len(self.contributor_df) * 100, 2)
+                'count': int(segment_counts[segment]),
+                'percentage': float(segment_shares[segment])
             }
-            for segment, contributors in segments.items()
+            for segment in segments
         }
         
         return {
@@ -187,83 +358,74 @@ class InsightsEngine:
             }
         }
     
+    @_cached_analysis
     def analyze_collaboration_patterns(self) -> Dict[str, Any]:
         """Analyze collaboration patterns between contributors."""
         if self.repo_work_df.empty:
             return {}
         
         # Find contributors who worked on the same repositories
-        collaboration_matrix = defaultdict(set)
-        repo_contributors = defaultdict(set)
-        
-        for _, work in self.repo_work_df.iterrows():
-            repo_name = work['repository_name']
-            contributor = work['contributor_id']
-            repo_contributors[repo_name].add(contributor)
-        
-        # Calculate collaboration score
-        collaborations = defaultdict(int)
-        for repo, contributors in repo_contributors.items():
-            contributor_list = list(contributors)
-            for i in range(len(contributor_list)):
-                for j in range(i + 1, len(contributor_list)):
-                    pair = tuple(sorted([contributor_list[i], contributor_list[j]]))
-                    collaborations[pair] += 1
+        repo_sizes = self.repo_work_df.groupby('repository_name', observed=True)['contributor_id'].nunique()
+        
+        # Calculate collaboration score from the contributor x repository co-occurrence matrix.
+        # Contributor codes follow sorted ids, so upper-triangle pairs are already ordered.
+        memberships = self.repo_work_df[['contributor_id', 'repository_name']].dropna().drop_duplicates()
+        contributor_codes, contributor_ids = pd.factorize(memberships['contributor_id'], sort=True)
+        repo_codes, repo_names = pd.factorize(memberships['repository_name'])
+        membership_matrix = sparse.csr_matrix(
+            (np.ones(len(memberships), dtype=np.int32), (contributor_codes, repo_codes)),
+            shape=(len(contributor_ids), len(repo_names))
+        )
+        shared_repos = sparse.triu(membership_matrix @ membership_matrix.T, k=1).tocoo()
         
         # Most frequent collaborations
-        top_collaborations = sorted(collaborations.items(), key=lambda x: x[1], reverse=True)[:10]
+        top_pairs = np.argsort(-shared_repos.data, kind='stable')[:10]
+        top_collaborations = [
+            ((contributor_ids[shared_repos.row[k]], contributor_ids[shared_repos.col[k]]), int(shared_repos.data[k]))
+            for k in top_pairs
+        ]
         
         # Repository with most collaboration
-        repo_collaboration_scores = {
-            repo: len(contributors) * (len(contributors) - 1) // 2
-            for repo, contributors in repo_contributors.items()
-        }
-        most_collaborative_repos = sorted(repo_collaboration_scores.items(), key=lambda x: x[1], reverse=True)[:5]
+        repo_collaboration_scores = repo_sizes * (repo_sizes - 1) // 2
+        most_collaborative_repos = list(repo_collaboration_scores.nlargest(5).items())
         
         return {
-            'total_collaborations': len(collaborations),
+            'total_collaborations': int(shared_repos.nnz),
             'top_collaborations': top_collaborations,
             'most_collaborative_repositories': most_collaborative_repos,
-            'avg_collaborators_per_repo': round(np.mean([len(c) for c in repo_contributors.values()]), 2)
+            'avg_collaborators_per_repo': round(repo_sizes.mean(), 2)
         }
     
+    @_cached_analysis
     def analyze_technology_trends(self) -> Dict[str, Any]:
         """Analyze technology usage trends."""
         if self.repo_work_df.empty:
             return {}
         
-        # Extract all technologies
-        all_technologies = []
-        tech_by_repo = defaultdict(set)
-        
-        for _, work in self.repo_work_df.iterrows():
-            repo_name = work['repository_name']
-            technologies = work.get('technologies', [])
-            if isinstance(technologies, list):
-                all_technologies.extend(technologies)
-                tech_by_repo[repo_name].update(technologies)
+        exploded = self.technology_long_df
         
         # Technology popularity
-        tech_counts = Counter(all_technologies)
-        popular_technologies = tech_counts.most_common(15)
+        tech_counts = exploded['technologies'].value_counts()
+        popular_technologies = _top_items(tech_counts, 15)
         
         # Technology diversity by repository
-        tech_diversity = {repo: len(techs) for repo, techs in tech_by_repo.items()}
-        avg_tech_per_repo = np.mean(list(tech_diversity.values())) if tech_diversity else 0
+        tech_diversity = exploded.groupby('repository_name', observed=True)['technologies'].nunique()
+        avg_tech_per_repo = tech_diversity.mean() if not tech_diversity.empty else 0
         
         # Emerging technologies (less common but present)
-        total_repos = len(tech_by_repo)
+        total_repos = len(tech_diversity)
         emerging_threshold = max(1, total_repos * 0.1)  # Present in less than 10% of repos
-        emerging_techs = [tech for tech, count in tech_counts.items() if count <= emerging_threshold]
+        emerging_techs = tech_counts.index[tech_counts <= emerging_threshold].tolist()
         
         return {
             'total_technologies': len(tech_counts),
             'popular_technologies': popular_technologies,
             'emerging_technologies': emerging_techs[:10],
             'avg_technologies_per_repo': round(avg_tech_per_repo, 2),
-            'technology_adoption_rate': dict(tech_counts)
+            'technology_adoption_rate': tech_counts.to_dict()
         }
     
+    @_cached_analysis
     def calculate_productivity_metrics(self) -> Dict[str, Any]:
         """Calculate productivity metrics for contributors."""
         if self.contributor_df.empty or self.repo_work_df.empty:
@@ -272,11 +434,10 @@ class InsightsEngine:
         # Commits per repository
         contributor_productivity = []
         
-        for _, contributor in self.contributor_df.iterrows():
-            username = contributor['username']
-            total_commits = contributor.get('total_commits', 0)
-            total_repos = contributor.get('repositories_count', 0)
-            
+        productivity_columns = self.contributor_df.reindex(
+            columns=['username', 'total_commits', 'repositories_count'], fill_value=0
+        )
+        for username, total_commits, total_repos in productivity_columns.itertuples(index=False, name=None):
             if total_repos > 0:
                 commits_per_repo = total_commits / total_repos
                 contributor_productivity.append({
@@ -286,25 +447,35 @@ class InsightsEngine:
                     'total_repos': total_repos
                 })
         
-        # Sort by productivity
-        contributor_productivity.sort(key=lambda x: x['commits_per_repo'], reverse=True)
-        
         # Calculate percentiles
-        productivity_values = [cp['commits_per_repo'] for cp in contributor_productivity]
+        productivity_values = np.fromiter(
+            (cp['commits_per_repo'] for cp in contributor_productivity),
+            dtype=np.float64,
+            count=len(contributor_productivity)
+        )
+        p25, p50, p75, p90 = np.quantile(productivity_values, [0.25, 0.5, 0.75, 0.9])
         
         return {
-            'top_productive_contributors': contributor_productivity[:10],
-            'avg_commits_per_repo': round(np.mean(productivity_values), 2),
+            'top_productive_contributors': heapq.nlargest(10, contributor_productivity, key=itemgetter('commits_per_repo')),
+            'avg_commits_per_repo': round(productivity_values.mean(), 2),
             'productivity_percentiles': {
-                '90th': round(np.percentile(productivity_values, 90), 2),
-                '75th': round(np.percentile(productivity_values, 75), 2),
-                '50th': round(np.percentile(productivity_values, 50), 2),
-                '25th': round(np.percentile(productivity_values, 25), 2)
+                '90th': round(p90, 2),
+                '75th': round(p75, 2),
+                '50th': round(p50, 2),
+                '25th': round(p25, 2)
             }
         }
     
-    def generate_recommendations(self) -> Dict[str, List[str]]:
-        """Generate actionable recommendations."""
+    def generate_recommendations(
+        self,
+        skill_analysis: Optional[Dict[str, Any]] = None,
+        tech_trends: Optional[Dict[str, Any]] = None,
+        collab_patterns: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, List[str]]:
+        """Generate actionable recommendations.
+        
+        Previously computed analyses can be passed in to avoid recomputing them.
+        """
         recommendations = {
             'team_composition': [],
             'skill_development': [],
@@ -316,7 +487,8 @@ class InsightsEngine:
             return recommendations
         
         # Team composition recommendations
-        skill_analysis = self.analyze_skill_distribution()
+        if skill_analysis is None:
+            skill_analysis = self.analyze_skill_distribution()
         if skill_analysis:
             top_skills = [skill for skill, _ in skill_analysis.get('top_skills', [])]
             rare_skills = skill_analysis.get('rare_skills', [])
@@ -328,7 +500,8 @@ class InsightsEngine:
             ])
         
         # Skill development recommendations
-        tech_trends = self.analyze_technology_trends()
+        if tech_trends is None:
+            tech_trends = self.analyze_technology_trends()
         if tech_trends:
             emerging_techs = tech_trends.get('emerging_technologies', [])
             recommendations['skill_development'].extend([
@@ -338,7 +511,8 @@ class InsightsEngine:
             ])
         
         # Process improvement recommendations
-        collab_patterns = self.analyze_collaboration_patterns()
+        if collab_patterns is None:
+            collab_patterns = self.analyze_collaboration_patterns()
         if collab_patterns:
             recommendations['process_improvement'].extend([
                 "Implement code review processes to increase collaboration",
@@ -359,14 +533,16 @@ class InsightsEngine:
     
     def generate_contributor_report(self, username: str) -> Dict[str, Any]:
         """Generate detailed report for a specific contributor."""
-        contributor = self.contributor_df[self.contributor_df['username'] == username]
-        if contributor.empty:
+        if username not in self._contributors_by_username.index:
             return {}
         
-        contributor_data = contributor.iloc[0].to_dict()
+        contributor_data = self._contributors_by_username.loc[[username]].iloc[0].to_dict()
         
         # Get repository work for this contributor
-        contributor_work = self.repo_work_df[self.repo_work_df['contributor_id'] == username]
+        if username in self._work_by_contributor.index:
+            contributor_work = self._work_by_contributor.loc[[username]]
+        else:
+            contributor_work = self._work_by_contributor.iloc[0:0]
         
         # Calculate metrics
         total_commits = contributor_data.get('total_commits', 0)
@@ -374,14 +550,19 @@ class InsightsEngine:
         total_repos = contributor_data.get('repositories_count', 0)
         
         # Repository breakdown
+        breakdown_columns = contributor_work.reindex(
+            columns=['repository_name', 'commit_count', 'issue_count', 'technologies', 'contribution_type']
+        )
         repo_breakdown = []
-        for _, work in contributor_work.iterrows():
+        for repo_name, commits, issues, technologies, contribution_type in breakdown_columns.itertuples(
+            index=False, name=None
+        ):
             repo_breakdown.append({
-                'repository': work['repository_name'],
-                'commits': work.get('commit_count', 0),
-                'issues': work.get('issue_count', 0),
-                'technologies': work.get('technologies', []),
-                'contribution_type': work.get('contribution_type', 'unknown')
+                'repository': repo_name,
+                'commits': 0 if pd.isna(commits) else commits,
+                'issues': 0 if pd.isna(issues) else issues,
+                'technologies': technologies if isinstance(technologies, list) else [],
+                'contribution_type': contribution_type if isinstance(contribution_type, str) else 'unknown'
             })
         
         # Skill assessment
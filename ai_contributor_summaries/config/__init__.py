@@ -1,5 +1,5 @@
 """Configuration package for AI Contributor Summaries."""
 
-from .settings import settings
+from .settings import get_settings, settings
 
-__all__ = ["settings"]
\ No newline at end of file
+__all__ = ["get_settings", "settings"]
\ No newline at end of file
@@ -1,47 +1,57 @@
 """Configuration settings for AI Contributor Summaries application."""
 
 import os
+from functools import lru_cache
 from typing import Optional
-from pydantic_settings import BaseSettings
-from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
     
     # Application
-    app_name: str = Field(default="AI Contributor Summaries", env="APP_NAME")
-    app_version: str = Field(default="1.0.0", env="APP_VERSION")
-    debug: bool = Field(default=False, env="DEBUG")
-    log_level: str = Field(default="INFO", env="LOG_LEVEL")
+    app_name: str = "AI Contributor Summaries"
+    app_version: str = "1.0.0"
+    debug: bool = False
+    log_level: str = "INFO"
     
     # Mode Configuration
-    use_mock_weaviate: bool = Field(default=False, env="USE_MOCK_WEAVIATE")
+    use_mock_weaviate: bool = False
     
     # Weaviate
-    weaviate_url: str = Field(default="http://localhost:8080", env="WEAVIATE_URL")
-    weaviate_api_key: Optional[str] = Field(default=None, env="WEAVIATE_API_KEY")
+    weaviate_url: str = "http://localhost:8080"
+    weaviate_api_key: Optional[str] = None
     
     # FriendliAI
-    friendliai_api_key: str = Field(env="FRIENDLIAI_API_KEY")
-    friendliai_base_url: str = Field(default="https://api.friendli.ai", env="FRIENDLIAI_BASE_URL")
+    friendliai_api_key: str
+    friendliai_base_url: str = "https://api.friendli.ai"
     
     # GitHub
-    github_token: str = Field(env="GITHUB_TOKEN")
-    github_api_url: str = Field(default="https://api.github.com", env="GITHUB_API_URL")
+    github_token: str
+    github_api_url: str = "https://api.github.com"
     
     # Hypermode
-    hypermode_api_key: str = Field(env="HYPERMODE_API_KEY")
-    hypermode_base_url: str = Field(default="https://api.hypermode.com", env="HYPERMODE_BASE_URL")
+    hypermode_api_key: str
+    hypermode_base_url: str = "https://api.hypermode.com"
     
     # ACI.dev
-    aci_dev_api_key: str = Field(env="ACI_DEV_API_KEY")
-    aci_dev_base_url: str = Field(default="https://api.aci.dev", env="ACI_DEV_BASE_URL")
-    
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+    aci_dev_api_key: str
+    aci_dev_base_url: str = "https://api.aci.dev"
+    
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        frozen=True,
+        case_sensitive=False,
+        extra="ignore"
+    )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, parsing the environment only once."""
+    return Settings()
 
 
 # Global settings instance
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
\ No newline at end of file
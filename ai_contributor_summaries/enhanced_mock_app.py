@@ -3,91 +3,191 @@
 import streamlit as st
 import json
 import logging
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import pandas as pd
 from datetime import datetime
 import numpy as np
 from collections import defaultdict, Counter
 import re
+import os
+import sys
+import heapq
+from itertools import islice
+from operator import itemgetter
+from functools import lru_cache
+from dataclasses import dataclass
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib parser
+    orjson = None
+
+# st.plotly_chart serializes through plotly.io; Plotly 5 defaults to the stdlib encoder
+if orjson is not None:
+    pio.json.config.default_engine = 'orjson'
+
+try:
+    import ijson.backends.yajl2_c as ijson
+except ImportError:  # without the C backend, loading the whole file is faster
+    ijson = None
+
+# Each tab reruns on its own when a widget inside it changes (st.fragment needs Streamlit 1.37+)
+_fragment = getattr(st, 'fragment', lambda func: func)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+DATA_FILE = "/Users/alhinai/Desktop/github/weaviate_org_data"
+
+# Skill categories indexed for the skill filters and top-performer lookups
+SKILL_INDEX_CATEGORIES = ('programming_languages', 'domains')
+SKILL_ENTRY_DTYPE = np.dtype([('score', 'f8'), ('uid', 'i4')])
+
+# Columns of the skill correlation matrix: (label, skill category, skill)
+CORRELATION_SKILLS = (
+    ('python', 'programming_languages', 'Python'),
+    ('javascript', 'programming_languages', 'JavaScript'),
+    ('go', 'programming_languages', 'Go'),
+    ('typescript', 'programming_languages', 'TypeScript'),
+    ('web_dev', 'domains', 'web-development'),
+    ('ml', 'domains', 'machine-learning'),
+    ('data_science', 'domains', 'data-science'),
+    ('devops', 'domains', 'devops'),
+)
+
+
+@dataclass
+class ContributorRow:
+    """A contributor's profile, skills and contributions with their derived totals."""
+    # Written out rather than dataclass(slots=True), which needs Python 3.10
+    __slots__ = ('username', 'profile', 'skills', 'contributions', 'total_contributions',
+                 'total_repositories', 'summary', 'tech_stack', 'expertise_level')
+    username: str
+    profile: Dict[str, Any]
+    skills: Dict[str, Any]
+    contributions: List[Dict[str, Any]]
+    total_contributions: int
+    total_repositories: int
+    summary: str
+    tech_stack: List[str]
+    expertise_level: str
+
 
 class EnhancedMockApp:
     """Enhanced mock app with detailed analysis capabilities."""
     
-    def __init__(self):
+    # Profile tab sort options and the contributor_df column each one sorts by
+    _SORT_COLUMNS = {
+        "Total Contributions": 'total_contributions',
+        "Total Repositories": 'total_repositories',
+        "Followers": 'followers',
+        "Public Repos": 'public_repos'
+    }
+    
+    def __init__(self, data_file: str = DATA_FILE):
         """Initialize the app."""
+        self.data_file = data_file
         self.data = None
         self.contributors = {}
         self.skills_analysis = {}
         self.repositories = {}
         self.contributions = []
+        self.tech_usage = Counter()
+        self.contributor_df = pd.DataFrame()
+        self.contrib_df = pd.DataFrame()
+        self._sort_orders = {}
+        self._usernames_lower = np.array([], dtype=str)
+        self._contributor_search_text = np.array([], dtype=str)
+        self._repo_names = np.array([], dtype=object)
+        self._repo_search_text = np.array([], dtype=str)
+        self.skill_usernames = []
+        self.skill_index = {}
+        self._skill_search = {}
+        self._skill_index_by_name = {}
+        self._tech_matches = []
+        self._tech_postings = {}
+        self.skill_matrix = np.zeros((0, len(CORRELATION_SKILLS)), dtype=np.float32)
+        self._multi_skill_rows = np.zeros(0, dtype=bool)
         self.analytics = {}
+        
+        # Query results are memoized per instance; the instance itself is shared
+        # across sessions and reruns through st.cache_resource
+        self._search = lru_cache(maxsize=128)(self._search)
+        self._skill_experts = lru_cache(maxsize=128)(self._skill_experts)
+        self._get_top_performers = lru_cache(maxsize=128)(self._get_top_performers)
+        self._filter_order = lru_cache(maxsize=128)(self._filter_order)
+        
         self._load_data()
         self._process_data()
     
     def _load_data(self):
         """Load data from the weaviate_org_data file."""
         try:
-            data_file = "/Users/alhinai/Desktop/github/weaviate_org_data"
-            with open(data_file, 'r', encoding='utf-8') as f:
-                self.data = json.load(f)
+            if ijson is not None:
+                # Contributors are streamed from the file in _process_data
+                with open(self.data_file, 'rb') as f:
+                    metadata = next(ijson.items(f, 'analysis_metadata', use_float=True))
+                self.data = {'analysis_metadata': metadata}
+            elif orjson is not None:
+                with open(self.data_file, 'rb') as f:
+                    self.data = orjson.loads(f.read())
+            else:
+                with open(self.data_file, 'r', encoding='utf-8') as f:
+                    self.data = json.load(f)
             logger.info(f"Loaded data for {self.data['analysis_metadata']['total_contributors']} contributors")
         except Exception as e:
             logger.error(f"Failed to load data: {e}")
             st.error(f"Failed to load data: {e}")
     
+    def _iter_contributors(self):
+        """Yield (username, contributor data) pairs, streaming them from the file when ijson is available."""
+        if ijson is None:
+            yield from self.data['contributors'].items()
+            return
+        
+        with open(self.data_file, 'rb') as f:
+            yield from ijson.kvitems(f, 'contributors', use_float=True)
+    
     def _process_data(self):
         """Process the loaded data for analysis."""
         if not self.data:
             return
         
         # Process contributors
-        for username, contributor_data in self.data['contributors'].items():
-            # Process basic profile
-            profile = contributor_data['profile']
-            
-            # Calculate total contributions
-            total_contributions = sum(
-                contrib.get('contributions', 0) 
-                for contrib in contributor_data.get('contributions', [])
-            )
-            
-            # Process skills
+        for username, contributor_data in self._iter_contributors():
+            username = sys.intern(username)
+            contributions = contributor_data.get('contributions', [])
             skills = contributor_data.get('skills', {})
             
-            # Store processed contributor data
-            self.contributors[username] = {
-                'username': username,
-                'profile': profile,
-                'total_contributions': total_contributions,
-                'total_repositories': len(contributor_data.get('contributions', [])),
-                'skills': skills,
-                'contributions': contributor_data.get('contributions', []),
-                'summary': contributor_data.get('summary', ''),
-                'tech_stack': contributor_data.get('tech_stack', []),
-                'expertise_level': contributor_data.get('expertise_level', 'intermediate')
-            }
-            
             # Process skills for analysis
             if skills:
                 self.skills_analysis[username] = skills
             
-            # Process repositories
-            for contrib in contributor_data.get('contributions', []):
-                repo_name = contrib['repo_full_name']
+            # Process repositories, totals and language usage in a single pass
+            total_contributions = 0
+            for contrib in contributions:
+                # Repository and language names repeat across contributors, so
+                # intern them to share one string object per name
+                repo_name = contrib['repo_full_name'] = _intern(contrib['repo_full_name'])
+                contrib['primary_language'] = _intern(contrib['primary_language'])
+                contrib['languages'] = {
+                    _intern(lang): lines for lang, lines in contrib.get('languages', {}).items()
+                }
+                
+                total_contributions += contrib['contributions']
+                self.tech_usage.update(contrib['languages'])
+                
                 if repo_name not in self.repositories:
                     self.repositories[repo_name] = {
                         'name': contrib['repo_name'],
-                        'full_name': contrib['repo_full_name'],
+                        'full_name': repo_name,
                         'primary_language': contrib['primary_language'],
-                        'languages': contrib.get('languages', {}),
+                        'languages': contrib['languages'],
                         'topics': contrib.get('topics', []),
                         'description': contrib.get('repo_description', ''),
                         'size': contrib.get('repo_size', 0),
@@ -108,9 +208,84 @@ class EnhancedMockApp:
                     'username': username,
                     'repo_name': repo_name,
                     'contributions': contrib['contributions'],
-                    'primary_language': contrib['primary_language'],
-                    'languages': contrib.get('languages', {})
+                    'primary_language': contrib['primary_language']
                 })
+            
+            # The parsed profile, skills and contributions are shared, not copied
+            self.contributors[username] = ContributorRow(
+                username=username,
+                profile=contributor_data['profile'],
+                skills=skills,
+                contributions=contributions,
+                total_contributions=total_contributions,
+                total_repositories=len(contributions),
+                summary=contributor_data.get('summary', ''),
+                tech_stack=contributor_data.get('tech_stack', []),
+                expertise_level=contributor_data.get('expertise_level', 'intermediate')
+            )
+        
+        # Only the metadata is needed past this point
+        self.data = {'analysis_metadata': self.data['analysis_metadata']}
+        
+        # Columnar views of the contributors and their contributions
+        self.contributor_df = pd.DataFrame.from_records(
+            [
+                (
+                    c.username,
+                    c.total_contributions,
+                    c.total_repositories,
+                    c.expertise_level,
+                    c.profile.get('followers', 0),
+                    c.profile.get('public_repos', 0)
+                )
+                for c in self.contributors.values()
+            ],
+            columns=[
+                'username', 'total_contributions', 'total_repositories',
+                'expertise_level', 'followers', 'public_repos'
+            ]
+        ).set_index('username')
+        
+        # Row orders of the sortable columns, highest first with ties in data order
+        self._sort_orders = {
+            column: np.argsort(-self.contributor_df[column].to_numpy(), kind='stable')
+            for column in self._SORT_COLUMNS.values()
+        }
+        
+        # Lowercased search text, aligned with contributor_df and self.repositories
+        self._usernames_lower = np.array([username.lower() for username in self.contributors], dtype=str)
+        self._contributor_search_text = np.array(
+            [
+                _search_text(c.username, c.profile.get('name'), c.profile.get('bio'))
+                for c in self.contributors.values()
+            ],
+            dtype=str
+        )
+        self._repo_names = np.array(list(self.repositories), dtype=object)
+        self._repo_search_text = np.array(
+            [
+                _search_text(r['name'], r['description'], r['primary_language'])
+                for r in self.repositories.values()
+            ],
+            dtype=str
+        )
+        
+        self.contrib_df = pd.DataFrame.from_records(
+            self.contributions,
+            columns=['username', 'repo_name', 'contributions', 'primary_language']
+        )
+        
+        # Scores of the correlated skills, one row per contributor with skills
+        scores = np.array(
+            [
+                [skills.get(category, {}).get(skill, 0) for _, category, skill in CORRELATION_SKILLS]
+                for skills in self.skills_analysis.values()
+            ],
+            dtype=np.float64
+        ).reshape(-1, len(CORRELATION_SKILLS))
+        # Contributors with at least 2 of these skills > 0.3, decided on the exact scores
+        self._multi_skill_rows = (scores > 0.3).sum(axis=1) >= 2
+        self.skill_matrix = scores.astype(np.float32)
         
         # Generate analytics
         self._generate_analytics()
@@ -118,46 +293,33 @@ class EnhancedMockApp:
     def _generate_analytics(self):
         """Generate comprehensive analytics."""
         # Top contributors
-        top_contributors = sorted(
-            self.contributors.values(),
-            key=lambda x: x['total_contributions'],
-            reverse=True
-        )[:20]
-        
-        # Language analysis
-        language_stats = defaultdict(lambda: {'total_score': 0, 'contributors': 0, 'avg_score': 0})
-        domain_stats = defaultdict(lambda: {'total_score': 0, 'contributors': 0, 'avg_score': 0})
-        
-        for username, skills in self.skills_analysis.items():
-            # Programming languages
-            lang_scores = skills.get('programming_languages', {})
-            for lang, score in lang_scores.items():
-                if score > 0:
-                    language_stats[lang]['total_score'] += score
-                    language_stats[lang]['contributors'] += 1
-            
-            # Domain expertise
-            domain_scores = skills.get('domains', {})
-            for domain, score in domain_scores.items():
-                if score > 0:
-                    domain_stats[domain]['total_score'] += score
-                    domain_stats[domain]['contributors'] += 1
+        top_contributors = [
+            self.contributors[username]
+            for username in self.contributor_df.nlargest(20, 'total_contributions').index
+        ]
         
-        # Calculate averages
-        for lang_data in language_stats.values():
-            lang_data['avg_score'] = lang_data['total_score'] / lang_data['contributors']
+        # Language and domain analysis
+        language_stats = _score_stats(self.skills_analysis, 'programming_languages')
+        domain_stats = _score_stats(self.skills_analysis, 'domains')
         
-        for domain_data in domain_stats.values():
-            domain_data['avg_score'] = domain_data['total_score'] / domain_data['contributors']
+        # Skill index: (category, skill) -> positive scores, highest first
+        self._build_skill_index()
         
         # Repository analysis
+        repo_totals = (
+            self.contrib_df.groupby('repo_name', sort=False)['contributions']
+            .agg(['size', 'sum'])
+            .sort_values('sum', ascending=False, kind='stable')
+        )
         repo_stats = []
-        for repo_name, repo_data in self.repositories.items():
-            total_contributions = sum(c['contributions'] for c in repo_data['contributors'])
+        for repo_name, contributors, total_contributions in zip(
+            repo_totals.index, repo_totals['size'].tolist(), repo_totals['sum'].tolist()
+        ):
+            repo_data = self.repositories[repo_name]
             repo_stats.append({
                 'name': repo_data['name'],
                 'full_name': repo_name,
-                'contributors': len(repo_data['contributors']),
+                'contributors': contributors,
                 'total_contributions': total_contributions,
                 'primary_language': repo_data['primary_language'],
                 'stars': repo_data['stars'],
@@ -165,31 +327,68 @@ class EnhancedMockApp:
                 'size': repo_data['size']
             })
         
-        repo_stats.sort(key=lambda x: x['total_contributions'], reverse=True)
-        
-        # Technology trends
-        tech_usage = defaultdict(int)
-        for contrib in self.contributions:
-            for lang, lines in contrib['languages'].items():
-                tech_usage[lang] += lines
-        
         # Expertise levels
-        expertise_distribution = defaultdict(int)
-        for contributor in self.contributors.values():
-            level = contributor['expertise_level']
-            expertise_distribution[level] += 1
+        expertise_distribution = self.contributor_df['expertise_level'].value_counts(sort=False).to_dict()
         
         # Store analytics
         self.analytics = {
             'top_contributors': top_contributors,
-            'language_stats': dict(language_stats),
-            'domain_stats': dict(domain_stats),
+            'language_stats': language_stats,
+            'domain_stats': domain_stats,
             'repo_stats': repo_stats,
-            'tech_usage': dict(tech_usage),
-            'expertise_distribution': dict(expertise_distribution),
+            'tech_usage': self.tech_usage,
+            'expertise_distribution': expertise_distribution,
             'total_contributors': len(self.contributors),
             'total_repositories': len(self.repositories),
-            'total_contributions': sum(c['total_contributions'] for c in self.contributors.values())
+            'total_contributions': int(self.contributor_df['total_contributions'].sum())
+        }
+    
+    def _build_skill_index(self):
+        """Index the positive skill scores by (category, skill), sorted by score descending.
+        
+        Also builds the technology search postings: ``_tech_matches`` lists every searchable
+        (uid, match type, name, score) in data order, and ``_tech_postings`` maps each
+        lowercased name to the ascending positions of its rows in that list.
+        ``_skill_search`` lists the (lowercased name, name, index) of each category's skills,
+        and ``_skill_index_by_name`` maps a skill name straight to its index.
+        """
+        self.skill_usernames = list(self.skills_analysis)
+        entries = defaultdict(list)
+        self._tech_matches = []
+        tech_postings = defaultdict(list)
+        
+        for uid, skills in enumerate(self.skills_analysis.values()):
+            for category in SKILL_INDEX_CATEGORIES:
+                for skill, score in skills.get(category, {}).items():
+                    if score > 0:
+                        entries[(category, skill)].append((score, uid))
+            
+            for lang, score in skills.get('programming_languages', {}).items():
+                if score > 0:
+                    tech_postings[lang.lower()].append(len(self._tech_matches))
+                    self._tech_matches.append((uid, 'Programming Language', lang, score))
+            
+            for tech in skills.get('technologies', []):
+                tech_postings[tech.lower()].append(len(self._tech_matches))
+                self._tech_matches.append((uid, 'Technology', tech, 1.0))
+        
+        self._tech_postings = dict(tech_postings)
+        
+        self.skill_index = {}
+        skill_search = defaultdict(list)
+        for (category, skill), rows in entries.items():
+            index = np.array(rows, dtype=SKILL_ENTRY_DTYPE)
+            index = index[np.argsort(-index['score'], kind='stable')]
+            self.skill_index[(category, skill)] = index
+            skill_search[category].append((skill.lower(), skill, index))
+        
+        self._skill_search = dict(skill_search)
+        
+        # Top-performer lookups go by name alone; a domain wins over a language of the same name
+        self._skill_index_by_name = {
+            skill: index
+            for category in SKILL_INDEX_CATEGORIES
+            for _, skill, index in skill_search.get(category, ())
         }
     
     def run(self):
@@ -244,6 +443,7 @@ class EnhancedMockApp:
         with tab5:
             self._create_profiles_tab()
     
+    @_fragment
     def _create_search_tab(self):
         """Create search and exploration tab."""
         st.header("🔍 Search & Explore")
@@ -294,33 +494,40 @@ class EnhancedMockApp:
         # Apply filters
         filtered_contributors = self._apply_filters(min_contributions, expertise_level, min_repos)
         
-        if filtered_contributors:
+        if not filtered_contributors.empty:
             st.write(f"**Found {len(filtered_contributors)} contributors matching your criteria:**")
             
-            for contributor in filtered_contributors[:10]:  # Show top 10
-                with st.expander(f"#{contributor['rank']} {contributor['username']} ({contributor['total_contributions']} contributions)"):
+            top_filtered = filtered_contributors.head(10)  # Show top 10
+            for username, rank in zip(top_filtered.index, top_filtered['rank'].tolist()):
+                contributor = self.contributors[username]
+                with st.expander(f"#{rank} {username} ({contributor.total_contributions} contributions)"):
                     col1, col2 = st.columns([1, 2])
                     
                     with col1:
-                        if contributor['profile'].get('avatar_url'):
-                            st.image(contributor['profile']['avatar_url'], width=100)
+                        if contributor.profile.get('avatar_url'):
+                            st.image(contributor.profile['avatar_url'], width=100)
                     
                     with col2:
-                        st.write(f"**Name:** {contributor['profile'].get('name', 'N/A')}")
-                        st.write(f"**Location:** {contributor['profile'].get('location', 'N/A')}")
-                        st.write(f"**Company:** {contributor['profile'].get('company', 'N/A')}")
-                        st.write(f"**Repositories:** {contributor['total_repositories']}")
-                        st.write(f"**Expertise:** {contributor['expertise_level']}")
+                        lines = [
+                            f"**Name:** {contributor.profile.get('name', 'N/A')}",
+                            f"**Location:** {contributor.profile.get('location', 'N/A')}",
+                            f"**Company:** {contributor.profile.get('company', 'N/A')}",
+                            f"**Repositories:** {contributor.total_repositories}",
+                            f"**Expertise:** {contributor.expertise_level}"
+                        ]
                         
                         # Show top skills
-                        skills = contributor.get('skills', {})
+                        skills = contributor.skills
                         if skills:
-                            st.write("**Top Skills:**")
+                            lines.append("**Top Skills:**")
                             lang_skills = skills.get('programming_languages', {})
-                            top_langs = sorted(lang_skills.items(), key=lambda x: x[1], reverse=True)[:3]
+                            top_langs = heapq.nlargest(3, lang_skills.items(), key=itemgetter(1))
                             for lang, score in top_langs:
-                                st.write(f"  • {lang}: {score:.2f}")
+                                lines.append(f"  • {lang}: {score:.2f}")
+                        
+                        st.markdown('\n\n'.join(lines))
     
+    @_fragment
     def _create_analytics_tab(self):
         """Create analytics dashboard tab."""
         st.header("📊 Analytics Dashboard")
@@ -345,19 +552,18 @@ class EnhancedMockApp:
             # Top contributors
             top_contribs = self.analytics['top_contributors'][:10]
             df_top = pd.DataFrame([{
-                'Username': c['username'],
-                'Contributions': c['total_contributions'],
-                'Repositories': c['total_repositories']
+                'Username': c.username,
+                'Contributions': c.total_contributions,
+                'Repositories': c.total_repositories
             } for c in top_contribs])
             
-            fig_top = px.bar(
+            fig_top = _bar_figure(
                 df_top,
                 x='Username',
                 y='Contributions',
                 title='Top 10 Contributors',
                 hover_data=['Repositories']
             )
-            fig_top.update_xaxes(tickangle=45)
             st.plotly_chart(fig_top, use_container_width=True)
         
         with chart_col2:
@@ -373,7 +579,7 @@ class EnhancedMockApp:
             
             df_lang = pd.DataFrame(lang_data)
             if not df_lang.empty:
-                fig_lang = px.scatter(
+                fig_lang = _scatter_figure(
                     df_lang,
                     x='Contributors',
                     y='Avg Score',
@@ -390,7 +596,7 @@ class EnhancedMockApp:
         for domain, stats in self.analytics['domain_stats'].items():
             if stats['contributors'] > 3:
                 domain_data.append({
-                    'Domain': domain.replace('-', ' ').title(),
+                    'Domain': _domain_label(domain),
                     'Contributors': stats['contributors'],
                     'Avg Score': stats['avg_score'],
                     'Total Score': stats['total_score']
@@ -398,14 +604,13 @@ class EnhancedMockApp:
         
         df_domain = pd.DataFrame(domain_data)
         if not df_domain.empty:
-            fig_domain = px.bar(
+            fig_domain = _bar_figure(
                 df_domain,
                 x='Domain',
                 y='Contributors',
                 title='Contributors by Domain Expertise',
                 hover_data=['Avg Score']
             )
-            fig_domain.update_xaxes(tickangle=45)
             st.plotly_chart(fig_domain, use_container_width=True)
         
         # Repository analysis
@@ -414,7 +619,7 @@ class EnhancedMockApp:
         repo_data = self.analytics['repo_stats'][:15]
         df_repo = pd.DataFrame(repo_data)
         
-        fig_repo = px.scatter(
+        fig_repo = _scatter_figure(
             df_repo,
             x='contributors',
             y='total_contributions',
@@ -428,18 +633,18 @@ class EnhancedMockApp:
         # Technology usage heatmap
         st.subheader("Technology Usage (Lines of Code)")
         
-        tech_data = sorted(self.analytics['tech_usage'].items(), key=lambda x: x[1], reverse=True)[:20]
+        tech_data = self.analytics['tech_usage'].most_common(20)
         df_tech = pd.DataFrame(tech_data, columns=['Technology', 'Lines of Code'])
         
-        fig_tech = px.bar(
+        fig_tech = _bar_figure(
             df_tech,
             x='Technology',
             y='Lines of Code',
             title='Top 20 Technologies by Usage'
         )
-        fig_tech.update_xaxes(tickangle=45)
         st.plotly_chart(fig_tech, use_container_width=True)
     
+    @_fragment
     def _create_skills_tab(self):
         """Create skills analysis tab."""
         st.header("🧠 Skills Analysis")
@@ -469,53 +674,31 @@ class EnhancedMockApp:
         
         df_skill_dist = pd.DataFrame(skill_dist_data)
         if not df_skill_dist.empty:
-            fig_skill_dist = px.bar(
+            fig_skill_dist = _bar_figure(
                 df_skill_dist,
                 x='Language',
                 y='Avg Score',
                 title='Average Programming Language Skills',
                 hover_data=['Users', 'Max Score', 'Min Score']
             )
-            fig_skill_dist.update_xaxes(tickangle=45)
             st.plotly_chart(fig_skill_dist, use_container_width=True)
         
         # Skill correlation analysis
         st.subheader("Skill Correlation Analysis")
         
-        # Find users with multiple skills
-        multi_skill_users = []
-        for username, skills in self.skills_analysis.items():
-            lang_scores = skills.get('programming_languages', {})
-            domain_scores = skills.get('domains', {})
-            
-            user_skills = {
-                'username': username,
-                'python': lang_scores.get('Python', 0),
-                'javascript': lang_scores.get('JavaScript', 0),
-                'go': lang_scores.get('Go', 0),
-                'typescript': lang_scores.get('TypeScript', 0),
-                'web_dev': domain_scores.get('web-development', 0),
-                'ml': domain_scores.get('machine-learning', 0),
-                'data_science': domain_scores.get('data-science', 0),
-                'devops': domain_scores.get('devops', 0)
-            }
-            
-            # Only include users with at least 2 skills > 0.3
-            skill_count = sum(1 for v in user_skills.values() if isinstance(v, (int, float)) and v > 0.3)
-            if skill_count >= 2:
-                multi_skill_users.append(user_skills)
-        
-        if multi_skill_users:
-            df_multi = pd.DataFrame(multi_skill_users)
-            numeric_cols = ['python', 'javascript', 'go', 'typescript', 'web_dev', 'ml', 'data_science', 'devops']
-            correlation_matrix = df_multi[numeric_cols].corr()
+        # Only include users with at least 2 skills > 0.3
+        multi_skill = self.skill_matrix[self._multi_skill_rows]
+        
+        if len(multi_skill):
+            labels = [label for label, _, _ in CORRELATION_SKILLS]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                correlation_matrix = pd.DataFrame(
+                    np.corrcoef(multi_skill, rowvar=False),
+                    index=labels,
+                    columns=labels
+                )
             
-            fig_corr = px.imshow(
-                correlation_matrix,
-                title='Skill Correlation Matrix',
-                aspect='auto',
-                color_continuous_scale='RdBu'
-            )
+            fig_corr = _heatmap_figure(correlation_matrix, title='Skill Correlation Matrix')
             st.plotly_chart(fig_corr, use_container_width=True)
         
         # Top performers by skill
@@ -532,26 +715,32 @@ class EnhancedMockApp:
             if top_performers:
                 st.write(f"**Top 10 performers in {skill_select}:**")
                 
-                for i, (username, score) in enumerate(top_performers[:10]):
+                for i, (username, score) in enumerate(top_performers):
                     contributor = self.contributors[username]
                     col1, col2, col3 = st.columns([1, 2, 1])
                     
                     with col1:
                         st.write(f"**#{i+1}**")
-                        if contributor['profile'].get('avatar_url'):
-                            st.image(contributor['profile']['avatar_url'], width=50)
+                        if contributor.profile.get('avatar_url'):
+                            st.image(contributor.profile['avatar_url'], width=50)
                     
                     with col2:
-                        st.write(f"**{username}**")
-                        st.write(f"Score: {score:.2f}")
-                        st.write(f"Contributions: {contributor['total_contributions']}")
-                        if contributor['profile'].get('company'):
-                            st.write(f"Company: {contributor['profile']['company']}")
+                        lines = [
+                            f"**{username}**",
+                            f"Score: {score:.2f}",
+                            f"Contributions: {contributor.total_contributions}"
+                        ]
+                        if contributor.profile.get('company'):
+                            lines.append(f"Company: {contributor.profile['company']}")
+                        st.markdown('\n\n'.join(lines))
                     
                     with col3:
-                        st.write(f"**Repos: {contributor['total_repositories']}**")
-                        st.write(f"Level: {contributor['expertise_level']}")
+                        st.markdown(
+                            f"**Repos: {contributor.total_repositories}**\n\n"
+                            f"Level: {contributor.expertise_level}"
+                        )
     
+    @_fragment
     def _create_repository_tab(self):
         """Create repository insights tab."""
         st.header("📈 Repository Insights")
@@ -565,14 +754,13 @@ class EnhancedMockApp:
         top_repos = repo_stats[:10]
         df_top_repos = pd.DataFrame(top_repos)
         
-        fig_top_repos = px.bar(
+        fig_top_repos = _bar_figure(
             df_top_repos,
             x='name',
             y='total_contributions',
             title='Top 10 Repositories by Contributions',
             hover_data=['contributors', 'stars', 'primary_language']
         )
-        fig_top_repos.update_xaxes(tickangle=45)
         st.plotly_chart(fig_top_repos, use_container_width=True)
         
         # Language distribution across repositories
@@ -587,7 +775,7 @@ class EnhancedMockApp:
             columns=['Language', 'Repository Count']
         )
         
-        fig_lang_repos = px.pie(
+        fig_lang_repos = _pie_figure(
             df_lang_repos,
             values='Repository Count',
             names='Language',
@@ -636,11 +824,11 @@ class EnhancedMockApp:
                 # Top contributors to this repository
                 st.subheader(f"Top Contributors to {selected_repo}")
                 
-                repo_contributors = sorted(
+                repo_contributors = heapq.nlargest(
+                    10,
                     repo_details['contributors'],
-                    key=lambda x: x['contributions'],
-                    reverse=True
-                )[:10]
+                    key=itemgetter('contributions')
+                )
                 
                 for i, contrib in enumerate(repo_contributors):
                     contributor = self.contributors[contrib['username']]
@@ -648,18 +836,23 @@ class EnhancedMockApp:
                     
                     with col1:
                         st.write(f"**#{i+1}**")
-                        if contributor['profile'].get('avatar_url'):
-                            st.image(contributor['profile']['avatar_url'], width=50)
+                        if contributor.profile.get('avatar_url'):
+                            st.image(contributor.profile['avatar_url'], width=50)
                     
                     with col2:
-                        st.write(f"**{contrib['username']}**")
-                        st.write(f"Contributions: {contrib['contributions']}")
-                        if contributor['profile'].get('company'):
-                            st.write(f"Company: {contributor['profile']['company']}")
+                        lines = [
+                            f"**{contrib['username']}**",
+                            f"Contributions: {contrib['contributions']}"
+                        ]
+                        if contributor.profile.get('company'):
+                            lines.append(f"Company: {contributor.profile['company']}")
+                        st.markdown('\n\n'.join(lines))
                     
                     with col3:
-                        st.write(f"**Total Repos: {contributor['total_repositories']}**")
-                        st.write(f"Total Contributions: {contributor['total_contributions']}")
+                        st.markdown(
+                            f"**Total Repos: {contributor.total_repositories}**\n\n"
+                            f"Total Contributions: {contributor.total_contributions}"
+                        )
                 
                 # Language breakdown for this repository
                 if repo_details['languages']:
@@ -671,7 +864,7 @@ class EnhancedMockApp:
                         columns=['Language', 'Lines of Code']
                     )
                     
-                    fig_lang_breakdown = px.pie(
+                    fig_lang_breakdown = _pie_figure(
                         df_lang_breakdown,
                         values='Lines of Code',
                         names='Language',
@@ -679,6 +872,7 @@ class EnhancedMockApp:
                     )
                     st.plotly_chart(fig_lang_breakdown, use_container_width=True)
     
+    @_fragment
     def _create_profiles_tab(self):
         """Create contributor profiles tab."""
         st.header("👥 Contributor Profiles")
@@ -687,251 +881,357 @@ class EnhancedMockApp:
         profile_search = st.text_input("Search contributors by username:")
         
         # Sort options
-        sort_option = st.selectbox(
-            "Sort by:",
-            ["Total Contributions", "Total Repositories", "Followers", "Public Repos"]
-        )
+        sort_option = st.selectbox("Sort by:", list(self._SORT_COLUMNS))
         
         # Get sorted contributors
-        sort_key_map = {
-            "Total Contributions": lambda x: x['total_contributions'],
-            "Total Repositories": lambda x: x['total_repositories'],
-            "Followers": lambda x: x['profile'].get('followers', 0),
-            "Public Repos": lambda x: x['profile'].get('public_repos', 0)
-        }
-        
-        sorted_contributors = sorted(
-            self.contributors.values(),
-            key=sort_key_map[sort_option],
-            reverse=True
-        )
+        order = self._sort_orders[self._SORT_COLUMNS[sort_option]]
         
         # Filter by search
         if profile_search:
-            sorted_contributors = [
-                c for c in sorted_contributors 
-                if profile_search.lower() in c['username'].lower()
-            ]
+            matches = np.char.find(self._usernames_lower, profile_search.lower()) >= 0
+            order = order[matches[order]]
         
         # Display contributors
-        st.write(f"**Showing {len(sorted_contributors)} contributors:**")
+        st.write(f"**Showing {len(order)} contributors:**")
         
-        for i, contributor in enumerate(sorted_contributors[:20]):  # Show top 20
-            with st.expander(f"#{i+1} {contributor['username']} ({contributor['total_contributions']} contributions)"):
+        for i, username in enumerate(self.contributor_df.index[order[:20]]):  # Show top 20
+            contributor = self.contributors[username]
+            with st.expander(f"#{i+1} {contributor.username} ({contributor.total_contributions} contributions)"):
                 profile_col1, profile_col2, profile_col3 = st.columns([1, 2, 1])
                 
                 with profile_col1:
-                    if contributor['profile'].get('avatar_url'):
-                        st.image(contributor['profile']['avatar_url'], width=120)
+                    if contributor.profile.get('avatar_url'):
+                        st.image(contributor.profile['avatar_url'], width=120)
                 
+                # Each column is rendered as one Markdown element rather than one per field
                 with profile_col2:
-                    st.write(f"**Name:** {contributor['profile'].get('name', 'N/A')}")
-                    st.write(f"**Location:** {contributor['profile'].get('location', 'N/A')}")
-                    st.write(f"**Company:** {contributor['profile'].get('company', 'N/A')}")
-                    st.write(f"**Bio:** {contributor['profile'].get('bio', 'N/A')}")
+                    lines = [
+                        f"**Name:** {contributor.profile.get('name', 'N/A')}",
+                        f"**Location:** {contributor.profile.get('location', 'N/A')}",
+                        f"**Company:** {contributor.profile.get('company', 'N/A')}",
+                        f"**Bio:** {contributor.profile.get('bio', 'N/A')}"
+                    ]
+                    
+                    if contributor.profile.get('blog'):
+                        lines.append(f"**Blog:** {contributor.profile['blog']}")
                     
-                    if contributor['profile'].get('blog'):
-                        st.write(f"**Blog:** {contributor['profile']['blog']}")
+                    if contributor.profile.get('twitter'):
+                        lines.append(f"**Twitter:** {contributor.profile['twitter']}")
                     
-                    if contributor['profile'].get('twitter'):
-                        st.write(f"**Twitter:** {contributor['profile']['twitter']}")
+                    st.markdown('\n\n'.join(lines))
                 
                 with profile_col3:
-                    st.write(f"**Public Repos:** {contributor['profile'].get('public_repos', 0)}")
-                    st.write(f"**Followers:** {contributor['profile'].get('followers', 0)}")
-                    st.write(f"**Following:** {contributor['profile'].get('following', 0)}")
-                    st.write(f"**Expertise Level:** {contributor['expertise_level']}")
-                    st.write(f"**Total Contributions:** {contributor['total_contributions']}")
-                    st.write(f"**Total Repositories:** {contributor['total_repositories']}")
+                    st.markdown('\n\n'.join([
+                        f"**Public Repos:** {contributor.profile.get('public_repos', 0)}",
+                        f"**Followers:** {contributor.profile.get('followers', 0)}",
+                        f"**Following:** {contributor.profile.get('following', 0)}",
+                        f"**Expertise Level:** {contributor.expertise_level}",
+                        f"**Total Contributions:** {contributor.total_contributions}",
+                        f"**Total Repositories:** {contributor.total_repositories}"
+                    ]))
                 
                 # Skills section
-                skills = contributor.get('skills', {})
+                skills = contributor.skills
                 if skills:
                     st.subheader("Skills Analysis")
                     
                     skill_col1, skill_col2 = st.columns(2)
                     
                     with skill_col1:
-                        st.write("**Programming Languages:**")
+                        lines = ["**Programming Languages:**"]
                         lang_skills = skills.get('programming_languages', {})
-                        for lang, score in sorted(lang_skills.items(), key=lambda x: x[1], reverse=True)[:5]:
+                        for lang, score in heapq.nlargest(5, lang_skills.items(), key=itemgetter(1)):
                             if score > 0:
-                                st.write(f"• {lang}: {score:.2f}")
+                                lines.append(f"• {lang}: {score:.2f}")
+                        st.markdown('\n\n'.join(lines))
                     
                     with skill_col2:
-                        st.write("**Domain Expertise:**")
+                        lines = ["**Domain Expertise:**"]
                         domain_skills = skills.get('domains', {})
-                        for domain, score in sorted(domain_skills.items(), key=lambda x: x[1], reverse=True)[:5]:
+                        for domain, score in heapq.nlargest(5, domain_skills.items(), key=itemgetter(1)):
                             if score > 0:
-                                st.write(f"• {domain.replace('-', ' ').title()}: {score:.2f}")
+                                lines.append(f"• {_domain_label(domain)}: {score:.2f}")
+                        st.markdown('\n\n'.join(lines))
                 
                 # Contributions section
                 st.subheader("Top Repository Contributions")
                 
-                top_contribs = sorted(
-                    contributor['contributions'],
-                    key=lambda x: x['contributions'],
-                    reverse=True
-                )[:5]
+                top_contribs = heapq.nlargest(
+                    5,
+                    contributor.contributions,
+                    key=itemgetter('contributions')
+                )
                 
-                for contrib in top_contribs:
-                    st.write(f"• **{contrib['repo_name']}**: {contrib['contributions']} contributions ({contrib['primary_language']})")
+                st.dataframe(
+                    pd.DataFrame([{
+                        'Repository': c['repo_name'],
+                        'Contributions': c['contributions'],
+                        'Language': c['primary_language']
+                    } for c in top_contribs]),
+                    hide_index=True,
+                    use_container_width=True
+                )
     
-    def _perform_search(self, query: str, search_type: str):
-        """Perform search based on query and type."""
-        query_lower = query.lower()
+    def _search(self, query_lower: str, search_type: str, limit: int = 10) -> tuple:
+        """Find the contributors, technology matches or repositories matching a lowercased query.
+        
+        Contributors and repositories match when one of their search fields contains the whole query.
+        Returns the number of matches and the first ``limit`` of them.
+        """
+        count = 0
         results = []
         
+        # A blank query would match every contributor and repository
+        if not query_lower.strip():
+            return count, ()
+        
         if search_type == "Contributors":
-            results = [
-                c for c in self.contributors.values()
-                if query_lower in c['username'].lower() or
-                query_lower in c['profile'].get('name', '').lower() or
-                query_lower in c['profile'].get('bio', '').lower()
-            ]
+            matches = self.contributor_df.index[np.char.find(self._contributor_search_text, query_lower) >= 0]
+            count = len(matches)
+            results = [self.contributors[username] for username in matches[:limit]]
             
         elif search_type == "Technologies":
-            for username, skills in self.skills_analysis.items():
-                # Search in programming languages
-                lang_skills = skills.get('programming_languages', {})
-                for lang, score in lang_skills.items():
-                    if query_lower in lang.lower() and score > 0:
-                        results.append({
-                            'username': username,
-                            'match_type': 'Programming Language',
-                            'match_value': lang,
-                            'score': score,
-                            'contributor': self.contributors[username]
-                        })
-                
-                # Search in technologies
-                technologies = skills.get('technologies', [])
-                for tech in technologies:
-                    if query_lower in tech.lower():
-                        results.append({
-                            'username': username,
-                            'match_type': 'Technology',
-                            'match_value': tech,
-                            'score': 1.0,
-                            'contributor': self.contributors[username]
-                        })
+            # Only the distinct names are scanned; merging the sorted postings keeps data order
+            postings = [postings for name, postings in self._tech_postings.items() if query_lower in name]
+            count = sum(map(len, postings))
+            
+            for row in islice(heapq.merge(*postings), limit):
+                uid, match_type, match_value, score = self._tech_matches[row]
+                username = self.skill_usernames[uid]
+                results.append({
+                    'username': username,
+                    'match_type': match_type,
+                    'match_value': match_value,
+                    'score': score,
+                    'contributor': self.contributors[username]
+                })
         
         elif search_type == "Repositories":
-            for repo_name, repo_data in self.repositories.items():
-                if (query_lower in repo_data['name'].lower() or
-                    query_lower in repo_data.get('description', '').lower() or
-                    query_lower in repo_data['primary_language'].lower()):
-                    results.append(repo_data)
+            matches = self._repo_names[np.char.find(self._repo_search_text, query_lower) >= 0]
+            count = len(matches)
+            results = [self.repositories[repo_name] for repo_name in matches[:limit]]
+        
+        return count, tuple(results)
+    
+    def _perform_search(self, query: str, search_type: str):
+        """Perform search based on query and type."""
+        count, results = self._search(query.lower(), search_type)
         
         # Display results
         if results:
-            st.subheader(f"Search Results for '{query}' ({len(results)} found)")
+            st.subheader(f"Search Results for '{query}' ({count} found)")
             
             if search_type == "Contributors":
-                for result in results[:10]:
-                    st.write(f"**{result['username']}** - {result['total_contributions']} contributions")
-                    if result['profile'].get('bio'):
-                        st.write(f"  Bio: {result['profile']['bio']}")
-                    
+                df_results = pd.DataFrame([{
+                    'Username': r.username,
+                    'Contributions': r.total_contributions,
+                    'Bio': r.profile.get('bio') or ''
+                } for r in results])
+                column_config = None
+                
             elif search_type == "Technologies":
-                for result in results[:10]:
-                    st.write(f"**{result['username']}** - {result['match_type']}: {result['match_value']} (Score: {result['score']:.2f})")
-                    
-            elif search_type == "Repositories":
-                for result in results[:10]:
-                    st.write(f"**{result['name']}** - {result['primary_language']}")
-                    st.write(f"  Contributors: {len(result['contributors'])}, Stars: {result['stars']}")
-                    if result.get('description'):
-                        st.write(f"  Description: {result['description']}")
+                df_results = pd.DataFrame([{
+                    'Username': r['username'],
+                    'Match Type': r['match_type'],
+                    'Match': r['match_value'],
+                    'Score': r['score']
+                } for r in results])
+                column_config = {'Score': st.column_config.NumberColumn(format="%.2f")}
+                
+            else:
+                df_results = pd.DataFrame([{
+                    'Repository': r['name'],
+                    'Language': r['primary_language'],
+                    'Contributors': len(r['contributors']),
+                    'Stars': r['stars'],
+                    'Description': r.get('description') or ''
+                } for r in results])
+                column_config = None
+            
+            st.dataframe(df_results, column_config=column_config, hide_index=True, use_container_width=True)
         else:
             st.warning(f"No results found for '{query}'")
     
+    def _skill_experts(self, skill_name_lower: str, skill_type: str, limit: int = 10) -> tuple:
+        """Contributors scoring above 0.5 in any skill of ``skill_type`` whose name contains ``skill_name_lower``.
+        
+        Returns the number of matches and the ``limit`` highest scoring of them.
+        """
+        matches = []
+        
+        for skill_lower, skill, index in self._skill_search.get(skill_type, ()):
+            # Indexes are sorted by score, so the first row tells whether any score
+            # clears the threshold before the name is scanned
+            if index['score'][0] > 0.5 and skill_name_lower in skill_lower:
+                matches.append([(score, uid, skill) for score, uid in index[index['score'] > 0.5].tolist()])
+        
+        # Each index is sorted by score with contributors in data order on ties,
+        # so merging the runs yields the overall top without a full sort
+        top = islice(heapq.merge(*matches, key=lambda x: (-x[0], x[1])), limit)
+        
+        return sum(map(len, matches)), tuple(
+            {
+                'username': self.skill_usernames[uid],
+                'skill': skill,
+                'score': score,
+                'contributor': self.contributors[self.skill_usernames[uid]]
+            }
+            for score, uid, skill in top
+        )
+    
     def _filter_by_skill(self, skill_name: str, skill_type: str):
         """Filter contributors by specific skill."""
-        results = []
-        
-        for username, skills in self.skills_analysis.items():
-            skill_data = skills.get(skill_type, {})
-            
-            for skill, score in skill_data.items():
-                if skill_name.lower() in skill.lower() and score > 0.5:
-                    results.append({
-                        'username': username,
-                        'skill': skill,
-                        'score': score,
-                        'contributor': self.contributors[username]
-                    })
-        
-        # Sort by score
-        results.sort(key=lambda x: x['score'], reverse=True)
+        count, results = self._skill_experts(skill_name.lower(), skill_type)
         
         if results:
-            st.subheader(f"Top {skill_name} Experts ({len(results)} found)")
+            st.subheader(f"Top {skill_name} Experts ({count} found)")
             
-            for result in results[:10]:
-                contributor = result['contributor']
-                st.write(f"**{result['username']}** - {result['skill']} Score: {result['score']:.2f}")
-                st.write(f"  Contributions: {contributor['total_contributions']}, Repos: {contributor['total_repositories']}")
-                if contributor['profile'].get('company'):
-                    st.write(f"  Company: {contributor['profile']['company']}")
+            df_experts = pd.DataFrame([{
+                'Username': r['username'],
+                'Skill': r['skill'],
+                'Score': r['score'],
+                'Contributions': r['contributor'].total_contributions,
+                'Repos': r['contributor'].total_repositories,
+                'Company': r['contributor'].profile.get('company') or ''
+            } for r in results])
+            
+            st.dataframe(
+                df_experts,
+                column_config={'Score': st.column_config.NumberColumn(format="%.2f")},
+                hide_index=True,
+                use_container_width=True
+            )
         else:
             st.warning(f"No {skill_name} experts found")
     
-    def _apply_filters(self, min_contributions: int, expertise_level: str, min_repos: int):
-        """Apply filters to contributors."""
-        filtered = []
-        
-        for contributor in self.contributors.values():
-            # Apply filters
-            if contributor['total_contributions'] < min_contributions:
-                continue
-            
-            if expertise_level != "All" and contributor['expertise_level'] != expertise_level:
-                continue
-            
-            if contributor['total_repositories'] < min_repos:
-                continue
-            
-            filtered.append(contributor)
-        
-        # Sort by contributions and add rank
-        filtered.sort(key=lambda x: x['total_contributions'], reverse=True)
-        
-        for i, contributor in enumerate(filtered):
-            contributor['rank'] = i + 1
-        
-        return filtered
+    def _apply_filters(self, min_contributions: int, expertise_level: str, min_repos: int) -> pd.DataFrame:
+        """Apply filters to contributors.
+        
+        Returns a new frame of the matching rows of ``contributor_df`` ordered by
+        total contributions, with a 1-based ``rank`` column.
+        """
+        order = self._filter_order(min_contributions, expertise_level, min_repos)
+        return self.contributor_df.iloc[order].assign(rank=np.arange(1, len(order) + 1))
     
-    def _get_top_performers(self, skill: str):
-        """Get top performers for a specific skill."""
-        performers = []
-        
-        for username, skills in self.skills_analysis.items():
-            score = 0
-            
-            # Check programming languages
-            lang_skills = skills.get('programming_languages', {})
-            if skill in lang_skills:
-                score = lang_skills[skill]
-            
-            # Check domain skills
-            domain_skills = skills.get('domains', {})
-            if skill in domain_skills:
-                score = domain_skills[skill]
-            
+    def _filter_order(self, min_contributions: int, expertise_level: str, min_repos: int) -> np.ndarray:
+        """Positions in ``contributor_df`` of the filtered contributors, by total contributions.
+        
+        The array is cached and shared between callers, so it is read-only.
+        """
+        df = self.contributor_df
+        mask = (
+            (df['total_contributions'] >= min_contributions).to_numpy()
+            & (df['total_repositories'] >= min_repos).to_numpy()
+        )
+        if expertise_level != "All":
+            mask &= (df['expertise_level'] == expertise_level).to_numpy()
+        
+        # Walk the precomputed contribution order so no per-call sort is needed
+        order = self._sort_orders['total_contributions']
+        order = order[mask[order]]
+        order.setflags(write=False)
+        return order
+    
+    def _get_top_performers(self, skill: str, limit: int = 10):
+        """Get the ``limit`` top performers for a specific skill."""
+        index = self._skill_index_by_name.get(skill)
+        if index is None:
+            return ()
+        
+        # The index is already sorted, so only the leading rows leave numpy
+        return tuple((self.skill_usernames[uid], score) for score, uid in index[:limit].tolist())
+
+
+@lru_cache(maxsize=None)
+def _domain_label(domain: str) -> str:
+    """Display label for a domain name, e.g. ``machine-learning`` -> ``Machine Learning``."""
+    return domain.replace('-', ' ').title()
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern a string, passing missing values through unchanged."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _search_text(*fields: Optional[str]) -> str:
+    """Lowercase and join the non-empty fields for substring search.
+    
+    Fields are separated by a newline, which a single-line search query cannot contain.
+    """
+    return '\n'.join(field.lower() for field in fields if field)
+
+
+def _score_stats(skills_analysis: Dict[str, Dict], category: str) -> Dict[str, Dict[str, float]]:
+    """Total, contributor count and average of the positive scores per skill in a category."""
+    totals = Counter()
+    counts = Counter()
+    for skills in skills_analysis.values():
+        for name, score in skills.get(category, {}).items():
             if score > 0:
-                performers.append((username, score))
-        
-        # Sort by score
-        performers.sort(key=lambda x: x[1], reverse=True)
-        
-        return performers
+                totals[name] += score
+                counts[name] += 1
+    
+    names = list(totals)
+    total_scores = np.fromiter(totals.values(), dtype=np.float64, count=len(names))
+    contributor_counts = np.fromiter(counts.values(), dtype=np.int64, count=len(names))
+    avg_scores = total_scores / contributor_counts
+    
+    return {
+        name: {'total_score': total, 'contributors': count, 'avg_score': avg}
+        for name, total, count, avg in zip(
+            names, total_scores.tolist(), contributor_counts.tolist(), avg_scores.tolist()
+        )
+    }
+
+
+@st.cache_data(show_spinner=False)
+def _bar_figure(df: pd.DataFrame, x: str, y: str, title: str, hover_data: Optional[List[str]] = None) -> go.Figure:
+    """Bar chart with slanted x-axis labels."""
+    fig = px.bar(df, x=x, y=y, title=title, hover_data=hover_data)
+    fig.update_xaxes(tickangle=45)
+    return fig
+
+
+@st.cache_data(show_spinner=False)
+def _scatter_figure(df: pd.DataFrame, x: str, y: str, size: str, hover_name: str, title: str,
+                    color: Optional[str] = None) -> go.Figure:
+    """Bubble scatter chart."""
+    return px.scatter(df, x=x, y=y, size=size, hover_name=hover_name, color=color, title=title)
+
+
+@st.cache_data(show_spinner=False)
+def _pie_figure(df: pd.DataFrame, values: str, names: str, title: str) -> go.Figure:
+    """Pie chart."""
+    return px.pie(df, values=values, names=names, title=title)
+
+
+@st.cache_data(show_spinner=False)
+def _heatmap_figure(matrix: pd.DataFrame, title: str) -> go.Figure:
+    """Diverging heatmap for a correlation matrix."""
+    return px.imshow(matrix, title=title, aspect='auto', color_continuous_scale='RdBu')
+
+
+@st.cache_resource(show_spinner=False)
+def load_app(data_file: str, mtime: float) -> EnhancedMockApp:
+    """Load and process the data file once per file version.
+    
+    ``mtime`` is only part of the cache key, so editing the data file triggers a reload.
+    """
+    return EnhancedMockApp(data_file)
+
+
+def _data_file_mtime(data_file: str) -> float:
+    """Modification time of the data file, or 0 when it is missing."""
+    try:
+        return os.path.getmtime(data_file)
+    except OSError:
+        return 0.0
 
 
 def main():
     """Main function to run the app."""
     try:
-        app = EnhancedMockApp()
+        app = load_app(DATA_FILE, _data_file_mtime(DATA_FILE))
         app.run()
     except Exception as e:
         st.error(f"Failed to start app: {e}")
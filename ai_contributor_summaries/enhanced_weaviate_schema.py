@@ -4,10 +4,33 @@ import logging
 import json
 from typing import Dict, List, Optional, Any
 from datetime import datetime
-from utils.weaviate_client import WeaviateClient
+from utils.weaviate_client import WeaviateClient, weaviate_client
+
+try:
+    import ijson.backends.yajl2_c as ijson
+except ImportError:  # without the C backend, loading the whole file is faster
+    ijson = None
 
 logger = logging.getLogger(__name__)
 
+# Skills properties defined on the schema; other languages/domains are dropped
+_ALLOWED_LANG_KEYS = frozenset({
+    "python_score", "javascript_score", "go_score", "typescript_score",
+    "dockerfile_score", "shell_score", "html_score", "css_score",
+    "scala_score", "c_score", "ruby_score",
+})
+_ALLOWED_DOMAIN_KEYS = frozenset({
+    "web_development", "machine_learning", "data_science",
+    "devops", "cloud_computing", "database", "system_programming",
+    "frontend", "backend", "testing",
+})
+
+# Concurrent batch requests while ingesting; the work is network-bound
+INGEST_WORKERS = 4
+
+# Maps a lowercased language name onto its Skills property prefix
+_LANG_KEY_TABLE = str.maketrans({' ': '_', '#': 'sharp'})
+
 
 class EnhancedWeaviateSchema:
     """Enhanced Weaviate schema for detailed contributor analysis."""
@@ -148,118 +171,156 @@ class EnhancedWeaviateSchema:
         try:
             logger.info(f"Starting ingestion of {json_file_path}")
             
-            # Load JSON data
-            with open(json_file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # Load JSON data, streaming contributors when ijson is available
+            if ijson is not None:
+                with open(json_file_path, 'rb') as f:
+                    metadata = next(ijson.items(f, 'analysis_metadata', use_float=True))
+                with open(json_file_path, 'rb') as f:
+                    skill_recommendations = next(ijson.items(f, 'skill_recommendations', use_float=True), None)
+                contributors = self._iter_contributors(json_file_path)
+            else:
+                with open(json_file_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                metadata = data['analysis_metadata']
+                skill_recommendations = data.get('skill_recommendations')
+                contributors = data['contributors'].items()
+            skill_recommendations = skill_recommendations or {}
             
-            logger.info(f"Loaded data for {data['analysis_metadata']['total_contributors']} contributors")
+            logger.info(f"Loaded data for {metadata['total_contributors']} contributors")
             
-            # Process contributors
-            for username, contributor_data in data['contributors'].items():
-                # Insert contributor profile
-                contributor_obj = {
-                    "username": username,
-                    "name": str(contributor_data['profile'].get('name', '') or ''),
-                    "email": str(contributor_data['profile'].get('email', '') or ''),
-                    "bio": str(contributor_data['profile'].get('bio', '') or ''),
-                    "location": str(contributor_data['profile'].get('location', '') or ''),
-                    "company": str(contributor_data['profile'].get('company', '') or ''),
-                    "blog": str(contributor_data['profile'].get('blog', '') or ''),
-                    "twitter": str(contributor_data['profile'].get('twitter', '') or ''),
-                    "public_repos": int(contributor_data['profile'].get('public_repos', 0) or 0),
-                    "followers": int(contributor_data['profile'].get('followers', 0) or 0),
-                    "following": int(contributor_data['profile'].get('following', 0) or 0),
-                    "created_at": str(contributor_data['profile'].get('created_at', '') or ''),
-                    "avatar_url": str(contributor_data['profile'].get('avatar_url', '') or ''),
-                    "total_contributions": int(contributor_data.get('total_contributions', 0) or 0),
-                    "total_repositories": len(contributor_data.get('contributions', [])),
-                    "ai_summary": str(contributor_data.get('summary', '') or ''),
-                    "skill_recommendations": data.get('skill_recommendations', {}).get(username, []) or [],
-                    "tech_stack": contributor_data.get('tech_stack', []) or [],
-                    "expertise_level": str(contributor_data.get('expertise_level', 'intermediate') or 'intermediate'),
-                    "contribution_pattern": str(contributor_data.get('contribution_pattern', '') or ''),
-                }
-                
-                self.client.insert_data("Contributor", contributor_obj)
-                
-                # Insert skills data if available
-                if 'skills' in contributor_data:
-                    skills_data = contributor_data['skills']
-                    skills_obj = {
-                        "contributor_username": username,
-                        "technologies": skills_data.get('technologies', []),
-                        "frameworks": list(skills_data.get('frameworks', {}).keys()),
-                        "tools": skills_data.get('tools', []),
+            # Repositories already queued; a repo is shared by all of its contributors
+            seen_repos = set()
+            
+            # Process contributors, sending objects in bulk through one batch whose
+            # requests overlap on the worker threads while parsing continues
+            with self.client.batch(num_workers=INGEST_WORKERS) as insert:
+                for username, contributor_data in contributors:
+                    # Insert contributor profile
+                    profile = contributor_data['profile']
+                    contributor_obj = {
+                        "username": username,
+                        "name": _as_str(profile.get('name')),
+                        "email": _as_str(profile.get('email')),
+                        "bio": _as_str(profile.get('bio')),
+                        "location": _as_str(profile.get('location')),
+                        "company": _as_str(profile.get('company')),
+                        "blog": _as_str(profile.get('blog')),
+                        "twitter": _as_str(profile.get('twitter')),
+                        "public_repos": _as_int(profile.get('public_repos')),
+                        "followers": _as_int(profile.get('followers')),
+                        "following": _as_int(profile.get('following')),
+                        "created_at": _as_str(profile.get('created_at')),
+                        "avatar_url": _as_str(profile.get('avatar_url')),
+                        "total_contributions": _as_int(contributor_data.get('total_contributions')),
+                        "total_repositories": len(contributor_data.get('contributions', [])),
+                        "ai_summary": _as_str(contributor_data.get('summary')),
+                        "skill_recommendations": skill_recommendations.get(username, []) or [],
+                        "tech_stack": contributor_data.get('tech_stack', []) or [],
+                        "expertise_level": _as_str(contributor_data.get('expertise_level'), 'intermediate'),
+                        "contribution_pattern": _as_str(contributor_data.get('contribution_pattern')),
                     }
                     
-                    # Add programming language scores
-                    lang_scores = skills_data.get('programming_languages', {})
-                    for lang, score in lang_scores.items():
-                        lang_key = f"{lang.lower().replace(' ', '_').replace('#', 'sharp')}_score"
-                        if lang_key in ["python_score", "javascript_score", "go_score", "typescript_score", 
-                                       "dockerfile_score", "shell_score", "html_score", "css_score", 
-                                       "scala_score", "c_score", "ruby_score"]:
-                            skills_obj[lang_key] = float(score)
-                    
-                    # Add domain scores
-                    domain_scores = skills_data.get('domains', {})
-                    for domain, score in domain_scores.items():
-                        domain_key = domain.replace('-', '_')
-                        if domain_key in ["web_development", "machine_learning", "data_science", 
-                                         "devops", "cloud_computing", "database", "system_programming", 
-                                         "frontend", "backend", "testing"]:
-                            skills_obj[domain_key] = float(score)
-                    
-                    self.client.insert_data("Skills", skills_obj)
-                
-                # Insert contributions
-                for contribution in contributor_data.get('contributions', []):
-                    # Insert repository if not exists
-                    repo_obj = {
-                        "repo_name": str(contribution['repo_name']),
-                        "repo_full_name": str(contribution['repo_full_name']),
-                        "primary_language": str(contribution['primary_language'] or ''),
-                        "repo_description": str(contribution.get('repo_description', '') or ''),
-                        "repo_size": int(contribution.get('repo_size', 0) or 0),
-                        "stars": int(contribution.get('stars', 0) or 0),
-                        "forks": int(contribution.get('forks', 0) or 0),
-                        "topics": contribution.get('topics', []) or [],
-                        "languages": list(contribution.get('languages', {}).keys()) or [],
-                        "is_fork": bool(contribution.get('is_fork', False)),
-                        "license": str(contribution.get('license', '') or ''),
-                    }
+                    insert("Contributor", contributor_obj)
                     
-                    self.client.insert_data("Repository", repo_obj)
+                    # Insert skills data if available
+                    if 'skills' in contributor_data:
+                        skills_data = contributor_data['skills']
+                        skills_obj = {
+                            "contributor_username": username,
+                            "technologies": skills_data.get('technologies', []),
+                            "frameworks": list(skills_data.get('frameworks', {})),
+                            "tools": skills_data.get('tools', []),
+                        }
+                        
+                        # Add programming language scores
+                        lang_scores = skills_data.get('programming_languages', {})
+                        for lang, score in lang_scores.items():
+                            lang_key = f"{lang.lower().translate(_LANG_KEY_TABLE)}_score"
+                            if lang_key in _ALLOWED_LANG_KEYS:
+                                skills_obj[lang_key] = float(score)
+                        
+                        # Add domain scores
+                        domain_scores = skills_data.get('domains', {})
+                        for domain, score in domain_scores.items():
+                            domain_key = domain.replace('-', '_')
+                            if domain_key in _ALLOWED_DOMAIN_KEYS:
+                                skills_obj[domain_key] = float(score)
+                        
+                        insert("Skills", skills_obj)
                     
-                    # Insert contribution record
-                    contribution_obj = {
-                        "contributor_username": username,
-                        "repository_full_name": str(contribution['repo_full_name']),
-                        "contribution_count": int(contribution['contributions']),
-                        "primary_language": str(contribution['primary_language'] or ''),
-                        "contribution_type": "commits",
-                        "impact_score": float(contribution.get('impact_score', 0.5) or 0.5),
-                        "languages_used": list(contribution.get('languages', {}).keys()) or [],
-                        "files_changed": [],
-                        "commit_messages": "",
-                    }
+                    # Insert contributions
+                    for contribution in contributor_data.get('contributions', []):
+                        repo_full_name = str(contribution['repo_full_name'])
+                        languages = list(contribution.get('languages', {}))
+                        
+                        # Insert repository if not exists
+                        if repo_full_name not in seen_repos:
+                            seen_repos.add(repo_full_name)
+                            repo_obj = {
+                                "repo_name": str(contribution['repo_name']),
+                                "repo_full_name": repo_full_name,
+                                "primary_language": _as_str(contribution['primary_language']),
+                                "repo_description": _as_str(contribution.get('repo_description')),
+                                "repo_size": _as_int(contribution.get('repo_size')),
+                                "stars": _as_int(contribution.get('stars')),
+                                "forks": _as_int(contribution.get('forks')),
+                                "topics": contribution.get('topics', []) or [],
+                                "languages": languages,
+                                "is_fork": bool(contribution.get('is_fork', False)),
+                                "license": _as_str(contribution.get('license')),
+                            }
+                            
+                            insert("Repository", repo_obj)
+                        
+                        # Insert contribution record
+                        contribution_obj = {
+                            "contributor_username": username,
+                            "repository_full_name": repo_full_name,
+                            "contribution_count": int(contribution['contributions']),
+                            "primary_language": _as_str(contribution['primary_language']),
+                            "contribution_type": "commits",
+                            "impact_score": _as_float(contribution.get('impact_score'), 0.5),
+                            "languages_used": languages,
+                            "files_changed": [],
+                            "commit_messages": "",
+                        }
+                        
+                        insert("Contribution", contribution_obj)
                     
-                    self.client.insert_data("Contribution", contribution_obj)
+                    logger.info(f"Processed contributor: {username}")
                 
-                logger.info(f"Processed contributor: {username}")
-            
             logger.info("Data ingestion completed successfully")
             
         except Exception as e:
             logger.error(f"Failed to ingest data: {e}")
             raise
+    
+    def _iter_contributors(self, json_file_path: str):
+        """Yield (username, contributor data) pairs streamed from the organization dump."""
+        with open(json_file_path, 'rb') as f:
+            yield from ijson.kvitems(f, 'contributors', use_float=True)
+
+
+def _as_str(value: Any, default: str = '') -> str:
+    """Coerce a field to str, using ``default`` for missing or empty values."""
+    return str(value) if value else default
+
+
+def _as_int(value: Any, default: int = 0) -> int:
+    """Coerce a field to int, using ``default`` for missing or zero values."""
+    return int(value) if value else default
+
+
+def _as_float(value: Any, default: float = 0.0) -> float:
+    """Coerce a field to float, using ``default`` for missing or zero values."""
+    return float(value) if value else default
 
 
 def main():
     """Main function to create schema and ingest data."""
     try:
-        # Initialize enhanced schema
-        client = WeaviateClient()
+        # Initialize enhanced schema on the shared client, reusing its pooled HTTP session
+        client = weaviate_client or WeaviateClient()
         enhanced_schema = EnhancedWeaviateSchema(client)
         
         # Create enhanced schema
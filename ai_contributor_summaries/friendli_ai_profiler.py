@@ -1,277 +1,639 @@
 """FriendliAI integration for generating detailed contributor profiles."""
 
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, AsyncIterator, Awaitable, Iterable, Iterator, Callable, Tuple
 import json
 from datetime import datetime
 import asyncio
-from llama_index.llms.friendli import FriendliLLM
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from functools import lru_cache
+import hashlib
+import heapq
+import random
+import re
+import sqlite3
+import threading
+import time
+import httpx
 from utils.weaviate_client import WeaviateClient
 
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib encoder
+    orjson = None
+
+try:
+    import tiktoken
+except ImportError:  # estimate tokens from characters instead
+    tiktoken = None
+
 logger = logging.getLogger(__name__)
 
+# Sections of a generated profile, all returned by one JSON completion
+PROFILE_SECTIONS = (
+    "professional_summary",
+    "technical_expertise",
+    "contribution_analysis",
+    "strengths_recommendations",
+    "collaboration_style",
+    "career_trajectory",
+)
+
+# Output token budget of each section; collaboration and career sections need far less
+SECTION_MAX_TOKENS = {
+    "professional_summary": 400,
+    "technical_expertise": 700,
+    "contribution_analysis": 600,
+    "strengths_recommendations": 700,
+    "collaboration_style": 350,
+    "career_trajectory": 350,
+}
+
+# Completion budget: every section plus the JSON keys and punctuation around them
+PROFILE_MAX_TOKENS = sum(SECTION_MAX_TOKENS.values()) + 150
+
+# Token budget of the contributor context, bounding prompt prefill however verbose the data
+CONTEXT_MAX_TOKENS = 1500
+
+# Attempts per LLM request and the bounds of the jittered exponential backoff between them
+LLM_MAX_ATTEMPTS = 5
+LLM_BACKOFF_MIN_SECONDS = 1
+LLM_BACKOFF_MAX_SECONDS = 30
+
+# Model used for profile generation; part of the section cache key
+PROFILE_MODEL = "meta-llama/Llama-3.1-8B-Instruct"
+
+# Weaviate class holding skill-and-contribution embeddings of generated profiles for the
+# semantic cache, with their shared sections
+SEMANTIC_CACHE_CLASS = "CachedProfileSkillsEmbedding"
+
+# Cosine distance between skill-and-contribution contexts below which the shared sections
+# of a cached profile are reused; contexts come from one template, so only near-identical
+# work qualifies
+SEMANTIC_CACHE_MAX_DISTANCE = 0.02
+
+# Languages whose "<lang>_score" is read for a profile, in primary-language tie order
+LANG_KEYS = ("python", "javascript", "go", "typescript", "java", "c", "ruby", "shell")
+
+# Languages averaged for the expertise level; shell scripting is left out
+EXPERTISE_LANG_KEYS = LANG_KEYS[:-1]
+
+# Domain scores read for a profile, with their specialization labels
+DOMAIN_LABELS = {
+    "web_development": "Web Development",
+    "machine_learning": "Machine Learning",
+    "data_science": "Data Science",
+    "devops": "DevOps",
+    "cloud_computing": "Cloud Computing",
+    "database": "Database Systems",
+    "backend": "Backend Development",
+    "frontend": "Frontend Development",
+    "system_programming": "System Programming"
+}
+
+# Skill score keys listed in the profile context
+CONTEXT_LANG_KEYS = ("python", "javascript", "go", "typescript", "shell", "c", "ruby")
+CONTEXT_DOMAIN_KEYS = ("web_development", "machine_learning", "data_science", "devops",
+                       "cloud_computing", "database", "backend", "frontend")
+
+# What each profile section covers, as worded in the prompt
+SECTION_INSTRUCTIONS = {
+    "professional_summary": """2-3 paragraphs on overall expertise and experience level,
+          key programming languages and technologies, types of projects and contributions,
+          and professional strengths and unique value""",
+    "technical_expertise": """primary programming languages and proficiency levels,
+          technical domains and specialization areas, frameworks and tools, technology stack
+          preferences, and technical breadth vs depth""",
+    "contribution_analysis": """contribution frequency and consistency, types of repositories,
+          collaboration patterns, impact and influence within projects, and preferred project
+          types and domains""",
+    "strengths_recommendations": """top 5 technical strengths, top 3 professional strengths,
+          3-5 specific development recommendations, suggested learning paths, and potential
+          career advancement opportunities""",
+    "collaboration_style": """communication and collaboration patterns, leadership and
+          mentoring indicators, community involvement level, preferred working styles, and
+          team contribution approach""",
+    "career_trajectory": """career progression indicators, skill development patterns,
+          industry positioning, future potential and opportunities, and recommended career paths""",
+}
+
+# Sections written from skills and contributions alone, which the semantic cache may share
+# between contributors with near-identical work; the rest describe the person and are
+# always generated for the contributor themselves
+SHARED_SECTIONS = ("technical_expertise", "strengths_recommendations")
+IDENTITY_SECTIONS = tuple(section for section in PROFILE_SECTIONS if section not in SHARED_SECTIONS)
+
+
+def _profile_prompt_template(sections: Tuple[str, ...]) -> str:
+    """Build the completion prompt asking for ``sections``; only the context is left to fill in."""
+    fields = "".join(f'        - "{section}": {SECTION_INSTRUCTIONS[section]}\n' for section in sections)
+    shared = [f'"{section}"' for section in sections if section in SHARED_SECTIONS]
+    anonymous = (f"\n        Do not name the contributor in {' or '.join(shared)}.\n"
+                 if shared else "")
+    budgets = ", ".join(f"{section} {SECTION_MAX_TOKENS[section] * 3 // 4}" for section in sections)
+    # Static instructions come first and are free of per-run values, so provider-side
+    # prefix caching can reuse them; only the context varies
+    return (
+        "\n        Write a comprehensive contributor profile from the contributor data at the end.\n"
+        "\n        Return a JSON object with exactly these string fields:\n"
+        + fields + anonymous
+        + "\n        Keep each field within about this many words: " + budgets + "\n"
+        "\n        Contributor data:\n"
+        "\n        {context}\n"
+        "\n        Respond with the JSON object only:\n        "
+    )
+
+
+# Full profile prompt, and the prompt regenerating only the identity sections
+PROFILE_PROMPT_TEMPLATE = _profile_prompt_template(PROFILE_SECTIONS)
+IDENTITY_PROMPT_TEMPLATE = _profile_prompt_template(IDENTITY_SECTIONS)
+
+
+@dataclass
+class ContributorRecord:
+    """Contributor fields used for profiling, read once from a Weaviate object."""
+    # Slots are written out rather than dataclass(slots=True), which needs Python 3.10
+    __slots__ = ("username", "name", "location", "company", "bio", "public_repos", "followers",
+                 "total_contributions", "total_repositories")
+    username: str
+    name: str
+    location: str
+    company: str
+    bio: str
+    public_repos: int
+    followers: int
+    total_contributions: int
+    total_repositories: int
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ContributorRecord":
+        """Build a record from a Contributor object."""
+        return cls(
+            username=data.get("username", ""),
+            name=data.get("name", ""),
+            location=data.get("location", ""),
+            company=data.get("company", ""),
+            bio=data.get("bio", ""),
+            public_repos=data.get("public_repos", 0),
+            followers=data.get("followers", 0),
+            total_contributions=data.get("total_contributions", 0),
+            total_repositories=data.get("total_repositories", 0),
+        )
+
+
+@dataclass
+class SkillsRecord:
+    """A contributor's skill scores keyed by LANG_KEYS and DOMAIN_LABELS, plus sorted tool lists."""
+    __slots__ = ("lang_scores", "domain_scores", "technologies", "frameworks")
+    lang_scores: Dict[str, float]
+    domain_scores: Dict[str, float]
+    technologies: Tuple[str, ...]
+    frameworks: Tuple[str, ...]
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "SkillsRecord":
+        """Build a record from a Skills object, reading every score once."""
+        return cls(
+            lang_scores={lang: data.get(f"{lang}_score", 0) for lang in LANG_KEYS},
+            domain_scores={domain: data.get(domain, 0) for domain in DOMAIN_LABELS},
+            technologies=tuple(sorted(data.get("technologies") or ())),
+            frameworks=tuple(sorted(data.get("frameworks") or ())),
+        )
+
+
+@dataclass
+class ContributionRecord:
+    """One repository's contribution summary for a contributor."""
+    __slots__ = ("repository_full_name", "contribution_count", "primary_language")
+    repository_full_name: str
+    contribution_count: int
+    primary_language: str
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ContributionRecord":
+        """Build a record from a Contribution object."""
+        return cls(
+            repository_full_name=data.get("repository_full_name", ""),
+            contribution_count=data.get("contribution_count", 0),
+            primary_language=data.get("primary_language", ""),
+        )
+
+
+# Scores of a contributor without a Skills object
+NO_SKILLS = SkillsRecord.from_dict({})
+
+
+class ProfileSectionCache:
+    """SQLite-backed LRU cache of generated profile sections, keyed by prompt hash."""
+    
+    def __init__(self, path: str, max_entries: int = 10000):
+        """Open (or create) the cache database at ``path``."""
+        self.max_entries = max_entries
+        # The profiler calls in from worker threads (asyncio.to_thread) so the event loop never
+        # waits on disk; the lock serializes them on the shared connection
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS profile_sections "
+            "(key TEXT PRIMARY KEY, sections TEXT NOT NULL, used_at REAL NOT NULL)"
+        )
+        self.connection.commit()
+    
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Hash the parts that determine a completion into a cache key."""
+        digest = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+    
+    def get(self, key: str) -> Optional[Dict[str, str]]:
+        """Return the cached sections for ``key``, marking them recently used."""
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT sections FROM profile_sections WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            
+            self.connection.execute("UPDATE profile_sections SET used_at = ? WHERE key = ?", (time.time(), key))
+            self.connection.commit()
+        return json.loads(row[0])
+    
+    def put(self, key: str, sections: Dict[str, str]):
+        """Store sections under ``key``, evicting the least recently used beyond ``max_entries``."""
+        data = json.dumps(sections)
+        with self.lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO profile_sections (key, sections, used_at) VALUES (?, ?, ?)",
+                (key, data, time.time())
+            )
+            self.connection.execute(
+                "DELETE FROM profile_sections WHERE key NOT IN "
+                "(SELECT key FROM profile_sections ORDER BY used_at DESC LIMIT ?)",
+                (self.max_entries,)
+            )
+            self.connection.commit()
+
+
+class RequestRateLimiter:
+    """Space requests evenly so at most ``per_minute`` start in any minute."""
+    
+    def __init__(self, per_minute: int):
+        """Initialize the limiter for ``per_minute`` requests."""
+        self.interval = 60.0 / per_minute
+        self._next_slot = 0.0
+    
+    async def acquire(self):
+        """Wait for the next free request slot."""
+        # Claim the slot before awaiting; the event loop runs this atomically
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
 
 class FriendliAIProfiler:
     """Generate detailed contributor profiles using FriendliAI."""
     
-    def __init__(self, friendli_token: str, weaviate_client: WeaviateClient):
-        """Initialize FriendliAI profiler."""
+    def __init__(self, friendli_token: str, weaviate_client: WeaviateClient,
+                 max_concurrent_requests: int = 32,
+                 cache_path: Optional[str] = ".profile_cache.sqlite3",
+                 openai_api_key: Optional[str] = None,
+                 max_requests_per_minute: Optional[int] = None):
+        """Initialize FriendliAI profiler.
+        
+        ``max_concurrent_requests`` caps the LLM requests in flight while profiling
+        several contributors; each profile issues a single request. Generated sections
+        are cached on disk at ``cache_path`` (``None`` disables the cache), so unchanged
+        contributors are not sent to the LLM again. With ``openai_api_key``, skills and
+        contributions are also embedded, and contributors with near-identical work reuse
+        the shared sections of a cached profile from Weaviate.
+        ``max_requests_per_minute`` paces LLM requests to the provider's rate limit.
+        """
         self.friendli_token = friendli_token
         self.weaviate_client = weaviate_client
+        self.max_concurrent_requests = max_concurrent_requests
+        self.section_cache = ProfileSectionCache(cache_path) if cache_path else None
+        self.rate_limiter = RequestRateLimiter(max_requests_per_minute) if max_requests_per_minute else None
+        self.embedding_model = None
+        self._semantic_cache_ready = False
+        self._schema_ready = False
+        
+        if openai_api_key:
+            from llama_index.embeddings.openai import OpenAIEmbedding
+            self.embedding_model = OpenAIEmbedding(
+                api_key=openai_api_key,
+                model="text-embedding-3-small"
+            )
         
         # Initialize FriendliAI LLM
+        from llama_index.llms.friendli import FriendliLLM
         self.llm = FriendliLLM(
-            model="meta-llama/Llama-3.1-8B-Instruct",
+            model=PROFILE_MODEL,
             token=friendli_token,
-            max_tokens=2000,
+            max_tokens=PROFILE_MAX_TOKENS,  # Sum of the per-section budgets
             temperature=0.3  # Lower temperature for more factual profiles
         )
         
         logger.info("FriendliAI profiler initialized successfully")
     
-    def generate_contributor_profile(self, contributor_data: Dict, skills_data: Dict, 
-                                   contributions_data: List[Dict]) -> Dict:
-        """Generate comprehensive contributor profile."""
+    async def generate_contributor_profile(self, contributor_data: Dict, skills_data: Dict, 
+                                         contributions_data: List[Dict],
+                                         generated_at: Optional[str] = None) -> Dict:
+        """Generate comprehensive contributor profile.
+        
+        ``generated_at`` is the ISO timestamp to record, shared by a batch of profiles;
+        it defaults to the current time.
+        """
+        return await self._generate_profile(
+            ContributorRecord.from_dict(contributor_data),
+            SkillsRecord.from_dict(skills_data) if skills_data else None,
+            [ContributionRecord.from_dict(contrib) for contrib in contributions_data],
+            generated_at
+        )
+    
+    async def _generate_profile(self, contributor: ContributorRecord, skills: Optional[SkillsRecord],
+                                contributions: List[ContributionRecord],
+                                generated_at: Optional[str] = None) -> Dict:
+        """Generate a profile from typed records; ``skills`` is None without a Skills object."""
         try:
-            # Prepare context for AI
-            context = self._prepare_contributor_context(contributor_data, skills_data, contributions_data)
-            
-            # Generate profile sections
-            profile_sections = {}
-            
-            # Generate professional summary
-            profile_sections["professional_summary"] = self._generate_professional_summary(context)
+            scores = skills if skills is not None else NO_SKILLS
             
-            # Generate technical expertise
-            profile_sections["technical_expertise"] = self._generate_technical_expertise(context)
+            # Sum the fetched contributions once for both assessors
+            contributed = sum(contrib.contribution_count for contrib in contributions)
+            repo_count = len(contributions)
             
-            # Generate contribution analysis
-            profile_sections["contribution_analysis"] = self._generate_contribution_analysis(context)
-            
-            # Generate strengths and recommendations
-            profile_sections["strengths_recommendations"] = self._generate_strengths_recommendations(context)
-            
-            # Generate collaboration style
-            profile_sections["collaboration_style"] = self._generate_collaboration_style(context)
+            # Prepare context for AI
+            work_context = self._prepare_work_context(skills, contributions)
+            context = _truncate_context(self._prepare_contributor_context(contributor, skills, contributions))
             
-            # Generate career trajectory
-            profile_sections["career_trajectory"] = self._generate_career_trajectory(context)
+            # Generate all profile sections in one request, sending the context once
+            profile_sections = await self._generate_all_sections(context, contributor, work_context)
             
             # Compile comprehensive profile
             comprehensive_profile = {
-                "username": contributor_data.get("username", ""),
-                "generated_at": datetime.now().isoformat(),
+                "username": contributor.username,
+                "generated_at": generated_at or datetime.now().isoformat(),
                 "profile_sections": profile_sections,
                 "metadata": {
-                    "total_contributions": contributor_data.get("total_contributions", 0),
-                    "total_repositories": contributor_data.get("total_repositories", 0),
-                    "primary_languages": self._extract_primary_languages(skills_data),
-                    "expertise_level": self._assess_expertise_level(skills_data, contributions_data),
-                    "activity_level": self._assess_activity_level(contributions_data),
-                    "specialization_areas": self._identify_specialization_areas(skills_data)
+                    "total_contributions": contributor.total_contributions,
+                    "total_repositories": contributor.total_repositories,
+                    "primary_languages": self._extract_primary_languages(scores.lang_scores),
+                    "expertise_level": self._assess_expertise_level(scores.lang_scores, contributed),
+                    "activity_level": self._assess_activity_level(contributed, repo_count),
+                    "specialization_areas": self._identify_specialization_areas(scores.domain_scores)
                 }
             }
             
-            logger.info(f"Generated comprehensive profile for {contributor_data.get('username', '')}")
+            logger.info(f"Generated comprehensive profile for {contributor.username}")
             return comprehensive_profile
             
         except Exception as e:
             logger.error(f"Failed to generate contributor profile: {e}")
             raise
     
-    def _prepare_contributor_context(self, contributor_data: Dict, skills_data: Dict, 
-                                   contributions_data: List[Dict]) -> str:
+    def _prepare_contributor_context(self, contributor: ContributorRecord, skills: Optional[SkillsRecord],
+                                   contributions: List[ContributionRecord]) -> str:
         """Prepare context string for AI processing."""
-        context_parts = []
-        
-        # Basic profile information
-        context_parts.append(f"CONTRIBUTOR PROFILE:")
-        context_parts.append(f"Username: {contributor_data.get('username', '')}")
-        context_parts.append(f"Name: {contributor_data.get('name', '')}")
-        context_parts.append(f"Location: {contributor_data.get('location', '')}")
-        context_parts.append(f"Company: {contributor_data.get('company', '')}")
-        context_parts.append(f"Bio: {contributor_data.get('bio', '')}")
-        context_parts.append(f"Public Repositories: {contributor_data.get('public_repos', 0)}")
-        context_parts.append(f"Followers: {contributor_data.get('followers', 0)}")
-        context_parts.append(f"Total Contributions: {contributor_data.get('total_contributions', 0)}")
-        
-        # Skills information
-        if skills_data:
-            context_parts.append(f"\\nSKILLS ASSESSMENT:")
-            context_parts.append(f"Programming Languages:")
-            for lang in ["python", "javascript", "go", "typescript", "shell", "c", "ruby"]:
-                score = skills_data.get(f"{lang}_score", 0)
-                if score > 0:
-                    context_parts.append(f"  - {lang.title()}: {score:.2f}")
-            
-            context_parts.append(f"Domain Expertise:")
-            for domain in ["web_development", "machine_learning", "data_science", "devops", 
-                          "cloud_computing", "database", "backend", "frontend"]:
-                score = skills_data.get(domain, 0)
-                if score > 0:
-                    context_parts.append(f"  - {domain.replace('_', ' ').title()}: {score:.2f}")
-            
-            context_parts.append(f"Technologies: {', '.join(skills_data.get('technologies', []))}")
-            context_parts.append(f"Frameworks: {', '.join(skills_data.get('frameworks', []))}")
-        
-        # Contributions information
-        if contributions_data:
-            context_parts.append(f"\\nCONTRIBUTIONS:")
-            for contrib in contributions_data[:10]:  # Limit to top 10
-                context_parts.append(f"  - {contrib.get('repository_full_name', '')}: "
-                                   f"{contrib.get('contribution_count', 0)} contributions "
-                                   f"({contrib.get('primary_language', '')})")
-        
-        return "\\n".join(context_parts)
-    
-    def _generate_professional_summary(self, context: str) -> str:
-        """Generate professional summary."""
-        prompt = f"""
-        Based on the following contributor data, generate a professional summary (2-3 paragraphs) 
-        that highlights their key strengths, expertise, and professional identity:
-
-        {context}
-
-        Focus on:
-        - Overall technical expertise and experience level
-        - Key programming languages and technologies
-        - Types of projects and contributions
-        - Professional strengths and unique value
-
-        Generate a compelling professional summary:
-        """
+        context = (
+            f"CONTRIBUTOR PROFILE:\n"
+            f"Username: {contributor.username}\n"
+            f"Name: {contributor.name}\n"
+            f"Location: {contributor.location}\n"
+            f"Company: {contributor.company}\n"
+            f"Bio: {contributor.bio}\n"
+            f"Public Repositories: {contributor.public_repos}\n"
+            f"Followers: {contributor.followers}\n"
+            f"Total Contributions: {contributor.total_contributions}"
+        )
         
-        response = self.llm.complete(prompt)
-        return str(response).strip()
+        work_context = self._prepare_work_context(skills, contributions)
+        if work_context:
+            context += "\n\n" + work_context
+        
+        return context
     
-    def _generate_technical_expertise(self, context: str) -> str:
-        """Generate technical expertise analysis."""
-        prompt = f"""
-        Based on the following contributor data, analyze their technical expertise:
-
-        {context}
-
-        Provide a detailed analysis covering:
-        - Primary programming languages and proficiency levels
-        - Technical domains and specialization areas
-        - Frameworks and tools expertise
-        - Technology stack preferences
-        - Technical breadth vs depth assessment
-
-        Generate a comprehensive technical expertise analysis:
-        """
+    def _prepare_work_context(self, skills: Optional[SkillsRecord],
+                              contributions: List[ContributionRecord]) -> str:
+        """Prepare the skills and contributions part of the context, which names no one."""
+        parts = []
         
-        response = self.llm.complete(prompt)
-        return str(response).strip()
+        # Skills information, listing only non-zero scores
+        if skills is not None:
+            lang_lines = "".join(
+                f"\n  - {lang.title()}: {score:.2f}" for lang in CONTEXT_LANG_KEYS
+                if (score := skills.lang_scores[lang]) > 0
+            )
+            domain_lines = "".join(
+                f"\n  - {domain.replace('_', ' ').title()}: {score:.2f}" for domain in CONTEXT_DOMAIN_KEYS
+                if (score := skills.domain_scores[domain]) > 0
+            )
+            parts.append(
+                f"SKILLS ASSESSMENT:\n"
+                f"Programming Languages:{lang_lines}\n"
+                f"Domain Expertise:{domain_lines}\n"
+                f"Technologies: {', '.join(skills.technologies)}\n"
+                f"Frameworks: {', '.join(skills.frameworks)}"
+            )
+        
+        # Contributions information, limited to the top 10; lists are put in a fixed order
+        # so the same contributor always yields the same prompt, whatever order Weaviate returns
+        if contributions:
+            top_contributions = heapq.nsmallest(
+                10, contributions,
+                key=lambda c: (-c.contribution_count, c.repository_full_name)
+            )
+            parts.append("CONTRIBUTIONS:" + "".join(
+                f"\n  - {contrib.repository_full_name}: "
+                f"{contrib.contribution_count} contributions "
+                f"({contrib.primary_language})"
+                for contrib in top_contributions
+            ))
+        
+        return "\n\n".join(parts)
     
-    def _generate_contribution_analysis(self, context: str) -> str:
-        """Generate contribution pattern analysis."""
-        prompt = f"""
-        Based on the following contributor data, analyze their contribution patterns:
-
-        {context}
-
-        Analyze:
-        - Contribution frequency and consistency
-        - Types of repositories they contribute to
-        - Collaboration patterns
-        - Impact and influence within projects
-        - Preferred project types and domains
-
-        Generate a detailed contribution analysis:
+    async def _generate_all_sections(self, context: str, contributor: ContributorRecord,
+                                     work_context: str = "") -> Dict[str, str]:
+        """Generate every profile section with a single structured completion.
+        
+        Looks in the exact-match cache first, then the semantic cache, before asking the LLM.
+        A semantic hit only supplies SHARED_SECTIONS; the identity sections are still
+        generated for this contributor, with a smaller completion.
         """
+        prompt = PROFILE_PROMPT_TEMPLATE.format_map({"context": context})
+        
+        cache_key = ProfileSectionCache.make_key(PROFILE_MODEL, prompt)
+        if self.section_cache is not None:
+            cached = await asyncio.to_thread(self.section_cache.get, cache_key)
+            if cached is not None:
+                return cached
         
-        response = self.llm.complete(prompt)
-        return str(response).strip()
+        # Only the work is embedded: names, companies and bios would make contexts look alike
+        # or apart for reasons that say nothing about the shareable sections
+        embedding = None
+        shared = None
+        if self.embedding_model is not None and work_context:
+            # The semantic cache is best-effort; a failed embedding or lookup is a cache miss
+            try:
+                embedding = await self.embedding_model.aget_text_embedding(work_context)
+                shared = await self._find_similar_sections(embedding, contributor.username)
+            except Exception as e:
+                logger.warning(f"Semantic cache lookup failed for {contributor.username}: {e}")
+                embedding = None
+            if shared is not None:
+                identity_prompt = IDENTITY_PROMPT_TEMPLATE.format_map({"context": context})
+                _, identity = await self._complete_with_retry(identity_prompt, IDENTITY_SECTIONS)
+                if identity is not None:
+                    sections = {section: shared[section] if section in SHARED_SECTIONS else identity[section]
+                                for section in PROFILE_SECTIONS}
+                    if self.section_cache is not None:
+                        await asyncio.to_thread(self.section_cache.put, cache_key, sections)
+                    return sections
+        
+        response, sections = await self._complete_with_retry(prompt)
+        
+        # An unparseable response is not cached, so the next run asks again
+        if sections is None:
+            logger.warning("Profile response was not a JSON object; keeping it as the summary")
+            return {section: response.strip() if section == "professional_summary" else ""
+                    for section in PROFILE_SECTIONS}
+        
+        if self.section_cache is not None:
+            await asyncio.to_thread(self.section_cache.put, cache_key, sections)
+        if embedding is not None:
+            await asyncio.to_thread(self._store_embedding, cache_key, contributor, sections, embedding)
+        return sections
     
-    def _generate_strengths_recommendations(self, context: str) -> str:
-        """Generate strengths and development recommendations."""
-        prompt = f"""
-        Based on the following contributor data, identify their key strengths and provide 
-        development recommendations:
-
-        {context}
-
-        Provide:
-        - Top 5 technical strengths
-        - Top 3 professional strengths
-        - 3-5 specific development recommendations
-        - Suggested learning paths or skill improvements
-        - Potential career advancement opportunities
-
-        Generate strengths and recommendations:
+    async def _complete_with_retry(self, prompt: str, sections: Tuple[str, ...] = PROFILE_SECTIONS):
+        """Run the profile completion, retrying rate limits and transient failures with backoff."""
+        for attempt in range(1, LLM_MAX_ATTEMPTS + 1):
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire()
+            
+            try:
+                return await self._stream_profile_completion(prompt, sections)
+            except Exception as e:
+                if attempt == LLM_MAX_ATTEMPTS or not _is_transient_error(e):
+                    raise
+                
+                # Full jitter keeps concurrent profiles from retrying in lockstep
+                delay = max(LLM_BACKOFF_MIN_SECONDS,
+                            random.uniform(0, min(LLM_BACKOFF_MAX_SECONDS, 2 ** attempt)))
+                logger.warning(f"LLM request failed ({e}); retrying in {delay:.1f}s "
+                               f"(attempt {attempt}/{LLM_MAX_ATTEMPTS})")
+                await asyncio.sleep(delay)
+    
+    async def _stream_profile_completion(self, prompt: str, sections: Tuple[str, ...] = PROFILE_SECTIONS):
+        """Stream the profile completion, stopping as soon as the JSON object is complete.
+        
+        Returns the text received and its parsed ``sections`` (None if it holds no JSON object).
         """
+        stream = await self.llm.astream_complete(prompt)
+        response = ""
+        parsed = None
+        try:
+            async for chunk in stream:
+                delta = chunk.delta or ""
+                response += delta
+                # Only a closing brace can complete the object; skip decoding trailing prose
+                if "}" in delta:
+                    parsed = _parse_profile_sections(response, sections)
+                    if parsed is not None:
+                        break
+        finally:
+            await stream.aclose()
         
-        response = self.llm.complete(prompt)
-        return str(response).strip()
+        return response, parsed
     
-    def _generate_collaboration_style(self, context: str) -> str:
-        """Generate collaboration style analysis."""
-        prompt = f"""
-        Based on the following contributor data, analyze their collaboration style:
-
-        {context}
-
-        Analyze:
-        - Communication and collaboration patterns
-        - Leadership and mentoring indicators
-        - Community involvement level
-        - Preferred working styles
-        - Team contribution approach
-
-        Generate a collaboration style analysis:
-        """
+    async def _find_similar_sections(self, embedding: List[float], username: str) -> Optional[Dict[str, str]]:
+        """Return the SHARED_SECTIONS of the profile with the nearest work, if close enough."""
+        await asyncio.to_thread(self._ensure_semantic_cache_class)
+        matches = await asyncio.to_thread(
+            self.weaviate_client.search_by_vector,
+            SEMANTIC_CACHE_CLASS, ["username", "sections_json"], embedding
+        )
+        if not matches or matches[0].get("distance", 1.0) >= SEMANTIC_CACHE_MAX_DISTANCE:
+            return None
+        
+        cached_username = matches[0].get("username") or ""
+        cached = json.loads(matches[0]["sections_json"])
+        if any(not cached.get(section) for section in SHARED_SECTIONS):
+            return None
+        shared = {section: cached[section] for section in SHARED_SECTIONS}
+        
+        # Stored sections are checked for the contributor's identity, but never hand out
+        # text naming someone else
+        if cached_username != username and _mentions_any(shared.values(), (cached_username,)):
+            return None
         
-        response = self.llm.complete(prompt)
-        return str(response).strip()
+        logger.info(f"Reusing the shared profile sections of {cached_username} for {username}")
+        return shared
     
-    def _generate_career_trajectory(self, context: str) -> str:
-        """Generate career trajectory analysis."""
-        prompt = f"""
-        Based on the following contributor data, analyze their career trajectory and potential:
-
-        {context}
-
-        Analyze:
-        - Career progression indicators
-        - Skill development patterns
-        - Industry positioning
-        - Future potential and opportunities
-        - Recommended career paths
-
-        Generate a career trajectory analysis:
+    def _store_embedding(self, context_hash: str, contributor: ContributorRecord,
+                         sections: Dict[str, str], embedding: List[float]):
+        """Store a profile's shared sections with its work embedding for the semantic cache.
+        
+        Sections mentioning the contributor's username, name, company or location are
+        not shareable and are left out of the cache.
         """
+        shared = {section: sections.get(section, "") for section in SHARED_SECTIONS}
+        if any(not text for text in shared.values()) or _mentions_any(
+                shared.values(), (contributor.username, contributor.name,
+                                  contributor.company, contributor.location)):
+            return
         
-        response = self.llm.complete(prompt)
-        return str(response).strip()
+        self._ensure_semantic_cache_class()
+        try:
+            self.weaviate_client.insert_data(SEMANTIC_CACHE_CLASS, {
+                "context_hash": context_hash,
+                "username": contributor.username,
+                "sections_json": json.dumps(shared),
+            }, vector=embedding)
+        except Exception as e:
+            logger.warning(f"Failed to cache profile embedding for {contributor.username}: {e}")
     
-    def _extract_primary_languages(self, skills_data: Dict) -> List[str]:
-        """Extract primary programming languages."""
-        if not skills_data:
-            return []
+    def _ensure_semantic_cache_class(self):
+        """Create the semantic cache class once; vectors are supplied by the profiler."""
+        if self._semantic_cache_ready:
+            return
         
-        languages = []
-        for lang in ["python", "javascript", "go", "typescript", "java", "c", "ruby", "shell"]:
-            score = skills_data.get(f"{lang}_score", 0)
-            if score > 0.3:  # Threshold for primary language
-                languages.append(lang.title())
-        
-        return sorted(languages, key=lambda x: skills_data.get(f"{x.lower()}_score", 0), reverse=True)
+        # The semantic cache is best-effort; a failure here only means a cache miss
+        try:
+            schema = self.weaviate_client.client.schema
+            if not schema.exists(SEMANTIC_CACHE_CLASS):
+                schema.create_class({
+                    "class": SEMANTIC_CACHE_CLASS,
+                    "description": "Skill and contribution embeddings of generated contributor profiles",
+                    "vectorizer": "none",
+                    "vectorIndexConfig": {"distance": "cosine"},
+                    "properties": [
+                        {"name": "context_hash", "dataType": ["string"], "description": "Hash of the profile prompt"},
+                        {"name": "username", "dataType": ["string"], "description": "Profiled contributor username"},
+                        {"name": "sections_json", "dataType": ["text"], "description": "Shared profile sections as JSON"},
+                    ]
+                })
+                logger.info(f"Created {SEMANTIC_CACHE_CLASS} schema")
+        except Exception as e:
+            logger.warning(f"Failed to prepare {SEMANTIC_CACHE_CLASS} schema: {e}")
+            return
+        self._semantic_cache_ready = True
+    
+    def _extract_primary_languages(self, lang_scores: Dict[str, float]) -> List[str]:
+        """Extract primary programming languages, strongest first."""
+        # Threshold for primary language; sorted() is stable, so ties keep LANG_KEYS order
+        languages = [lang for lang in LANG_KEYS if lang_scores[lang] > 0.3]
+        return [lang.title() for lang in sorted(languages, key=lang_scores.__getitem__, reverse=True)]
     
-    def _assess_expertise_level(self, skills_data: Dict, contributions_data: List[Dict]) -> str:
+    def _assess_expertise_level(self, lang_scores: Dict[str, float], total_contributions: int) -> str:
         """Assess overall expertise level."""
-        if not skills_data or not contributions_data:
-            return "beginner"
-        
-        # Calculate average skill scores
-        skill_scores = []
-        for lang in ["python", "javascript", "go", "typescript", "java", "c", "ruby"]:
-            score = skills_data.get(f"{lang}_score", 0)
-            if score > 0:
-                skill_scores.append(score)
-        
+        # Average the non-zero language scores
+        skill_scores = [score for lang in EXPERTISE_LANG_KEYS if (score := lang_scores[lang]) > 0]
         avg_skill_score = sum(skill_scores) / len(skill_scores) if skill_scores else 0
-        total_contributions = sum(contrib.get("contribution_count", 0) for contrib in contributions_data)
         
         if avg_skill_score > 0.7 and total_contributions > 100:
             return "expert"
@@ -282,14 +644,11 @@ class FriendliAIProfiler:
         else:
             return "beginner"
     
-    def _assess_activity_level(self, contributions_data: List[Dict]) -> str:
-        """Assess activity level."""
-        if not contributions_data:
+    def _assess_activity_level(self, total_contributions: int, repo_count: int) -> str:
+        """Assess activity level from the contribution total over ``repo_count`` repositories."""
+        if not repo_count:
             return "inactive"
         
-        total_contributions = sum(contrib.get("contribution_count", 0) for contrib in contributions_data)
-        repo_count = len(contributions_data)
-        
         if total_contributions > 200 and repo_count > 10:
             return "very_active"
         elif total_contributions > 100 and repo_count > 5:
@@ -299,80 +658,23 @@ class FriendliAIProfiler:
         else:
             return "occasional"
     
-    def _identify_specialization_areas(self, skills_data: Dict) -> List[str]:
+    def _identify_specialization_areas(self, domain_scores: Dict[str, float]) -> List[str]:
         """Identify areas of specialization."""
-        if not skills_data:
-            return []
-        
-        specializations = []
         domain_threshold = 0.6
-        
-        domain_mapping = {
-            "web_development": "Web Development",
-            "machine_learning": "Machine Learning",
-            "data_science": "Data Science",
-            "devops": "DevOps",
-            "cloud_computing": "Cloud Computing",
-            "database": "Database Systems",
-            "backend": "Backend Development",
-            "frontend": "Frontend Development",
-            "system_programming": "System Programming"
-        }
-        
-        for domain, label in domain_mapping.items():
-            score = skills_data.get(domain, 0)
-            if score > domain_threshold:
-                specializations.append(label)
-        
-        return specializations
+        return [label for domain, label in DOMAIN_LABELS.items() if domain_scores[domain] > domain_threshold]
     
-    def process_top_contributors(self, limit: int = 20) -> List[Dict]:
+    async def process_top_contributors(self, limit: int = 20) -> List[Dict]:
         """Process top contributors and generate profiles."""
         try:
-            logger.info(f"Processing top {limit} contributors")
-            
-            # Get top contributors
-            contributors = self.weaviate_client.query_data("Contributor", limit=limit)
-            
-            # Sort by total contributions
-            sorted_contributors = sorted(
-                contributors, 
-                key=lambda x: x.get("total_contributions", 0), 
-                reverse=True
-            )
+            jobs = await self._profile_jobs(limit)
+            results = await asyncio.gather(*(job for _, job in jobs), return_exceptions=True)
             
             processed_profiles = []
-            
-            for contributor in sorted_contributors[:limit]:
-                try:
-                    username = contributor.get("username", "")
-                    
-                    # Get skills data
-                    skills_filter = {
-                        "path": ["contributor_username"],
-                        "operator": "Equal",
-                        "valueString": username
-                    }
-                    skills_data = self.weaviate_client.query_data("Skills", where_filter=skills_filter)
-                    skills = skills_data[0] if skills_data else {}
-                    
-                    # Get contributions data
-                    contrib_filter = {
-                        "path": ["contributor_username"],
-                        "operator": "Equal",
-                        "valueString": username
-                    }
-                    contributions_data = self.weaviate_client.query_data("Contribution", where_filter=contrib_filter)
-                    
-                    # Generate profile
-                    profile = self.generate_contributor_profile(contributor, skills, contributions_data)
-                    processed_profiles.append(profile)
-                    
-                    logger.info(f"Generated profile for {username}")
-                    
-                except Exception as e:
-                    logger.error(f"Failed to process contributor {contributor.get('username', '')}: {e}")
+            for (contributor, _), result in zip(jobs, results):
+                if isinstance(result, BaseException):
+                    logger.error(f"Failed to process contributor {contributor.username}: {result}")
                     continue
+                processed_profiles.append(result)
             
             logger.info(f"Successfully processed {len(processed_profiles)} contributor profiles")
             return processed_profiles
@@ -381,10 +683,185 @@ class FriendliAIProfiler:
             logger.error(f"Failed to process top contributors: {e}")
             raise
     
-    def save_profiles_to_weaviate(self, profiles: List[Dict]):
+    async def stream_profiles(self, limit: int = 20) -> AsyncIterator[Dict]:
+        """Generate top contributor profiles, yielding each one as soon as it is ready.
+        
+        Profiles arrive in completion order rather than contribution order.
+        """
+        try:
+            jobs = await self._profile_jobs(limit)
+            pending = {asyncio.ensure_future(job): contributor for contributor, job in jobs}
+        except Exception as e:
+            logger.error(f"Failed to process top contributors: {e}")
+            raise
+        
+        processed = 0
+        try:
+            while pending:
+                done, _ = await asyncio.wait(set(pending), return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    contributor = pending.pop(task)
+                    if task.exception() is not None:
+                        logger.error(f"Failed to process contributor {contributor.username}: {task.exception()}")
+                        continue
+                    processed += 1
+                    yield task.result()
+        finally:
+            # The consumer may stop early; don't leave profiles generating in the background
+            for task in pending:
+                task.cancel()
+        
+        logger.info(f"Successfully processed {processed} contributor profiles")
+    
+    async def _profile_jobs(self, limit: int) -> List[Tuple[ContributorRecord, Awaitable[Dict]]]:
+        """Fetch the top contributors' data and pair each contributor with its profile coroutine."""
+        logger.info(f"Processing top {limit} contributors")
+        
+        # Get top contributors
+        contributors = [ContributorRecord.from_dict(contributor)
+                        for contributor in self.weaviate_client.query_data("Contributor", limit=limit)]
+        
+        # Sort by total contributions
+        sorted_contributors = sorted(
+            contributors, 
+            key=lambda x: x.total_contributions, 
+            reverse=True
+        )
+        
+        top_contributors = sorted_contributors[:limit]
+        usernames = [contributor.username for contributor in top_contributors]
+        
+        # Fetch skills and contributions for every contributor in two queries
+        skills_by_user, contributions_by_user = await asyncio.gather(
+            asyncio.to_thread(self._fetch_skills, usernames),
+            asyncio.to_thread(self._fetch_contributions, usernames)
+        )
+        
+        # Profiles of one run share a generation timestamp
+        generated_at = datetime.now().isoformat()
+        
+        # Profile contributors concurrently, with at most max_concurrent_requests in flight
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        
+        async def process_contributor(contributor: ContributorRecord) -> Dict:
+            async with semaphore:
+                return await self._process_contributor(
+                    contributor,
+                    skills_by_user.get(contributor.username),
+                    contributions_by_user.get(contributor.username, []),
+                    generated_at
+                )
+        
+        return [(contributor, process_contributor(contributor)) for contributor in top_contributors]
+    
+    def _fetch_skills(self, usernames: List[str]) -> Dict[str, SkillsRecord]:
+        """Fetch the skills record of each contributor with one ContainsAny query."""
+        if not usernames:
+            return {}
+        
+        skills_filter = {
+            "path": ["contributor_username"],
+            "operator": "ContainsAny",
+            "valueStringArray": usernames
+        }
+        skills_by_user = {}
+        for skills in self.weaviate_client.query_data("Skills", where_filter=skills_filter,
+                                                      limit=len(usernames)):
+            username = skills.get("contributor_username", "")
+            if username not in skills_by_user:
+                skills_by_user[username] = SkillsRecord.from_dict(skills)
+        return skills_by_user
+    
+    def _fetch_contributions(self, usernames: List[str],
+                             per_contributor: int = 100) -> Dict[str, List[ContributionRecord]]:
+        """Fetch contributions grouped by contributor with one ContainsAny query.
+        
+        Keeps at most ``per_contributor`` records each, the limit of the former per-user query.
+        The shared query is capped at ``per_contributor`` rows per user, so prolific
+        contributors can crowd out the rest; when it comes back full, contributors left
+        short are fetched again with a query of their own.
+        """
+        if not usernames:
+            return {}
+        
+        contrib_filter = {
+            "path": ["contributor_username"],
+            "operator": "ContainsAny",
+            "valueStringArray": usernames
+        }
+        limit = per_contributor * len(usernames)
+        rows = self.weaviate_client.query_data("Contribution", where_filter=contrib_filter, limit=limit)
+        
+        contributions_by_user = defaultdict(list)
+        for contribution in rows:
+            user_contributions = contributions_by_user[contribution.get("contributor_username", "")]
+            if len(user_contributions) < per_contributor:
+                user_contributions.append(ContributionRecord.from_dict(contribution))
+        
+        if len(rows) >= limit:
+            for username in usernames:
+                if len(contributions_by_user[username]) >= per_contributor:
+                    continue
+                user_filter = {"path": ["contributor_username"], "operator": "Equal", "valueString": username}
+                contributions_by_user[username] = [
+                    ContributionRecord.from_dict(contribution)
+                    for contribution in self.weaviate_client.query_data(
+                        "Contribution", where_filter=user_filter, limit=per_contributor)
+                ]
+        
+        return contributions_by_user
+    
+    async def _process_contributor(self, contributor: ContributorRecord, skills: Optional[SkillsRecord],
+                                   contributions: List[ContributionRecord], generated_at: str) -> Dict:
+        """Generate the profile of a contributor from their prefetched skills and contributions."""
+        # Generate profile
+        profile = await self._generate_profile(contributor, skills, contributions, generated_at)
+        
+        logger.info(f"Generated profile for {contributor.username}")
+        return profile
+    
+    def save_profiles_to_weaviate(self, profiles: Iterable[Dict]):
         """Save generated profiles back to Weaviate."""
         try:
-            # Create ContributorProfile schema if it doesn't exist
+            with self._profile_saver() as save:
+                for profile in profiles:
+                    save(profile)
+            
+        except Exception as e:
+            logger.error(f"Failed to save profiles: {e}")
+            raise
+    
+    async def save_profile_stream(self, limit: int = 20, jsonl_path: Optional[str] = None) -> int:
+        """Generate top contributor profiles and persist each one as soon as it is ready.
+        
+        Profiles are queued into a Weaviate batch and, with ``jsonl_path``, written to that
+        file one JSON object per line, so no run holds every profile in memory and a crash
+        keeps the profiles finished so far. Returns the number of profiles generated.
+        """
+        saved = 0
+        try:
+            with self._profile_saver() as save, \
+                    (open(jsonl_path, "wb") if jsonl_path else nullcontext()) as out:
+                async for profile in self.stream_profiles(limit):
+                    save(profile)
+                    if out is not None:
+                        out.write(_dumps_profile(profile) + b"\n")
+                    saved += 1
+            
+        except Exception as e:
+            logger.error(f"Failed to save profiles: {e}")
+            raise
+        
+        return saved
+    
+    @contextmanager
+    def _profile_saver(self) -> Iterator[Callable[[Dict], None]]:
+        """Yield a ``save(profile)`` function queueing profiles into one Weaviate batch.
+        
+        Profiles that cannot be built or that Weaviate rejects are logged and counted on exit.
+        """
+        # Create the ContributorProfile schema on the first save only; later saves skip the check
+        if not self._schema_ready:
             profile_schema = {
                 "class": "ContributorProfile",
                 "description": "AI-generated comprehensive contributor profiles",
@@ -406,14 +883,29 @@ class FriendliAIProfiler:
                 ]
             }
             
-            try:
-                self.weaviate_client.client.schema.create_class(profile_schema)
+            schema = self.weaviate_client.client.schema
+            if not schema.exists("ContributorProfile"):
+                schema.create_class(profile_schema)
                 logger.info("Created ContributorProfile schema")
-            except Exception as e:
-                logger.info(f"ContributorProfile schema might already exist: {e}")
-            
-            # Save profiles
-            for profile in profiles:
+            self._schema_ready = True
+        
+        # Profiles that could not be built or that Weaviate rejected
+        failed_usernames = []
+        queued = 0
+        
+        def collect_failures(results: List[Dict]):
+            for result in results or []:
+                errors = (result.get("result") or {}).get("errors")
+                if errors:
+                    username = (result.get("properties") or {}).get("username", "")
+                    logger.error(f"Failed to save profile for {username}: {errors}")
+                    failed_usernames.append(username)
+        
+        # Save profiles in bulk rather than one request each
+        with self.weaviate_client.batch(callback=collect_failures) as insert:
+            def save(profile: Dict):
+                nonlocal queued
+                queued += 1
                 try:
                     profile_data = {
                         "username": profile["username"],
@@ -431,19 +923,94 @@ class FriendliAIProfiler:
                         "total_contributions": profile["metadata"]["total_contributions"],
                         "total_repositories": profile["metadata"]["total_repositories"],
                     }
-                    
-                    self.weaviate_client.insert_data("ContributorProfile", profile_data)
-                    logger.info(f"Saved profile for {profile['username']}")
-                    
                 except Exception as e:
-                    logger.error(f"Failed to save profile for {profile['username']}: {e}")
-                    continue
+                    logger.error(f"Failed to save profile for {profile.get('username', '')}: {e}")
+                    failed_usernames.append(profile.get("username", ""))
+                    return
+                
+                insert("ContributorProfile", profile_data)
             
+            yield save
+        
+        if failed_usernames:
+            logger.warning(f"{len(failed_usernames)} of {queued} profiles were not saved")
+        else:
             logger.info("All profiles saved successfully")
-            
-        except Exception as e:
-            logger.error(f"Failed to save profiles: {e}")
-            raise
+
+
+def _dumps_profile(profile: Dict) -> bytes:
+    """Serialize a profile to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(profile, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(profile).encode("utf-8")
+
+
+@lru_cache(maxsize=1)
+def _context_encoding():
+    """Load the tokenizer used to measure contexts, or None without tiktoken."""
+    if tiktoken is None:
+        return None
+    return tiktoken.get_encoding("cl100k_base")
+
+
+def _truncate_context(context: str, max_tokens: int = CONTEXT_MAX_TOKENS) -> str:
+    """Cut a context down to ``max_tokens`` tokens, tokenizing it once."""
+    # Every token covers at least one character, so short contexts need no tokenizing
+    if len(context) <= max_tokens:
+        return context
+    
+    encoding = _context_encoding()
+    if encoding is None:
+        # Roughly four characters per token in English text
+        return context[:max_tokens * 4]
+    
+    tokens = encoding.encode(context)
+    if len(tokens) <= max_tokens:
+        return context
+    return encoding.decode(tokens[:max_tokens])
+
+
+def _is_transient_error(error: Exception) -> bool:
+    """Whether an LLM request failure is worth retrying: rate limits, 5xx and network errors."""
+    if isinstance(error, (httpx.TransportError, ConnectionError, TimeoutError)):
+        return True
+    
+    # SDK errors expose the HTTP status under different attribute names
+    response = getattr(error, "response", None)
+    status = (getattr(error, "status_code", None) or getattr(error, "status", None)
+              or getattr(response, "status_code", None))
+    return isinstance(status, int) and (status == 429 or status >= 500)
+
+
+def _mentions_any(texts: Iterable[str], terms: Iterable[str]) -> bool:
+    """Whether any text mentions any term, ignoring case and terms too short to be telling."""
+    terms = [term.strip().lstrip("@").lower() for term in terms if term]
+    terms = [term for term in terms if len(term) >= 3]
+    return any(term in text.lower() for text in texts for term in terms)
+
+
+def _parse_profile_sections(text: str, sections: Tuple[str, ...] = PROFILE_SECTIONS) -> Optional[Dict[str, str]]:
+    """Parse ``sections`` from a JSON completion, or None if it holds no JSON object.
+    
+    Tolerates code fences or prose around the object.
+    """
+    match = re.search(r"\{.*\}", text, re.DOTALL)
+    try:
+        data = json.loads(match.group(0) if match else text)
+    except json.JSONDecodeError:
+        return None
+    
+    if not isinstance(data, dict):
+        return None
+    
+    parsed = {}
+    for section in sections:
+        value = data.get(section) or ""
+        if isinstance(value, list):
+            value = "\n".join(str(item) for item in value)
+        parsed[section] = str(value).strip()
+    
+    return parsed
 
 
 def main():
@@ -458,15 +1025,9 @@ def main():
             weaviate_client=weaviate_client
         )
         
-        # Process top contributors
-        profiles = profiler.process_top_contributors(limit=10)
-        
-        # Save profiles to Weaviate
-        profiler.save_profiles_to_weaviate(profiles)
-        
-        # Export profiles to JSON
-        with open("contributor_profiles.json", "w") as f:
-            json.dump(profiles, f, indent=2)
+        # Generate profiles, saving each to Weaviate and the JSONL export as it completes
+        saved = asyncio.run(profiler.save_profile_stream(limit=10, jsonl_path="contributor_profiles.jsonl"))
+        logger.info(f"Exported {saved} profiles to contributor_profiles.jsonl")
         
         logger.info("Contributor profiling completed successfully")
         
@@ -1,17 +1,28 @@
 """Network graph visualization for contributor-repository relationships."""
 
 import networkx as nx
+import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
 from pyvis.network import Network
-import tempfile
-import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Iterator
+from functools import lru_cache
+from itertools import islice
+import json
 import logging
-import colorsys
+
+from .layout import forceatlas2_layout
 
 logger = logging.getLogger(__name__)
 
+# Layout positions fall in [-1, 1]; vis.js canvas coordinates are in pixels
+LAYOUT_SCALE = 1000
+
+# Nodes or edges added to the page per script
+GRAPH_BATCH_SIZE = 1000
+
+EDGE_COLOR = {'color': '#848484', 'highlight': '#848484'}
+
 
 class OrganizationGraph:
     """Create and manage organization network graphs."""
@@ -22,17 +33,34 @@ class OrganizationGraph:
         self.contributor_colors = {}
         self.repo_colors = {}
     
-    def _generate_color_palette(self, n: int) -> List[str]:
-        """Generate a diverse color palette."""
-        colors = []
-        for i in range(n):
-            hue = i / n
-            saturation = 0.7
-            value = 0.8
-            rgb = colorsys.hsv_to_rgb(hue, saturation, value)
-            hex_color = '#%02x%02x%02x' % tuple(int(c * 255) for c in rgb)
-            colors.append(hex_color)
-        return colors
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _generate_color_palette(n: int) -> Tuple[str, ...]:
+        """Generate a diverse color palette of ``n`` evenly spaced hues.
+        
+        Converts HSV to RGB for all hues at once, with the same arithmetic as
+        ``colorsys.hsv_to_rgb``; palettes are cached per size across graph builds.
+        """
+        saturation = 0.7
+        value = 0.8
+        
+        hue = np.arange(n) / n
+        sector = (hue * 6.0).astype(int)
+        f = hue * 6.0 - sector
+        p = np.full(n, value * (1.0 - saturation))
+        q = value * (1.0 - saturation * f)
+        t = value * (1.0 - saturation * (1.0 - f))
+        v = np.full(n, value)
+        
+        # Red, green and blue for each of the six hue sectors
+        sector %= 6
+        channels = [
+            np.choose(sector, [v, q, p, p, t, v]),
+            np.choose(sector, [t, v, v, q, p, p]),
+            np.choose(sector, [p, p, t, v, v, q]),
+        ]
+        rgb = (np.stack(channels, axis=1) * 255).astype(int)
+        return tuple('#%02x%02x%02x' % tuple(row) for row in rgb.tolist())
     
     def build_graph(self, contributors: List[Dict], repo_works: List[Dict], max_nodes: int = 100):
         """Build the network graph from contributors and repository work data."""
@@ -40,44 +68,53 @@ class OrganizationGraph:
         
         # Add contributor nodes
         contributor_colors = self._generate_color_palette(len(contributors))
+        contributor_nodes = []
         for i, contributor in enumerate(contributors[:max_nodes//2]):
             username = contributor.get('username', 'Unknown')
+            total_commits = contributor.get('total_commits', 0)
+            total_issues = contributor.get('total_issues', 0)
+            repositories_count = contributor.get('repositories_count', 0)
             
             # Node attributes
             node_attrs = {
                 'type': 'contributor',
                 'label': username,
-                'size': min(contributor.get('total_commits', 0) / 10, 50) + 10,
+                'size': min(total_commits / 10, 50) + 10,
                 'color': contributor_colors[i % len(contributor_colors)],
                 'title': f"""
                     <b>{username}</b><br>
-                    Commits: {contributor.get('total_commits', 0)}<br>
-                    Issues: {contributor.get('total_issues', 0)}<br>
-                    Repositories: {contributor.get('repositories_count', 0)}<br>
+                    Commits: {total_commits}<br>
+                    Issues: {total_issues}<br>
+                    Repositories: {repositories_count}<br>
                     Activity: {contributor.get('activity_level', 'Unknown')}
                 """,
-                'total_commits': contributor.get('total_commits', 0),
-                'total_issues': contributor.get('total_issues', 0),
-                'repositories_count': contributor.get('repositories_count', 0),
+                'total_commits': total_commits,
+                'total_issues': total_issues,
+                'repositories_count': repositories_count,
                 'skills': contributor.get('skills', []),
                 'expertise_areas': contributor.get('expertise_areas', [])
             }
             
-            self.G.add_node(username, **node_attrs)
+            contributor_nodes.append((username, node_attrs))
+        
+        self.G.add_nodes_from(contributor_nodes)
         
-        # Add repository nodes and edges
+        # Aggregate repository data and edge weights in one pass over the repository work
         repositories = {}
+        edge_weights = {}
+        nodes = self.G.nodes
         for rw in repo_works:
             repo_id = rw.get('repository_id', 'Unknown')
             contributor_id = rw.get('contributor_id', 'Unknown')
             
             # Skip if contributor is not in graph
-            if contributor_id not in self.G.nodes:
+            if contributor_id not in nodes:
                 continue
             
             # Add repository node if not exists
-            if repo_id not in repositories:
-                repositories[repo_id] = {
+            repo_data = repositories.get(repo_id)
+            if repo_data is None:
+                repo_data = repositories[repo_id] = {
                     'name': rw.get('repository_name', repo_id.split('/')[-1]),
                     'contributors': set(),
                     'total_commits': 0,
@@ -86,56 +123,58 @@ class OrganizationGraph:
                 }
             
             # Update repository data
-            repositories[repo_id]['contributors'].add(contributor_id)
-            repositories[repo_id]['total_commits'] += rw.get('commit_count', 0)
-            repositories[repo_id]['total_issues'] += rw.get('issue_count', 0)
-            repositories[repo_id]['technologies'].update(rw.get('technologies', []))
+            repo_data['contributors'].add(contributor_id)
+            repo_data['total_commits'] += rw.get('commit_count', 0)
+            repo_data['total_issues'] += rw.get('issue_count', 0)
+            repo_data['technologies'].update(rw.get('technologies', []))
+            
+            # The first work record of a contributor in a repository sets the edge weight
+            edge_weights.setdefault((contributor_id, repo_id), max(rw.get('commit_count', 1), 1))
         
         # Add repository nodes with enough contributors
         repo_colors = self._generate_color_palette(len(repositories))
+        repo_nodes = []
+        edges = []
         for i, (repo_id, repo_data) in enumerate(repositories.items()):
-            if len(repo_data['contributors']) >= 1:  # At least 1 contributor
+            repo_contributors = repo_data['contributors']
+            contributors_count = len(repo_contributors)
+            if contributors_count >= 1:  # At least 1 contributor
                 repo_name = repo_data['name']
+                technologies = list(repo_data['technologies'])
                 
                 repo_attrs = {
                     'type': 'repository',
                     'label': repo_name,
-                    'size': min(len(repo_data['contributors']) * 5, 40) + 15,
+                    'size': min(contributors_count * 5, 40) + 15,
                     'color': repo_colors[i % len(repo_colors)],
                     'shape': 'square',
                     'title': f"""
                         <b>{repo_name}</b><br>
                         Repository: {repo_id}<br>
-                        Contributors: {len(repo_data['contributors'])}<br>
+                        Contributors: {contributors_count}<br>
                         Commits: {repo_data['total_commits']}<br>
                         Issues: {repo_data['total_issues']}<br>
-                        Technologies: {', '.join(list(repo_data['technologies'])[:5])}
+                        Technologies: {', '.join(technologies[:5])}
                     """,
-                    'contributors_count': len(repo_data['contributors']),
+                    'contributors_count': contributors_count,
                     'total_commits': repo_data['total_commits'],
                     'total_issues': repo_data['total_issues'],
-                    'technologies': list(repo_data['technologies'])
+                    'technologies': technologies
                 }
                 
-                self.G.add_node(repo_id, **repo_attrs)
+                repo_nodes.append((repo_id, repo_attrs))
                 
-                # Add edges between contributors and repositories
-                for contributor_id in repo_data['contributors']:
-                    if contributor_id in self.G.nodes:
-                        # Find the repository work for edge weight
-                        edge_weight = 1
-                        for rw in repo_works:
-                            if (rw.get('repository_id') == repo_id and 
-                                rw.get('contributor_id') == contributor_id):
-                                edge_weight = max(rw.get('commit_count', 1), 1)
-                                break
-                        
-                        self.G.add_edge(
-                            contributor_id, 
-                            repo_id, 
-                            weight=edge_weight,
-                            width=min(edge_weight / 5, 10) + 1
-                        )
+                # Edges between contributors and repositories; the aggregation pass only
+                # recorded contributors already in the graph
+                for contributor_id in repo_contributors:
+                    edge_weight = edge_weights[(contributor_id, repo_id)]
+                    edges.append((contributor_id, repo_id, {
+                        'weight': edge_weight,
+                        'width': min(edge_weight / 5, 10) + 1
+                    }))
+        
+        self.G.add_nodes_from(repo_nodes)
+        self.G.add_edges_from(edges)
         
         logger.info(f"Graph built with {self.G.number_of_nodes()} nodes and {self.G.number_of_edges()} edges")
     
@@ -143,84 +182,87 @@ class OrganizationGraph:
                                 max_nodes: int = 100) -> Optional[str]:
         """Create an interactive graph using pyvis."""
         try:
-            # Build the graph
-            self.build_graph(contributors, repo_works, max_nodes)
-            
-            if self.G.number_of_nodes() == 0:
-                return None
-            
-            # Create pyvis network
-            net = Network(
-                height="600px",
-                width="100%",
-                bgcolor="#ffffff",
-                font_color="black",
-                directed=False
-            )
-            
-            # Configure physics
-            net.set_options("""
-            {
-                "physics": {
-                    "enabled": true,
-                    "forceAtlas2Based": {
-                        "gravitationalConstant": -50,
-                        "centralGravity": 0.01,
-                        "springLength": 100,
-                        "springConstant": 0.08,
-                        "damping": 0.4,
-                        "avoidOverlap": 0.5
-                    },
-                    "maxVelocity": 50,
-                    "minVelocity": 0.1,
-                    "solver": "forceAtlas2Based",
-                    "timestep": 0.35,
-                    "stabilization": {"iterations": 150}
-                },
-                "interaction": {
-                    "hover": true,
-                    "tooltipDelay": 200
-                }
-            }
-            """)
-            
-            # Add nodes to pyvis
-            for node, attrs in self.G.nodes(data=True):
-                net.add_node(
-                    node,
-                    label=attrs.get('label', node),
-                    color=attrs.get('color', '#97c2fc'),
-                    size=attrs.get('size', 20),
-                    shape=attrs.get('shape', 'dot'),
-                    title=attrs.get('title', node),
-                    physics=True
-                )
-            
-            # Add edges to pyvis
-            for edge in self.G.edges(data=True):
-                net.add_edge(
-                    edge[0],
-                    edge[1],
-                    width=edge[2].get('width', 1),
-                    color={'color': '#848484', 'highlight': '#848484'},
-                    physics=True
-                )
-            
-            # Generate HTML
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False) as f:
-                net.save_graph(f.name)
-                with open(f.name, 'r') as html_file:
-                    html_content = html_file.read()
-                
-                # Clean up temp file
-                os.unlink(f.name)
-                
-                return html_content
+            return "".join(self._interactive_graph_chunks(contributors, repo_works, max_nodes)) or None
             
         except Exception as e:
             logger.error(f"Failed to create interactive graph: {e}")
             return None
     
+    def _interactive_graph_chunks(self, contributors: List[Dict], repo_works: List[Dict],
+                                  max_nodes: int = 100) -> Iterator[str]:
+        """Yield the interactive pyvis graph page in pieces.
+        
+        The pyvis page is rendered without any data and the nodes and edges follow as
+        scripts adding GRAPH_BATCH_SIZE items at a time to its vis.js data sets, which
+        bypasses pyvis' per-edge duplicate scan.
+        """
+        # Build the graph
+        self.build_graph(contributors, repo_works, max_nodes)
+        
+        if self.G.number_of_nodes() == 0:
+            return
+        
+        # Create pyvis network
+        net = Network(
+            height="600px",
+            width="100%",
+            bgcolor="#ffffff",
+            font_color="black",
+            directed=False
+        )
+        
+        # Configure physics
+        net.set_options("""
+        {
+            "physics": {
+                "enabled": false
+            },
+            "interaction": {
+                "hover": true,
+                "tooltipDelay": 200
+            }
+        }
+        """)
+        
+        page = net.generate_html(notebook=False)
+        body_end = page.rfind('</body>')
+        if body_end == -1:
+            body_end = len(page)
+        yield page[:body_end]
+        
+        # Lay the graph out once here; the browser renders the fixed positions
+        # instead of running its force solver before the graph appears
+        pos = forceatlas2_layout(self.G)
+        
+        # Node and edge options as pyvis' add_node/add_edge would record them
+        nodes = (
+            {
+                'id': node,
+                'label': attrs.get('label', node),
+                'shape': attrs.get('shape', 'dot'),
+                'color': attrs.get('color', '#97c2fc'),
+                'size': attrs.get('size', 20),
+                'title': attrs.get('title', node),
+                'x': float(pos[node][0]) * LAYOUT_SCALE,
+                'y': float(pos[node][1]) * LAYOUT_SCALE,
+                'physics': False,
+                'font': {'color': net.font_color}
+            }
+            for node, attrs in self.G.nodes(data=True)
+        )
+        yield from _dataset_scripts('nodes', nodes)
+        
+        edges = (
+            {'from': u, 'to': v, 'width': attrs.get('width', 1), 'color': EDGE_COLOR, 'physics': False}
+            for u, v, attrs in self.G.edges(data=True)
+        )
+        yield from _dataset_scripts('edges', edges)
+        
+        # vis.js only fits the view to the data it starts with, which here is none
+        yield '<script type="text/javascript">network.fit();</script>\n'
+        
+        yield page[body_end:]
+    
     def create_plotly_graph(self, contributors: List[Dict], repo_works: List[Dict], 
                            max_nodes: int = 100) -> Optional[go.Figure]:
         """Create a graph using plotly."""
@@ -231,8 +273,8 @@ class OrganizationGraph:
             if self.G.number_of_nodes() == 0:
                 return None
             
-            # Use spring layout for positioning
-            pos = nx.spring_layout(self.G, k=3, iterations=50)
+            # Use ForceAtlas2 layout for positioning
+            pos = forceatlas2_layout(self.G)
             
             # Prepare edge traces
             edge_x = []
@@ -250,33 +292,31 @@ class OrganizationGraph:
                 mode='lines'
             )
             
-            # Prepare node traces
-            contributor_x = []
-            contributor_y = []
-            contributor_text = []
-            contributor_size = []
-            contributor_color = []
+            # Prepare node traces: gather every node's values into arrays once and
+            # split contributors from repositories with a boolean mask
+            node_count = self.G.number_of_nodes()
+            is_contributor = np.fromiter(
+                (node_type == 'contributor' for _, node_type in self.G.nodes(data='type')),
+                dtype=bool, count=node_count
+            )
+            is_repo = ~is_contributor
+            coords = np.array([pos[node] for node in self.G])
+            labels = np.array([attrs.get('label', node) for node, attrs in self.G.nodes(data=True)], dtype=object)
+            sizes = np.array([attrs.get('size', 20) for attrs in self.G.nodes.values()])
+            colors = np.array([
+                attrs.get('total_commits', 0) if contributor else attrs.get('contributors_count', 0)
+                for attrs, contributor in zip(self.G.nodes.values(), is_contributor)
+            ])
             
-            repo_x = []
-            repo_y = []
-            repo_text = []
-            repo_size = []
-            repo_color = []
+            contributor_x, contributor_y = coords[is_contributor].T
+            contributor_text = labels[is_contributor]
+            contributor_size = sizes[is_contributor]
+            contributor_color = colors[is_contributor]
             
-            for node, attrs in self.G.nodes(data=True):
-                x, y = pos[node]
-                if attrs.get('type') == 'contributor':
-                    contributor_x.append(x)
-                    contributor_y.append(y)
-                    contributor_text.append(attrs.get('label', node))
-                    contributor_size.append(attrs.get('size', 20))
-                    contributor_color.append(attrs.get('total_commits', 0))
-                else:
-                    repo_x.append(x)
-                    repo_y.append(y)
-                    repo_text.append(attrs.get('label', node))
-                    repo_size.append(attrs.get('size', 20))
-                    repo_color.append(attrs.get('contributors_count', 0))
+            repo_x, repo_y = coords[is_repo].T
+            repo_text = labels[is_repo]
+            repo_size = sizes[is_repo]
+            repo_color = colors[is_repo]
             
             # Contributor nodes
             contributor_trace = go.Scatter(
@@ -390,4 +430,16 @@ class OrganizationGraph:
             
         except Exception as e:
             logger.error(f"Failed to export graph: {e}")
-            raise
\ No newline at end of file
+            raise
+
+
+def _dataset_scripts(dataset: str, items: Iterable[Dict]) -> Iterator[str]:
+    """Yield script tags adding items to a global vis.js DataSet in batches."""
+    items = iter(items)
+    while True:
+        batch = list(islice(items, GRAPH_BATCH_SIZE))
+        if not batch:
+            return
+        # Keep a "</script>" inside a tooltip from closing the tag early
+        payload = json.dumps(batch).replace('</', '<\\/')
+        yield f'<script type="text/javascript">{dataset}.add({payload});</script>\n'
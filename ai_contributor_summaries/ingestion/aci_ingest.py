@@ -2,23 +2,34 @@
 
 import asyncio
 import logging
+from collections import defaultdict
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 import httpx
 from config.settings import settings
 from utils.weaviate_client import weaviate_client
 
+try:
+    import h2
+except ImportError:  # httpx speaks HTTP/1.1 without the h2 package
+    h2 = None
+
 logger = logging.getLogger(__name__)
 
 
 class ACIIngester:
     """ACI.dev client for ingesting GitHub data."""
     
-    def __init__(self):
-        """Initialize ACI.dev client."""
+    def __init__(self, max_concurrent_requests: int = 16):
+        """Initialize ACI.dev client.
+        
+        ``max_concurrent_requests`` caps the page and per-commit diff requests in
+        flight while ingesting a repository.
+        """
         self.base_url = settings.aci_dev_base_url
         self.api_key = settings.aci_dev_api_key
         self.github_token = settings.github_token
+        self.max_concurrent_requests = max_concurrent_requests
         self.session = None
     
     async def __aenter__(self):
@@ -29,7 +40,14 @@ class ACIIngester:
                 "Authorization": f"Bearer {self.api_key}",
                 "Content-Type": "application/json"
             },
-            timeout=httpx.Timeout(30.0)
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            # Many concurrent GETs to one host: multiplex them over HTTP/2 where
+            # available and keep enough pooled connections for the rest
+            transport=httpx.AsyncHTTPTransport(
+                http2=h2 is not None,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                retries=2
+            )
         )
         return self
     
@@ -52,41 +70,58 @@ class ACIIngester:
             raise
     
     async def fetch_commits(self, owner: str, repo: str, since: Optional[datetime] = None, 
-                           per_page: int = 100) -> List[Dict[str, Any]]:
-        """Fetch commits from repository."""
+                           per_page: int = 100, max_pages: int = 5) -> List[Dict[str, Any]]:
+        """Fetch commits from repository with pagination."""
         try:
             params = {"per_page": per_page}
             if since:
                 params["since"] = since.isoformat()
             
-            response = await self.session.get(
-                f"/github/repositories/{owner}/{repo}/commits",
-                params=params,
-                headers={"X-GitHub-Token": self.github_token}
-            )
-            response.raise_for_status()
-            return response.json()
+            return await self._fetch_pages(f"/github/repositories/{owner}/{repo}/commits", params, max_pages)
         except httpx.HTTPError as e:
             logger.error(f"Failed to fetch commits for {owner}/{repo}: {e}")
             raise
     
     async def fetch_issues(self, owner: str, repo: str, state: str = "all", 
-                          per_page: int = 100) -> List[Dict[str, Any]]:
-        """Fetch issues from repository."""
+                          per_page: int = 100, max_pages: int = 5) -> List[Dict[str, Any]]:
+        """Fetch issues from repository with pagination."""
         try:
             params = {"state": state, "per_page": per_page}
             
-            response = await self.session.get(
-                f"/github/repositories/{owner}/{repo}/issues",
-                params=params,
-                headers={"X-GitHub-Token": self.github_token}
-            )
-            response.raise_for_status()
-            return response.json()
+            return await self._fetch_pages(f"/github/repositories/{owner}/{repo}/issues", params, max_pages)
         except httpx.HTTPError as e:
             logger.error(f"Failed to fetch issues for {owner}/{repo}: {e}")
             raise
     
+    async def _fetch_pages(self, path: str, params: Dict[str, Any], max_pages: int) -> List[Dict[str, Any]]:
+        """Fetch up to max_pages pages of a paginated listing.
+        
+        The first response's ``Link: rel="last"`` header gives the page count, so the
+        remaining pages are requested concurrently rather than one after another.
+        """
+        headers = {"X-GitHub-Token": self.github_token}
+        
+        response = await self.session.get(path, params={**params, "page": 1}, headers=headers)
+        response.raise_for_status()
+        items = response.json()
+        
+        last_url = response.links.get("last", {}).get("url")
+        last_page = int(httpx.URL(last_url).params.get("page", 1)) if last_url else 1
+        
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        
+        async def fetch_page(page: int) -> List[Dict[str, Any]]:
+            async with semaphore:
+                page_response = await self.session.get(path, params={**params, "page": page}, headers=headers)
+            page_response.raise_for_status()
+            return page_response.json()
+        
+        pages = await asyncio.gather(*(fetch_page(page) for page in range(2, min(last_page, max_pages) + 1)))
+        for page_items in pages:
+            items.extend(page_items)
+        
+        return items
+    
     async def fetch_contributors(self, owner: str, repo: str) -> List[Dict[str, Any]]:
         """Fetch contributors from repository."""
         try:
@@ -188,44 +223,69 @@ class ACIIngester:
             
             # Fetch and process commits
             commits = await self.fetch_commits(owner, repo)
-            commit_count = 0
             
-            for commit in commits:
-                # Fetch detailed commit data with diff
-                commit_detail = await self.fetch_commit_diff(owner, repo, commit["sha"])
-                processed_commit = self.process_commit_data(commit_detail, repo_id)
-                
-                # Store in Weaviate
-                weaviate_client.insert_data("Commit", processed_commit)
-                commit_count += 1
+            # Fetch detailed commit data with diffs concurrently, with at most
+            # max_concurrent_requests in flight
+            semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+            
+            async def fetch_commit(commit: Dict[str, Any]) -> Dict[str, Any]:
+                async with semaphore:
+                    commit_detail = await self.fetch_commit_diff(owner, repo, commit["sha"])
+                return self.process_commit_data(commit_detail, repo_id)
+            
+            processed_commits = await asyncio.gather(*(fetch_commit(commit) for commit in commits))
             
             # Fetch and process issues
             issues = await self.fetch_issues(owner, repo)
-            issue_count = 0
-            
-            for issue in issues:
-                processed_issue = self.process_issue_data(issue, repo_id)
-                
-                # Store in Weaviate
-                weaviate_client.insert_data("Issue", processed_issue)
-                issue_count += 1
+            processed_issues = [self.process_issue_data(issue, repo_id) for issue in issues]
             
             # Fetch and process contributors
             contributors = await self.fetch_contributors(owner, repo)
-            contributor_count = 0
+            processed_contributors = [self.process_contributor_data(contributor) for contributor in contributors]
             
-            for contributor in contributors:
-                processed_contributor = self.process_contributor_data(contributor)
-                
-                # Check if contributor already exists
+            # Skip contributors that already exist, checked with one query for all of them
+            github_ids = [contributor["github_id"] for contributor in processed_contributors]
+            existing_ids = set()
+            if github_ids:
                 existing = weaviate_client.query_data(
-                    "Contributor", 
-                    where_filter={"path": ["github_id"], "operator": "Equal", "valueText": processed_contributor["github_id"]}
+                    "Contributor",
+                    where_filter={"path": ["github_id"], "operator": "ContainsAny", "valueStringArray": github_ids},
+                    limit=len(github_ids)
                 )
-                
-                if not existing:
-                    weaviate_client.insert_data("Contributor", processed_contributor)
-                    contributor_count += 1
+                existing_ids = {contributor.get("github_id") for contributor in existing}
+            
+            new_contributors = []
+            for processed_contributor in processed_contributors:
+                if processed_contributor["github_id"] not in existing_ids:
+                    existing_ids.add(processed_contributor["github_id"])
+                    new_contributors.append(processed_contributor)
+            
+            # Objects Weaviate rejected, per class, so they are not counted as stored
+            failures = defaultdict(int)
+            
+            def collect_failures(results: List[Dict]):
+                for result in results or []:
+                    errors = (result.get("result") or {}).get("errors")
+                    if errors:
+                        class_name = result.get("class", "")
+                        logger.error(f"Failed to store {class_name} object: {errors}")
+                        failures[class_name] += 1
+            
+            # Store in Weaviate in bulk rather than one request per object
+            with weaviate_client.batch(batch_size=200, callback=collect_failures) as insert:
+                for processed_commit in processed_commits:
+                    insert("Commit", processed_commit)
+                for processed_issue in processed_issues:
+                    insert("Issue", processed_issue)
+                for processed_contributor in new_contributors:
+                    insert("Contributor", processed_contributor)
+            
+            commit_count = len(processed_commits) - failures["Commit"]
+            issue_count = len(processed_issues) - failures["Issue"]
+            contributor_count = len(new_contributors) - failures["Contributor"]
+            
+            if failures:
+                logger.warning(f"{sum(failures.values())} objects from {owner}/{repo} were not stored")
             
             logger.info(f"Ingestion completed for {owner}/{repo}: {commit_count} commits, {issue_count} issues, {contributor_count} contributors")
             
@@ -310,23 +310,13 @@ class GitHubClient:
             
             # Fetch and process contributors
             contributors = await self.fetch_contributors(owner, repo)
-            contributor_count = 0
+            processed_contributors = []
             
             for contributor in contributors:
                 try:
                     # Get detailed user info
                     user_details = await self.fetch_user_details(contributor["login"])
-                    processed_contributor = self.process_contributor_data(contributor, user_details)
-                    
-                    # Check if contributor already exists
-                    existing = self.weaviate_client.query_data(
-                        "Contributor", 
-                        where_filter={"path": ["github_id"], "operator": "Equal", "valueText": processed_contributor["github_id"]}
-                    )
-                    
-                    if not existing:
-                        self.weaviate_client.insert_data("Contributor", processed_contributor)
-                        contributor_count += 1
+                    processed_contributors.append(self.process_contributor_data(contributor, user_details))
                     
                     # Rate limiting
                     await asyncio.sleep(0.2)
@@ -335,6 +325,29 @@ class GitHubClient:
                     logger.error(f"Failed to process contributor {contributor['login']}: {e}")
                     continue
             
+            # Check which contributors already exist with one query for all of them
+            github_ids = [contributor["github_id"] for contributor in processed_contributors]
+            existing_ids = set()
+            if github_ids:
+                existing = self.weaviate_client.query_data(
+                    "Contributor",
+                    where_filter={"path": ["github_id"], "operator": "ContainsAny", "valueStringArray": github_ids},
+                    limit=len(github_ids)
+                )
+                existing_ids = {contributor.get("github_id") for contributor in existing}
+            
+            contributor_count = 0
+            for processed_contributor in processed_contributors:
+                if processed_contributor["github_id"] in existing_ids:
+                    continue
+                try:
+                    self.weaviate_client.insert_data("Contributor", processed_contributor)
+                    existing_ids.add(processed_contributor["github_id"])
+                    contributor_count += 1
+                except Exception as e:
+                    logger.error(f"Failed to store contributor {processed_contributor['username']}: {e}")
+                    continue
+            
             logger.info(f"GitHub ingestion completed for {owner}/{repo}: {commit_count} commits, {issue_count} issues, {contributor_count} contributors")
             
             return {
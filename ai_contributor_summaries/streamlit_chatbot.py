@@ -3,6 +3,7 @@
 import streamlit as st
 import logging
 import json
+import asyncio
 from typing import Dict, List, Any
 import plotly.express as px
 import plotly.graph_objects as go
@@ -432,7 +433,7 @@ class ContributorChatbot:
         
         try:
             with st.spinner("Generating AI profiles for top contributors..."):
-                profiles = self.profiler.process_top_contributors(limit=5)
+                profiles = asyncio.run(self.profiler.process_top_contributors(limit=5))
                 
                 # Save profiles
                 self.profiler.save_profiles_to_weaviate(profiles)
@@ -0,0 +1,145 @@
+"""Tests for ACI.dev ingestion."""
+
+import asyncio
+from contextlib import contextmanager
+from unittest.mock import Mock, AsyncMock, patch
+import httpx
+import pytest
+from ingestion.aci_ingest import ACIIngester
+
+
+def paginated_handler(total, requests, link=True):
+    """MockTransport handler serving ``total`` items page by page, GitHub style.
+
+    Later pages answer first so results arrive out of order. Every request is
+    appended to ``requests``.
+    """
+    async def handler(request):
+        requests.append(request)
+        page = int(request.url.params.get("page", 1))
+        per_page = int(request.url.params["per_page"])
+        last_page = max(1, -(-total // per_page))
+        items = [{"sha": f"sha{i}"} for i in range((page - 1) * per_page, min(page * per_page, total))]
+
+        headers = {}
+        if link and last_page > 1:
+            links = []
+            if page < last_page:
+                links.append(f'<https://aci.test{request.url.path}?per_page={per_page}&page={page + 1}>; rel="next"')
+            links.append(f'<https://aci.test{request.url.path}?per_page={per_page}&page={last_page}>; rel="last"')
+            headers["Link"] = ", ".join(links)
+
+        await asyncio.sleep((last_page - page) * 0.01)
+        return httpx.Response(200, json=items, headers=headers)
+
+    return handler
+
+
+class RejectingBatchClient:
+    """Weaviate client stand-in whose batch rejects the objects named in ``rejected``."""
+
+    def __init__(self, rejected):
+        self.rejected = rejected
+        self.query_data = Mock(return_value=[])
+
+    @contextmanager
+    def batch(self, batch_size=100, callback=None):
+        results = []
+
+        def add(collection_name, data):
+            rejected = data.get("github_id") in self.rejected
+            results.append({
+                "class": collection_name,
+                "properties": data,
+                "result": {"errors": {"error": [{"message": "invalid"}]}} if rejected else {},
+            })
+
+        yield add
+        callback(results)
+
+
+class TestACIIngester:
+    """Test suite for ACI.dev ingestion."""
+
+    @pytest.fixture
+    def requests(self):
+        """Requests received by the mock transport."""
+        return []
+
+    def make_ingester(self, handler):
+        """Ingester whose session is served by ``handler``."""
+        ingester = ACIIngester(max_concurrent_requests=4)
+        ingester.github_token = "gh-token"
+        ingester.session = httpx.AsyncClient(base_url="https://aci.test", transport=httpx.MockTransport(handler))
+        return ingester
+
+    @pytest.mark.asyncio
+    async def test_fetches_every_page_up_to_the_last(self, requests):
+        """Test that pages 2..last are fetched and nothing past the last page."""
+        ingester = self.make_ingester(paginated_handler(35, requests))
+
+        commits = await ingester.fetch_commits("owner", "repo", per_page=10)
+
+        assert len(commits) == 35
+        assert sorted(int(request.url.params["page"]) for request in requests) == [1, 2, 3, 4]
+        assert all(request.url.path == "/github/repositories/owner/repo/commits" for request in requests)
+        assert all(request.headers["X-GitHub-Token"] == "gh-token" for request in requests)
+
+    @pytest.mark.asyncio
+    async def test_preserves_order_across_pages(self, requests):
+        """Test that items keep page order even when later pages answer first."""
+        ingester = self.make_ingester(paginated_handler(35, requests))
+
+        commits = await ingester.fetch_commits("owner", "repo", per_page=10)
+
+        assert [commit["sha"] for commit in commits] == [f"sha{i}" for i in range(35)]
+
+    @pytest.mark.asyncio
+    async def test_missing_link_header_fetches_one_page(self, requests):
+        """Test that a response without a Link header is treated as the only page."""
+        ingester = self.make_ingester(paginated_handler(35, requests, link=False))
+
+        issues = await ingester.fetch_issues("owner", "repo", per_page=10)
+
+        assert [issue["sha"] for issue in issues] == [f"sha{i}" for i in range(10)]
+        assert len(requests) == 1
+        assert requests[0].url.params["state"] == "all"
+
+    @pytest.mark.asyncio
+    async def test_stops_at_max_pages(self, requests):
+        """Test that no more than max_pages pages are requested."""
+        ingester = self.make_ingester(paginated_handler(100, requests))
+
+        commits = await ingester.fetch_commits("owner", "repo", per_page=10, max_pages=3)
+
+        assert [commit["sha"] for commit in commits] == [f"sha{i}" for i in range(30)]
+        assert len(requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_empty_listing(self, requests):
+        """Test that an empty first page returns no items."""
+        ingester = self.make_ingester(paginated_handler(0, requests))
+
+        assert await ingester.fetch_commits("owner", "repo") == []
+        assert len(requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_ingest_counts_only_stored_objects(self):
+        """Test that objects Weaviate rejects are not counted as ingested."""
+        client = RejectingBatchClient(rejected={"sha1", "2"})
+        ingester = ACIIngester()
+        commits = [{"sha": f"sha{i}"} for i in range(3)]
+        contributors = [{"id": i, "login": f"user{i}"} for i in range(1, 4)]
+
+        def commit_detail(owner, repo, sha):
+            return {"sha": sha, "commit": {"author": {"date": "2024-01-01T00:00:00Z"}}}
+
+        with patch("ingestion.aci_ingest.weaviate_client", client), \
+                patch.object(ingester, "fetch_repository_data", AsyncMock(return_value={})), \
+                patch.object(ingester, "fetch_commits", AsyncMock(return_value=commits)), \
+                patch.object(ingester, "fetch_commit_diff", AsyncMock(side_effect=commit_detail)), \
+                patch.object(ingester, "fetch_issues", AsyncMock(return_value=[])), \
+                patch.object(ingester, "fetch_contributors", AsyncMock(return_value=contributors)):
+            result = await ingester.ingest_repository("owner", "repo")
+
+        assert result == {"commits": 2, "issues": 0, "contributors": 2}
@@ -0,0 +1,426 @@
+"""Tests for the FriendliAI contributor profiler."""
+
+import json
+import re
+import sys
+import httpx
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock, AsyncMock, patch
+import friendli_ai_profiler
+from friendli_ai_profiler import (
+    FriendliAIProfiler,
+    ContributorRecord,
+    SkillsRecord,
+    ContributionRecord,
+    ProfileSectionCache,
+    PROFILE_SECTIONS,
+    SHARED_SECTIONS,
+    IDENTITY_SECTIONS,
+    LLM_MAX_ATTEMPTS,
+    _is_transient_error,
+    _parse_profile_sections,
+)
+
+
+class StubLLM:
+    """Streaming LLM stub answering each prompt with ``respond(prompt)``."""
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.prompts = []
+
+    async def astream_complete(self, prompt):
+        self.prompts.append(prompt)
+        text = self.respond(prompt)
+
+        async def stream():
+            yield SimpleNamespace(delta=text)
+
+        return stream()
+
+
+class FlakyLLM(StubLLM):
+    """Streaming LLM stub raising each of ``errors`` in turn before answering."""
+
+    def __init__(self, errors, respond):
+        super().__init__(respond)
+        self.errors = list(errors)
+
+    async def astream_complete(self, prompt):
+        if self.errors:
+            self.prompts.append(prompt)
+            raise self.errors.pop(0)
+        return await super().astream_complete(prompt)
+
+
+class StatusError(Exception):
+    """SDK-style error carrying an HTTP status code."""
+
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+def requested_sections(prompt):
+    """Sections a profile prompt asks for."""
+    return [section for section in PROFILE_SECTIONS if f'- "{section}"' in prompt]
+
+
+def profile_response(shared_text):
+    """Build a responder writing about the prompt's contributor; ``shared_text`` may use {name}."""
+    def respond(prompt):
+        name = re.search(r"Name: (.*)", prompt).group(1)
+        return json.dumps({
+            section: shared_text.format(name=name) if section in SHARED_SECTIONS else f"{name} writes {section}"
+            for section in requested_sections(prompt)
+        })
+    return respond
+
+
+class FakeSemanticStore:
+    """Weaviate client stand-in whose vector search returns every stored object at distance 0."""
+
+    def __init__(self):
+        self.client = Mock()
+        self.objects = []
+
+    def insert_data(self, collection_name, data, vector=None):
+        self.objects.append(data)
+
+    def search_by_vector(self, collection_name, properties, vector, limit=1):
+        return [dict(data, distance=0.0) for data in self.objects][:limit]
+
+
+def make_contributor(username, name, company):
+    """Contributor record with identity fields only."""
+    return ContributorRecord.from_dict({
+        "username": username, "name": name, "company": company, "location": "Berlin",
+        "bio": f"{name} at {company}", "total_contributions": 120
+    })
+
+
+class TestParseProfileSections:
+    """Test suite for parsing the sections of a profile completion."""
+
+    def test_missing_sections_are_empty(self):
+        """Test that sections absent from the response parse to empty strings."""
+        parsed = _parse_profile_sections('{"professional_summary": "Summary"}')
+
+        assert list(parsed) == list(PROFILE_SECTIONS)
+        assert parsed["professional_summary"] == "Summary"
+        assert all(parsed[section] == "" for section in PROFILE_SECTIONS[1:])
+
+    def test_reordered_sections(self):
+        """Test that sections are matched by name whatever order the response uses."""
+        response = json.dumps({section: f"{section} text" for section in reversed(PROFILE_SECTIONS)})
+
+        parsed = _parse_profile_sections(response)
+
+        assert list(parsed) == list(PROFILE_SECTIONS)
+        assert all(parsed[section] == f"{section} text" for section in PROFILE_SECTIONS)
+
+    def test_text_before_and_after_the_object(self):
+        """Test that prose and code fences around the JSON object are ignored."""
+        response = ('Here is the profile:\n```json\n{"technical_expertise": "  Go  ", '
+                    '"professional_summary": "Summary"}\n```\nLet me know if you need more.')
+
+        parsed = _parse_profile_sections(response)
+
+        assert parsed["professional_summary"] == "Summary"
+        assert parsed["technical_expertise"] == "Go"
+
+    def test_list_values_are_joined(self):
+        """Test that a section answered as a list becomes one line per item."""
+        parsed = _parse_profile_sections('{"strengths_recommendations": ["Testing", "Reviews"]}')
+
+        assert parsed["strengths_recommendations"] == "Testing\nReviews"
+
+    def test_only_requested_sections(self):
+        """Test that only the requested sections are returned."""
+        response = json.dumps({section: "text" for section in PROFILE_SECTIONS})
+
+        assert list(_parse_profile_sections(response, IDENTITY_SECTIONS)) == list(IDENTITY_SECTIONS)
+
+    @pytest.mark.parametrize("response", [
+        "Summary without any JSON",
+        '{"professional_summary": "cut off',
+        '["professional_summary"]',
+    ])
+    def test_no_json_object(self, response):
+        """Test that a response without a complete JSON object is rejected."""
+        assert _parse_profile_sections(response) is None
+
+
+class TestProfileSectionCache:
+    """Test suite for the on-disk cache of generated profile sections."""
+
+    @pytest.fixture
+    def clock(self):
+        """Strictly increasing time so recency never ties."""
+        ticks = iter(range(1, 1000))
+        with patch.object(friendli_ai_profiler.time, "time", side_effect=lambda: float(next(ticks))):
+            yield
+
+    @pytest.fixture
+    def cache(self, tmp_path, clock):
+        """Cache holding at most two entries in a temporary database."""
+        return ProfileSectionCache(str(tmp_path / "cache.sqlite3"), max_entries=2)
+
+    def test_hit_returns_stored_sections(self, cache):
+        """Test that a stored entry is returned for its key."""
+        cache.put("a", {"professional_summary": "A summary"})
+
+        assert cache.get("a") == {"professional_summary": "A summary"}
+
+    def test_miss_returns_none(self, cache):
+        """Test that an unknown key is a miss."""
+        cache.put("a", {"professional_summary": "A summary"})
+
+        assert cache.get("b") is None
+
+    def test_evicts_least_recently_used(self, cache):
+        """Test that entries beyond max_entries are evicted by last use, not insertion."""
+        cache.put("a", {"professional_summary": "A"})
+        cache.put("b", {"professional_summary": "B"})
+        cache.get("a")
+        cache.put("c", {"professional_summary": "C"})
+
+        assert cache.get("b") is None
+        assert cache.get("a") == {"professional_summary": "A"}
+        assert cache.get("c") == {"professional_summary": "C"}
+
+    def test_entries_persist_across_connections(self, tmp_path, clock):
+        """Test that a new cache on the same path sees earlier entries."""
+        path = str(tmp_path / "cache.sqlite3")
+        ProfileSectionCache(path).put("a", {"professional_summary": "A"})
+
+        assert ProfileSectionCache(path).get("a") == {"professional_summary": "A"}
+
+    @pytest.mark.asyncio
+    async def test_profiler_reuses_cached_sections(self, tmp_path):
+        """Test that an unchanged prompt is answered from the cache without an LLM call."""
+        with patch.dict(sys.modules, {"llama_index.llms.friendli": Mock()}):
+            profiler = FriendliAIProfiler("token", Mock(), cache_path=str(tmp_path / "cache.sqlite3"))
+        profiler.llm = StubLLM(profile_response("Deep Python expertise"))
+        alice = make_contributor("alice", "Alice Smith", "Acme")
+
+        first = await profiler._generate_profile(alice, None, [])
+        second = await profiler._generate_profile(alice, None, [])
+
+        assert len(profiler.llm.prompts) == 1
+        assert second["profile_sections"] == first["profile_sections"]
+
+
+class TestRetry:
+    """Test suite for retrying failed LLM completions."""
+
+    @pytest.fixture
+    def profiler(self):
+        """Profiler without caches or rate limiting."""
+        with patch.dict(sys.modules, {"llama_index.llms.friendli": Mock()}):
+            return FriendliAIProfiler("token", Mock(), cache_path=None)
+
+    @pytest.fixture
+    def sleep(self):
+        """Backoff sleeps, recorded instead of waited."""
+        with patch.object(friendli_ai_profiler.asyncio, "sleep", new_callable=AsyncMock) as sleep:
+            yield sleep
+
+    @pytest.mark.parametrize("error", [
+        StatusError(429),
+        StatusError(503),
+        httpx.ConnectError("connection refused"),
+        ConnectionResetError(),
+        TimeoutError(),
+    ])
+    def test_transient_errors(self, error):
+        """Test that rate limits, server errors and network failures are retried."""
+        assert _is_transient_error(error)
+
+    @pytest.mark.parametrize("error", [StatusError(400), StatusError(401), ValueError("bad prompt")])
+    def test_non_transient_errors(self, error):
+        """Test that client errors and bugs are not retried."""
+        assert not _is_transient_error(error)
+
+    @pytest.mark.asyncio
+    async def test_transient_error_then_success(self, profiler, sleep):
+        """Test that a transient failure is retried after a backoff and the retry's result returned."""
+        profiler.llm = FlakyLLM([StatusError(429)], lambda prompt: '{"professional_summary": "Summary"}')
+
+        response, sections = await profiler._complete_with_retry("prompt")
+
+        assert sections["professional_summary"] == "Summary"
+        assert len(profiler.llm.prompts) == 2
+        sleep.assert_awaited_once()
+        assert sleep.await_args.args[0] >= friendli_ai_profiler.LLM_BACKOFF_MIN_SECONDS
+
+    @pytest.mark.asyncio
+    async def test_non_transient_error_raises_immediately(self, profiler, sleep):
+        """Test that a non-transient failure is raised without retrying."""
+        profiler.llm = FlakyLLM([StatusError(400)], lambda prompt: "{}")
+
+        with pytest.raises(StatusError):
+            await profiler._complete_with_retry("prompt")
+
+        assert len(profiler.llm.prompts) == 1
+        sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_attempts_are_capped(self, profiler, sleep):
+        """Test that a request failing every time is tried LLM_MAX_ATTEMPTS times, then raises."""
+        profiler.llm = FlakyLLM([StatusError(503)] * (LLM_MAX_ATTEMPTS + 1), lambda prompt: "{}")
+
+        with pytest.raises(StatusError):
+            await profiler._complete_with_retry("prompt")
+
+        assert len(profiler.llm.prompts) == LLM_MAX_ATTEMPTS
+        assert sleep.await_count == LLM_MAX_ATTEMPTS - 1
+
+
+class TestSemanticCache:
+    """Test suite for reuse of profile sections between similar contributors."""
+
+    @pytest.fixture
+    def store(self):
+        """Semantic cache backing store."""
+        return FakeSemanticStore()
+
+    @pytest.fixture
+    def profiler(self, store):
+        """Profiler with an embedding model that finds every contributor's work identical."""
+        with patch.dict(sys.modules, {"llama_index.llms.friendli": Mock()}):
+            profiler = FriendliAIProfiler("token", store, cache_path=None)
+        profiler.embedding_model = Mock()
+        profiler.embedding_model.aget_text_embedding = AsyncMock(return_value=[1.0, 0.0])
+        return profiler
+
+    @pytest.fixture
+    def work(self):
+        """Skills and contributions shared by both contributors."""
+        skills = SkillsRecord.from_dict({"python_score": 0.9, "go_score": 0.4, "technologies": ["django"]})
+        contributions = [ContributionRecord.from_dict({
+            "repository_full_name": "org/api", "contribution_count": 80, "primary_language": "Python"
+        })]
+        return skills, contributions
+
+    @pytest.mark.asyncio
+    async def test_different_users_never_share_identity_sections(self, profiler, work):
+        """Test that a semantic hit regenerates the identity sections for the new contributor."""
+        profiler.llm = StubLLM(profile_response("Deep Python and Go expertise"))
+        alice = make_contributor("alice", "Alice Smith", "Acme")
+        bob = make_contributor("bob", "Bob Jones", "Globex")
+
+        alice_profile = await profiler._generate_profile(alice, *work)
+        bob_profile = await profiler._generate_profile(bob, *work)
+
+        alice_sections = alice_profile["profile_sections"]
+        bob_sections = bob_profile["profile_sections"]
+        for section in IDENTITY_SECTIONS:
+            assert "Bob Jones" in bob_sections[section]
+            assert bob_sections[section] != alice_sections[section]
+        for section in PROFILE_SECTIONS:
+            assert "alice" not in bob_sections[section].lower()
+        for section in SHARED_SECTIONS:
+            assert bob_sections[section] == alice_sections[section]
+
+        # Bob's completion only asked for the identity sections
+        assert requested_sections(profiler.llm.prompts[1]) == list(IDENTITY_SECTIONS)
+
+        # Only the work was embedded, never who did it
+        for call in profiler.embedding_model.aget_text_embedding.await_args_list:
+            embedded = call.args[0]
+            assert "Alice" not in embedded and "Bob" not in embedded and "Acme" not in embedded
+
+    @pytest.mark.asyncio
+    async def test_sections_naming_the_contributor_are_not_shared(self, profiler, store, work):
+        """Test that shared sections mentioning their contributor never enter the cache."""
+        profiler.llm = StubLLM(profile_response("{name} brings deep Python expertise"))
+        alice = make_contributor("alice", "Alice Smith", "Acme")
+        bob = make_contributor("bob", "Bob Jones", "Globex")
+
+        await profiler._generate_profile(alice, *work)
+        bob_profile = await profiler._generate_profile(bob, *work)
+
+        assert store.objects == []
+        assert requested_sections(profiler.llm.prompts[1]) == list(PROFILE_SECTIONS)
+        for section in PROFILE_SECTIONS:
+            assert "Alice" not in bob_profile["profile_sections"][section]
+
+    @pytest.mark.asyncio
+    async def test_cached_sections_naming_someone_else_are_not_reused(self, profiler, store):
+        """Test that a stored entry mentioning its contributor is treated as a miss."""
+        store.objects.append({
+            "username": "alice",
+            "sections_json": json.dumps({section: "Alice's strengths" for section in SHARED_SECTIONS}),
+        })
+
+        assert await profiler._find_similar_sections([1.0, 0.0], "bob") is None
+
+    @pytest.mark.asyncio
+    async def test_embedding_failure_is_a_cache_miss(self, profiler, store, work):
+        """Test that a failing embedding model still yields a generated profile."""
+        profiler.embedding_model.aget_text_embedding = AsyncMock(side_effect=ConnectionError("rate limited"))
+        profiler.llm = StubLLM(profile_response("Deep Python expertise"))
+        alice = make_contributor("alice", "Alice Smith", "Acme")
+
+        profile = await profiler._generate_profile(alice, *work)
+
+        assert profile["profile_sections"]["technical_expertise"] == "Deep Python expertise"
+        assert requested_sections(profiler.llm.prompts[0]) == list(PROFILE_SECTIONS)
+        assert store.objects == []
+
+    @pytest.mark.asyncio
+    async def test_malformed_cached_entry_is_a_cache_miss(self, profiler, store, work):
+        """Test that a stored entry that is not valid JSON does not fail the profile."""
+        store.objects.append({"username": "alice", "sections_json": "{not json"})
+        profiler.llm = StubLLM(profile_response("Deep Python expertise"))
+        bob = make_contributor("bob", "Bob Jones", "Globex")
+
+        profile = await profiler._generate_profile(bob, *work)
+
+        assert profile["profile_sections"]["technical_expertise"] == "Deep Python expertise"
+        assert requested_sections(profiler.llm.prompts[0]) == list(PROFILE_SECTIONS)
+
+    def test_threshold_only_admits_near_identical_work(self):
+        """Test that the semantic cache distance is tight."""
+        assert friendli_ai_profiler.SEMANTIC_CACHE_MAX_DISTANCE <= 0.02
+
+
+class TestFetchContributions:
+    """Test suite for grouping contributions fetched for several contributors."""
+
+    @pytest.fixture
+    def profiler(self):
+        """Profiler over contributions where one contributor has far more rows than the rest."""
+        rows = ([{"contributor_username": "prolific", "repository_full_name": f"org/r{i}",
+                  "contribution_count": 1} for i in range(500)]
+                + [{"contributor_username": user, "repository_full_name": f"{user}/repo",
+                    "contribution_count": 3} for user in ("quiet", "rare")])
+
+        def query_data(collection_name, where_filter=None, limit=100):
+            if where_filter["operator"] == "Equal":
+                matching = [row for row in rows if row["contributor_username"] == where_filter["valueString"]]
+            else:
+                matching = [row for row in rows if row["contributor_username"] in where_filter["valueStringArray"]]
+            return matching[:limit]
+
+        client = Mock()
+        client.query_data = Mock(side_effect=query_data)
+        with patch.dict(sys.modules, {"llama_index.llms.friendli": Mock()}):
+            return FriendliAIProfiler("token", client, cache_path=None)
+
+    def test_prolific_contributor_does_not_crowd_out_others(self, profiler):
+        """Test that contributors cut off by the shared query are fetched on their own."""
+        contributions = profiler._fetch_contributions(["prolific", "quiet", "rare"], per_contributor=10)
+
+        assert len(contributions["prolific"]) == 10
+        assert [c.repository_full_name for c in contributions["quiet"]] == ["quiet/repo"]
+        assert [c.repository_full_name for c in contributions["rare"]] == ["rare/repo"]
+
+    def test_single_query_when_nothing_is_cut_off(self, profiler):
+        """Test that no follow-up queries run when the shared query returns everything."""
+        contributions = profiler._fetch_contributions(["quiet", "rare"], per_contributor=10)
+
+        assert profiler.weaviate_client.query_data.call_count == 1
+        assert len(contributions["quiet"]) == 1 and len(contributions["rare"]) == 1
@@ -188,6 +188,39 @@ class TestGitHubClient:
             
             assert "API Error" in str(exc_info.value)
     
+    @pytest.mark.asyncio
+    async def test_ingest_repository_stores_new_contributors_once(self, github_client, mock_weaviate_client):
+        """Test that contributors are checked with one query and only new ones are stored."""
+        github_client.weaviate_client = mock_weaviate_client
+        # bob is already stored; alice appears twice in the listing
+        mock_weaviate_client.query_data.return_value = [{"github_id": "2", "username": "bob"}]
+        contributors = [
+            {"id": 1, "login": "alice", "contributions": 30},
+            {"id": 2, "login": "bob", "contributions": 20},
+            {"id": 1, "login": "alice", "contributions": 30},
+            {"id": 3, "login": "carol", "contributions": 10},
+        ]
+        
+        with patch.object(github_client, 'fetch_repository_info', AsyncMock(return_value={"full_name": "owner/repo"})), \
+                patch.object(github_client, 'fetch_commits', AsyncMock(return_value=[])), \
+                patch.object(github_client, 'fetch_issues', AsyncMock(return_value=[])), \
+                patch.object(github_client, 'fetch_contributors', AsyncMock(return_value=contributors)), \
+                patch.object(github_client, 'fetch_user_details', AsyncMock(side_effect=lambda login: {"login": login})), \
+                patch('ingestion.github_client.asyncio.sleep', AsyncMock()):
+            result = await github_client.ingest_repository("owner", "repo")
+        
+        mock_weaviate_client.query_data.assert_called_once()
+        args, kwargs = mock_weaviate_client.query_data.call_args
+        assert args == ("Contributor",)
+        assert kwargs["where_filter"]["operator"] == "ContainsAny"
+        assert kwargs["where_filter"]["path"] == ["github_id"]
+        assert sorted(set(kwargs["where_filter"]["valueStringArray"])) == ["1", "2", "3"]
+        
+        stored = [call.args[1]["username"] for call in mock_weaviate_client.insert_data.call_args_list
+                  if call.args[0] == "Contributor"]
+        assert stored == ["alice", "carol"]
+        assert result["contributors"] == 2
+    
     def test_github_client_initialization(self):
         """Test GitHub client initialization."""
         with patch('ingestion.github_client.settings') as mock_settings:
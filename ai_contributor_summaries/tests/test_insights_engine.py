@@ -135,6 +135,14 @@ class TestInsightsEngine:
         assert "project1" in most_active
         assert most_active["project1"]["contributor_count"] == 2
     
+    def test_repository_patterns_polars_matches_pandas(self, sample_contributors, sample_repo_works):
+        """Test that the Polars and pandas repository aggregations agree."""
+        pytest.importorskip("polars")
+        polars_engine = InsightsEngine(sample_contributors, sample_repo_works, use_polars=True)
+        pandas_engine = InsightsEngine(sample_contributors, sample_repo_works, use_polars=False)
+        
+        assert polars_engine.analyze_repository_patterns() == pandas_engine.analyze_repository_patterns()
+    
     def test_segment_contributors(self, insights_engine):
         """Test contributor segmentation."""
         segments = insights_engine.segment_contributors()
@@ -206,6 +214,14 @@ class TestInsightsEngine:
         assert len(recommendations["team_composition"]) > 0
         assert len(recommendations["skill_development"]) > 0
     
+    def test_analyses_are_cached(self, insights_engine):
+        """Test that repeated analyses reuse the cached result."""
+        first = insights_engine.analyze_skill_distribution()
+        insights = insights_engine.generate_comprehensive_insights()
+        
+        assert insights["skill_analysis"] is first
+        assert insights_engine.analyze_skill_distribution() is first
+    
     def test_generate_contributor_report(self, insights_engine):
         """Test individual contributor report generation."""
         report = insights_engine.generate_contributor_report("alice")
@@ -190,7 +190,12 @@ class MockWeaviateClient:
             field = path[0] if isinstance(path, list) else path
             item_value = item.get(field)
             
-            if operator == 'Equal':
+            if operator == 'ContainsAny':
+                values = set(filter_dict.get('valueTextArray') or filter_dict.get('valueStringArray')
+                             or filter_dict.get('valueIntArray') or [])
+                item_values = item_value if isinstance(item_value, list) else [item_value]
+                return any(candidate in values for candidate in item_values)
+            elif operator == 'Equal':
                 return item_value == value
             elif operator == 'NotEqual':
                 return item_value != value
@@ -1,8 +1,10 @@
 """Weaviate client utilities for AI Contributor Summaries."""
 
 import logging
-from typing import Dict, List, Optional, Any
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Any, Callable, Iterator
 import weaviate
+from weaviate.util import check_batch_result
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -141,15 +143,17 @@ class WeaviateClient:
             logger.error(f"Failed to create schemas: {e}")
             raise
     
-    def insert_data(self, collection_name: str, data: Dict[str, Any]) -> str:
-        """Insert data into specified collection."""
+    def insert_data(self, collection_name: str, data: Dict[str, Any],
+                    vector: Optional[List[float]] = None) -> str:
+        """Insert data into specified collection, optionally with a precomputed vector."""
         try:
             # Clean data for Weaviate
             cleaned_data = self._clean_data_for_weaviate(data)
             
             result = self.client.data_object.create(
                 data_object=cleaned_data,
-                class_name=collection_name
+                class_name=collection_name,
+                vector=vector
             )
             
             logger.debug(f"Inserted data into {collection_name}: {result}")
@@ -159,6 +163,29 @@ class WeaviateClient:
             logger.error(f"Failed to insert data into {collection_name}: {e}")
             raise
     
+    @contextmanager
+    def batch(self, batch_size: int = 100, num_workers: int = 1,
+              callback: Optional[Callable[[List[Dict]], None]] = check_batch_result
+              ) -> Iterator[Callable[[str, Dict[str, Any]], None]]:
+        """Batch inserts through Weaviate's dynamic batch API.
+        
+        Yields an ``add(collection_name, data)`` function that cleans and queues objects
+        like ``insert_data``; queued objects are sent in bulk and flushed on exit.
+        With ``num_workers`` > 1, full batches are sent concurrently from a thread pool.
+        ``callback`` receives the per-object results of every sent batch.
+        """
+        self.client.batch.configure(batch_size=batch_size, dynamic=True,
+                                    num_workers=num_workers, callback=callback)
+        
+        with self.client.batch as batch:
+            def add(collection_name: str, data: Dict[str, Any]):
+                batch.add_data_object(
+                    data_object=self._clean_data_for_weaviate(data),
+                    class_name=collection_name
+                )
+            
+            yield add
+    
     def query_data(self, collection_name: str, where_filter: Optional[Dict] = None, 
                    limit: int = 100) -> List[Dict]:
         """Query data from specified collection."""
@@ -251,6 +278,33 @@ class WeaviateClient:
             logger.error(f"Failed to search similar items in {collection_name}: {e}")
             return []
     
+    def search_by_vector(self, collection_name: str, properties: List[str],
+                         vector: List[float], limit: int = 1) -> List[Dict]:
+        """Search for the nearest items to a precomputed vector."""
+        try:
+            result = (
+                self.client.query
+                .get(collection_name, properties)
+                .with_near_vector({"vector": vector})
+                .with_limit(limit)
+                .with_additional(['distance', 'id'])
+                .do()
+            )
+            
+            objects = []
+            if 'data' in result and 'Get' in result['data'] and collection_name in result['data']['Get']:
+                for obj in result['data']['Get'][collection_name] or []:
+                    if '_additional' in obj:
+                        obj['uuid'] = obj['_additional'].get('id', '')
+                        obj['distance'] = obj['_additional'].get('distance', 1.0)
+                    objects.append(obj)
+            
+            return objects
+            
+        except Exception as e:
+            logger.error(f"Failed to search by vector in {collection_name}: {e}")
+            return []
+    
     def _clean_data_for_weaviate(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Clean data for Weaviate insertion."""
         cleaned = {}
@@ -8,7 +8,7 @@ from datetime import datetime
 
 # Import our custom modules
 from enhanced_weaviate_schema import EnhancedWeaviateSchema
-from utils.weaviate_client import WeaviateClient
+from utils.weaviate_client import WeaviateClient, weaviate_client
 # from friendli_ai_profiler import FriendliAIProfiler
 
 # Configure logging
@@ -79,7 +79,7 @@ def generate_ai_profiles(client, friendli_token):
     
     try:
         # profiler = FriendliAIProfiler(friendli_token, client)
-        # profiles = profiler.process_top_contributors(limit=10)
+        # profiles = asyncio.run(profiler.process_top_contributors(limit=10))
         # profiler.save_profiles_to_weaviate(profiles)
         
         # Export profiles to JSON for backup
@@ -133,7 +133,7 @@ def main():
         
         # Initialize Weaviate client
         logger.info("Initializing Weaviate client...")
-        client = WeaviateClient()
+        client = weaviate_client or WeaviateClient()
         
         # Verify data if requested
         if args.verify_only: